@@ -1,13 +1,132 @@
 from click import Argument, Command
 import click
 from inspect import Signature
+from typing import Any, Dict, List, Optional, Tuple
 
 from CLI.cli_base import ICLI
 from framework import IFactory
-from CLI.commands import load, execute, setup, move, rotate, cut, patch, clear, mount
+from CLI.commands import (
+    load,
+    execute,
+    batch,
+    poses,
+    serve,
+    setup,
+    move,
+    rotate,
+    cut,
+    patch,
+    clear,
+    mount,
+    voxel,
+    outlier,
+    normals,
+)
 from CLI.data_transfer import Backbone, pass_backbone
+from managers import Profiler
 
-__all__ = ["CliFactory", "ICLI", "Cli"]
+__all__ = ["CliFactory", "ICLI", "Cli", "ChainGroup"]
+
+
+class ChainGroup(click.Group):
+
+    """
+    Group of chained commands, which accepts the options of a command after its arguments.
+
+    In chain mode click parses every command without interspersed arguments, so an option following
+    the arguments would be taken for the next command. The options of the command resolved are therefore
+    moved in front of its arguments, up to the point where the arguments of the command end.
+    """
+
+    def resolve_command(
+        self, ctx: click.Context, args: List[str]
+    ) -> Tuple[Optional[str], Optional[Command], List[str]]:
+        name, command, rest = super().resolve_command(ctx, args)
+
+        if command is not None:
+            rest = self.__hoist(ctx, command, rest)
+
+        return name, command, rest
+
+    def __hoist(
+        self, ctx: click.Context, command: Command, args: List[str]
+    ) -> List[str]:
+
+        """
+        Moves the options of the command (with their values) in front of its arguments.
+
+        :param ctx: Context of the group.
+        :param command: command resolved.
+        :param args: tokens following the name of the command.
+        :return: reordered tokens.
+        """
+
+        options: Dict[str, click.Option] = {
+            name: param
+            for param in command.params
+            if isinstance(param, click.Option)
+            for name in param.opts + param.secondary_opts
+        }
+        arguments = [param for param in command.params if isinstance(param, Argument)]
+        # None stands for the arguments consuming the rest of the line (nargs=-1).
+        limit = (
+            None
+            if any(param.nargs < 0 for param in arguments)
+            else sum(param.nargs for param in arguments)
+        )
+        required = sum(max(param.nargs, 0) for param in arguments if param.required)
+        commands = set(self.list_commands(ctx))
+
+        moved: List[str] = []
+        kept: List[str] = []
+        index = 0
+
+        while index < len(args):
+            token = args[index]
+
+            if token == "--":
+                break
+
+            option = options.get(token.split("=", 1)[0])
+
+            if option is not None:
+                size = (
+                    1
+                    if option.is_flag or option.count or "=" in token
+                    else 1 + option.nargs
+                )
+                moved.extend(args[index : index + size])
+                index += size
+                continue
+
+            if (
+                limit is not None
+                and len(kept) >= required
+                and (len(kept) >= limit or token in commands)
+            ):
+                break
+
+            kept.append(token)
+            index += 1
+
+        return moved + kept + args[index:]
+
+
+@click.pass_context
+def run_queue(ctx: click.Context, results: List[Any], **kwargs: Any) -> None:
+    """
+    Performs the operations of all the chained commands once the last of them is parsed,
+    so the source is loaded and the result is saved a single time per invocation.
+
+    :param ctx: Context from click library, needed for internal business logic and is passed automatically.
+    :param results: return values of the chained commands (unused).
+    :return: None.
+    """
+
+    try:
+        ctx.obj.run_queue()
+    except ValueError as error:
+        raise click.ClickException(str(error))
 
 
 class Cli(ICLI):
@@ -44,8 +163,24 @@ class Cli(ICLI):
         self.set_command(new_command)
 
     @staticmethod
-    @click.group()
+    # without no_args_is_help=False click prints the help and exits successfully when an unknown option is given
+    # after the arguments of a chained command, instead of reporting it.
+    @click.group(
+        cls=ChainGroup, chain=True, no_args_is_help=False, result_callback=run_queue
+    )
     @click.pass_context
+    @click.option(
+        "--profile",
+        type=click.Path(dir_okay=False),
+        default="",
+        help="save a JSON summary of plugin and file operation costs to",
+    )
+    @click.option(
+        "--trace",
+        type=click.Path(dir_okay=False),
+        default="",
+        help="save a Chrome trace_event file of plugin and file operations to",
+    )
     # @click.option(
     #     "--dest",
     #     type=click.Path(),
@@ -53,17 +188,38 @@ class Cli(ICLI):
     #     default="",
     #     help="to save the results to",
     # )
-    def entry_point(ctx: click.Context) -> None:
+    def entry_point(ctx: click.Context, profile: str, trace: str) -> None:
 
         # Backbone().add_to_config("src", path)
         # Backbone().add_to_config("dest", dest)
 
         ctx.obj = Backbone()
 
+        if profile or trace:
+            ctx.obj.profile_path = profile
+            ctx.obj.trace_path = trace
+            Profiler().enable()
+
 
 class CliFactory(IFactory):
     @staticmethod
     def create() -> Cli:
-        commands = [rotate]
+        commands = [
+            load,
+            execute,
+            batch,
+            poses,
+            serve,
+            setup,
+            move,
+            rotate,
+            cut,
+            patch,
+            clear,
+            mount,
+            voxel,
+            outlier,
+            normals,
+        ]
 
         return Cli(commands)
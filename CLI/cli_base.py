@@ -23,12 +23,14 @@ class ICLI(ABC):
 
     @staticmethod
     @abstractmethod
-    def entry_point(ctx: Context) -> None:
+    def entry_point(ctx: Context, profile: str, trace: str) -> None:
 
         """
         Entry point for CLI execution.
 
         :param ctx: Context from click library, needed for internal business logic and is passed automatically.
+        :param profile: |optional| path to save the JSON profiling summary to.
+        :param trace: |optional| path to save the Chrome trace_event profiling file to.
         :param path: Path to PointCloud data file.
         :param dest: |optional| path to save result to.
         :return: None.
@@ -1,8 +1,11 @@
-from .file_commands import load as load, execute as execute, setup
-from .operations import move, rotate, cut, patch, clear, mount
+from .file_commands import load as load, execute as execute, batch, poses, serve, setup
+from .operations import move, rotate, cut, patch, clear, mount, voxel, outlier, normals
 
 __all__ = [
     "load," "execute",
+    "batch",
+    "poses",
+    "serve",
     "setup",
     "move",
     "rotate",
@@ -10,4 +13,7 @@ __all__ = [
     "patch",
     "clear",
     "mount",
+    "voxel",
+    "outlier",
+    "normals",
 ]
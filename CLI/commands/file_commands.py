@@ -1,5 +1,24 @@
+from glob import glob
+from os import cpu_count
+from os.path import isdir, join
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
 import click
 
+from framework import lazy_import
+from managers import FileManager, StepCache
+from mvp import Model, Server, run_batch
+
+if TYPE_CHECKING:
+    import plugins.rotate as rotation
+else:
+    rotation = lazy_import("plugins.rotate")
+
+
+# poses are rotated in groups, so the stacked results of a group hold at most this many points.
+POSE_GROUP_POINTS = 50_000_000
+
 
 @click.command(short_help="Load source data")
 @click.pass_context
@@ -18,18 +37,216 @@ def load(ctx: click.Context, path: str) -> None:
 @click.command(short_help="Run with provided config")
 @click.pass_context
 @click.argument("path", type=click.Path(exists=True))
-def execute(ctx: click.Context, path: str) -> None:
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    required=False,
+    default=None,
+    help="stream the source to dest in chunks of this many points",
+)
+@click.option(
+    "--cache",
+    type=click.Path(file_okay=False),
+    required=False,
+    default=None,
+    help="directory to cache intermediate results in",
+)
+@click.option(
+    "--compact",
+    is_flag=True,
+    help="keep points as float32 offsets from a float64 origin and colours as uint8",
+)
+@click.option(
+    "--scale",
+    type=click.FloatRange(0.0, min_open=True),
+    required=False,
+    default=None,
+    help="keep points as int32 multiples of this step (implies --compact)",
+)
+def execute(
+    ctx: click.Context,
+    path: str,
+    chunk_size: Optional[int],
+    cache: Optional[str],
+    compact: bool,
+    scale: Optional[float],
+) -> None:
     """
     Run the program with parameters specified in configuration file provided by user.
 
     :param ctx: Context from click library, needed for internal business logic and is passed automatically.
     :param path: Path to the configuration file (.yml) provided by user.
+    :param chunk_size: |OPTIONAL| number of points to process at once, enables streaming from src to dest.
+    :param cache: |OPTIONAL| path to the directory to cache intermediate results in.
+    :param compact: boolean flag to keep the data in the compact store (see Model.set_compact).
+    :param scale: |OPTIONAL| quantization step of the compact store.
+    :return: None
+    """
+
+    ctx.obj.config_path = path
+    ctx.obj.load_config()
+
+    if compact or scale is not None:
+        Model().set_compact(True, scale)
+
+    if cache:
+        Model().set_cache(StepCache(cache))
+
+    try:
+        ctx.obj.execute(chunk_size)
+    except ValueError as error:
+        raise click.ClickException(str(error))
+
+
+@click.command(short_help="Run provided config on many files")
+@click.pass_context
+@click.argument("path", type=click.Path(exists=True))
+@click.argument("sources", type=str)
+@click.option(
+    "--output",
+    type=click.Path(file_okay=False),
+    required=False,
+    default="output",
+    help="directory to save the results and the manifest to",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    required=False,
+    default=cpu_count() or 1,
+    help="number of worker processes",
+)
+def batch(
+    ctx: click.Context, path: str, sources: str, output: str, workers: int
+) -> None:
+    """
+    Run the configuration file provided by user on every source point cloud in parallel.
+    Results are saved to the output directory along with a manifest (manifest.yml) describing every processed file.
+
+    :param ctx: Context from click library, needed for internal business logic and is passed automatically.
+    :param path: Path to the configuration file (.yml) provided by user.
+    :param sources: Directory with .ply files or a glob pattern matching the source files.
+    :param output: Path to the directory to save the results to.
+    :param workers: Number of worker processes.
     :return: None
     """
 
     ctx.obj.config_path = path
     ctx.obj.load_config()
 
+    files = sorted(glob(join(sources, "*.ply")) if isdir(sources) else glob(sources))
+
+    if not files:
+        raise click.ClickException(f"No files found at {sources}!")
+
+    manifest: List[Dict[str, Any]] = []
+
+    try:
+        for entry in run_batch(files, output, ctx.obj.get_config(), workers):
+            manifest.append(entry)
+
+            status = entry["error"] if "error" in entry else f"{entry['points']} points"
+            click.echo(f"{entry['src']}: {entry['seconds']:.3f} s, {status}")
+    except ValueError as error:
+        raise click.ClickException(str(error))
+
+    FileManager().write(join(output, "manifest.yml"), {"files": manifest})
+
+    failed = sum("error" in entry for entry in manifest)
+
+    if failed:
+        raise click.ClickException(f"{failed} of {len(manifest)} files failed!")
+
+
+@click.command(short_help="Rotate source data to many orientations")
+@click.pass_context
+@click.argument("path", type=click.Path(exists=True))
+@click.argument(
+    "mode", type=click.Choice(["Degree", "Radian"]), required=True, default="Degree"
+)
+@click.option(
+    "--pose",
+    "poses",
+    type=(float, float, float),
+    multiple=True,
+    required=True,
+    help="x, y and z angles of an orientation, may be repeated",
+)
+@click.option(
+    "--output",
+    type=click.Path(file_okay=False),
+    required=False,
+    default="output",
+    help="directory to save the results to",
+)
+def poses(
+    ctx: click.Context,
+    path: str,
+    mode: str,
+    poses: Tuple[Tuple[float, float, float], ...],
+    output: str,
+) -> None:
+    """
+    Rotate the point cloud to every given orientation. The source is read once and all the orientations
+    are applied in one pass (see plugins.rotate.rotate_poses). Results are saved to the output directory
+    as <source name>_<pose number>.ply.
+
+    :param ctx: Context from click library, needed for internal business logic and is passed automatically.
+    :param path: Path to file containing PointCloud Data.
+    :param mode: Angle units to use for rotation (Degree/Radian).
+    :param poses: x, y and z angles of every orientation.
+    :param output: Path to the directory to save the results to.
+    :return: None
+    """
+
+    files = FileManager()
+    cloud = files.read(path)
+    name = Path(path).stem
+
+    if not files.path_exists(output):
+        files.create_path(output)
+
+    group = max(POSE_GROUP_POINTS // max(len(cloud.points), 1), 1)
+
+    for start in range(0, len(poses), group):
+        results = rotation.rotate_poses(cloud, mode, poses[start : start + group])
+
+        for index, result in enumerate(results, start):
+            files.write(join(output, f"{name}_{index}.ply"), result)
+
+    click.echo(f"{len(poses)} orientations saved to {output}")
+
+
+@click.command(short_help="Serve jobs over a Unix socket")
+@click.argument("socket", type=click.Path(dir_okay=False))
+@click.option(
+    "--memory",
+    type=click.IntRange(min=1),
+    required=False,
+    default=4096,
+    help="memory budget of the source clouds kept resident, in MiB",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    required=False,
+    default=cpu_count() or 1,
+    help="number of jobs run at once",
+)
+def serve(socket: str, memory: int, workers: int) -> None:
+    """
+    Run as a long-running server, accepting JSON jobs of the configuration file shape on the Unix socket.
+    Open3D, the plugins and the recently used source clouds stay in memory between the jobs (see mvp.Server).
+
+    :param socket: Path to the Unix socket to listen on.
+    :param memory: Memory budget of the cached source clouds in MiB.
+    :param workers: Number of jobs run at once.
+    :return: None
+    """
+
+    click.echo(f"Listening on {socket}")
+    Server(socket, memory * 1024**2, workers).serve()
+
 
 @click.command(short_help="Create config template")
 @click.pass_context
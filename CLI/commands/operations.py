@@ -1,7 +1,5 @@
 import click
 
-from mvp import Model
-
 
 @click.command("move", short_help="Shift points along x, y and z axes")
 @click.pass_context
@@ -23,25 +21,17 @@ def move(ctx: click.Context, x: float, y: float, z: float) -> None:
 
 @click.command("rotate", short_help="Rotate points along x, y and z axes")
 @click.pass_context
-@click.argument(
-    "path",
-    type=click.Path(exists=True),
-    required=True,
-)
 @click.argument(
     "mode", type=click.Choice(["Degree", "Radian"]), required=True, default="Degree"
 )
 @click.argument("x", type=float, required=True, default=0.0)
 @click.argument("y", type=float, required=True, default=0.0)
 @click.argument("z", type=float, required=True, default=0.0)
-def rotate(
-    ctx: click.Context, path: str, mode: str, x: float, y: float, z: float
-) -> None:
+def rotate(ctx: click.Context, mode: str, x: float, y: float, z: float) -> None:
     """
     Rotate the point cloud by given values in Degrees/Radians along respective axes (x, y and z).
 
     :param ctx: Context from click library, needed for internal business logic and is passed automatically.\n
-    :param path: Path to file containing PointCloud Data.
     :param mode: Angle units to use for rotation (Degree/Radian).\n
     :param x: Value to rotate points by along the X-axis.\n
     :param y: Value to rotate points by along the Y-axis.\n
@@ -49,9 +39,6 @@ def rotate(
     :return: None.\n
     """
 
-    ctx.obj.add_to_config("src", path)
-    Model().load_data(path)
-
     ctx.obj.enqueue("rotate", {"mode": mode, "x": x, "y": y, "z": z})
 
 
@@ -61,7 +48,16 @@ def rotate(
 @click.option("--ur", is_flag=True)
 @click.option("--ll", is_flag=True)
 @click.option("--lr", is_flag=True)
-def cut(ctx: click.Context, ul: bool, ur: bool, ll: bool, lr: bool) -> None:
+@click.option(
+    "--size",
+    type=click.FloatRange(0.0, 0.5, min_open=True),
+    default=0.5,
+    show_default=True,
+    help="corner size as a fraction of the cloud extent",
+)
+def cut(
+    ctx: click.Context, ul: bool, ur: bool, ll: bool, lr: bool, size: float
+) -> None:
     """
     Remove points located at the corners of the point cloud.
 
@@ -70,13 +66,11 @@ def cut(ctx: click.Context, ul: bool, ur: bool, ll: bool, lr: bool) -> None:
     :param ur: boolean flag determining if points in the UPPER-RIGHT corner should be removed.
     :param ll: boolean flag determining if points in the LOWER-LEFT corner should be removed.
     :param lr: boolean flag determining if points in the LOWER-RIGHT corner should be removed.
+    :param size: corner size as a fraction of the point cloud extent along each axis.
     :return: None.
     """
 
-    ctx.obj.enqueue(
-        "cut",
-        {"upper-left": ul, "upper-right": ur, "lower-left": ll, "lower-right": lr},
-    )
+    ctx.obj.enqueue("cut", {"ul": ul, "ur": ur, "ll": ll, "lr": lr, "size": size})
 
 
 @click.command("patch", short_help='Patch "holes" in point cloud')
@@ -113,16 +107,105 @@ def clear(ctx: click.Context, height: float, above: bool, below: bool) -> None:
     ctx.obj.enqueue("clear", {"height": height, "above": above, "below": below})
 
 
-@click.command("mount", short_help="Georeference given image")
+@click.command("mount", short_help="Colour points from given GeoTIFF image")
+@click.pass_context
+@click.argument("picture_path", type=click.Path(exists=True), default="")
+def mount(ctx: click.Context, picture_path: str) -> None:
+    """
+    Colour the points of the source point cloud from the given georeferenced (GeoTIFF) image.
+
+    :param ctx: Context from click library, needed for internal business logic and is passed automatically.
+    :param picture_path: Path to the GeoTIFF image to embed.
+    :return: None.
+    """
+
+    ctx.obj.enqueue("mount", {"picture_path": picture_path})
+
+
+@click.command("voxel", short_help="Downsample points to one per voxel")
+@click.pass_context
+@click.argument("size", type=click.FloatRange(0.0, min_open=True), required=True)
+@click.option(
+    "--mode",
+    type=click.Choice(["centroid", "first"]),
+    default="centroid",
+    show_default=True,
+    help="reduce the points of a voxel to their centroid or to the first of them",
+)
+def voxel(ctx: click.Context, size: float, mode: str) -> None:
+    """
+    Downsample the point cloud with a voxel grid, keeping a single point per voxel.
+
+    :param ctx: Context from click library, needed for internal business logic and is passed automatically.
+    :param size: edge length of the voxels.
+    :param mode: reduction of the points of a voxel (centroid/first).
+    :return: None.
+    """
+
+    ctx.obj.enqueue("voxel", {"size": size, "mode": mode})
+
+
+@click.command("outlier", short_help="Remove noise points")
+@click.pass_context
+@click.option(
+    "--mode",
+    type=click.Choice(["statistical", "radius"]),
+    default="statistical",
+    show_default=True,
+    help="remove points far from their neighbours or with few neighbours around",
+)
+@click.option(
+    "--neighbours",
+    type=click.IntRange(min=1),
+    default=20,
+    show_default=True,
+    help="number of the nearest neighbours (the minimal one in radius mode)",
+)
+@click.option(
+    "--ratio",
+    type=click.FloatRange(0.0),
+    default=2.0,
+    show_default=True,
+    help="standard deviations of the neighbour distance to keep (statistical mode)",
+)
+@click.option(
+    "--radius",
+    type=click.FloatRange(0.0, min_open=True),
+    default=1.0,
+    show_default=True,
+    help="radius of the neighbourhood (radius mode)",
+)
+def outlier(
+    ctx: click.Context, mode: str, neighbours: int, ratio: float, radius: float
+) -> None:
+    """
+    Remove the outlier points: the ones far from their nearest neighbours (statistical mode)
+    or having few neighbours within the radius (radius mode).
+
+    :param ctx: Context from click library, needed for internal business logic and is passed automatically.
+    :param mode: outlier criterion (statistical/radius).
+    :param neighbours: number of the nearest neighbours to consider.
+    :param ratio: number of standard deviations above the average neighbour distance to keep.
+    :param radius: radius of the neighbourhood.
+    :return: None.
+    """
+
+    ctx.obj.enqueue(
+        "outlier",
+        {"mode": mode, "neighbours": neighbours, "ratio": ratio, "radius": radius},
+    )
+
+
+@click.command("normals", short_help="Estimate normals of points")
 @click.pass_context
-@click.argument("path", type=click.Path(exists=True), default="")
-def mount(ctx: click.Context, path: str) -> None:
+@click.argument("neighbours", type=click.IntRange(min=2), required=True, default=16)
+def normals(ctx: click.Context, neighbours: int) -> None:
     """
-    Use the source point cloud to embed geographic information into the given (GeoTIFF) image.
+    Estimate the normals of the points from their nearest neighbours.
 
     :param ctx: Context from click library, needed for internal business logic and is passed automatically.
-    :param path: Path to the GeoTIFF image to embed.
+    :param neighbours: number of the nearest neighbours to fit a plane to.
     :return: None.
     """
 
-    ctx.obj.enqueue("mount", {"path": path})
+    ctx.obj.enqueue("normals", {"neighbours": neighbours})
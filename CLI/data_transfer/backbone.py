@@ -9,8 +9,8 @@ from typing import (
 from functools import wraps
 from os.path import join
 
-from managers import FileManager
-from mvp import Model
+from managers import FileManager, Profiler
+from mvp import Model, Planner, Step
 from .backbone_base import *
 from click import Command
 
@@ -24,7 +24,8 @@ class Backbone(IBackbone):
     Business object class to store and process CLI data. Main objectives: configuration file handling and cli-command
     meta-data storage.
 
-    Utilizes Singleton pattern, so there can only be one instance of Backbone class at any time.
+    Utilizes Singleton pattern, so there can only be one instance of Backbone class at any time per Session
+    (the process-global one outside of sessions).
     """
 
     def __init__(self, requirements: Optional[List[str]] = None):
@@ -61,8 +62,14 @@ class Backbone(IBackbone):
         self.__default_config_path = join(".", "config", "config.yml")
         self.config_path = ""
 
+        self.profile_path = ""
+        self.trace_path = ""
+
         self.commands: dict[str, Command] = {}
 
+        # operations of the chained commands, performed all at once after the last of them (see run_queue).
+        self.__queue: List[Step] = []
+
         self.__file = FileManager()
 
     @staticmethod
@@ -114,6 +121,8 @@ class Backbone(IBackbone):
         if key not in self.__config:
             raise ValueError(f"{key} not found in config!")
 
+        return self.__config[key]
+
     def enqueue(self, operation: str, parameters: Dict[str, Any]) -> None:
 
         if operation not in self.commands:
@@ -128,7 +137,36 @@ class Backbone(IBackbone):
 
         self.add_to_config(number, insert)
 
-        Model().task(operation, FileManager().read(self.__config["src"]), **parameters)
+        self.__queue.append(Step(operation, dict(parameters)))
+
+    def run_queue(self) -> None:
+        if not self.__queue:
+            return
+
+        steps, self.__queue = self.__queue, []
+
+        planner = Planner(Model().operation_info)
+        planner.validate(steps)
+
+        Model().load_data(self.__config["src"])
+        Model().execute_tasks(steps)
+
+    def execute(self, chunk_size: Optional[int] = None) -> None:
+        planner = Planner(Model().operation_info)
+
+        steps = planner.plan(self.__config)
+        planner.validate(steps)
+
+        if chunk_size:
+            if not self.__config["dest"]:
+                raise ValueError("Destination is required to process data in chunks!")
+
+            Model().stream_tasks(
+                self.__config["src"], self.__config["dest"], steps, chunk_size
+            )
+        else:
+            Model().load_data(self.__config["src"])
+            Model().execute_tasks(steps)
 
     def enqueue_default(self, operation: str) -> None:
 
@@ -183,6 +221,16 @@ class Backbone(IBackbone):
 
         self.__file.write(path=path, data=self.__config)
 
+    def dump_profile(self) -> None:
+        profiler = Profiler()
+        profiler.disable()
+
+        if self.profile_path:
+            self.__file.write(self.profile_path, profiler.summary(), "json")
+
+        if self.trace_path:
+            self.__file.write(self.trace_path, profiler.trace(), "json")
+
 
 # TODO сделать более универсальную анннотацию после стабилизации поддержки TypeVarTuple и TypeVarDict
 def pass_backbone(
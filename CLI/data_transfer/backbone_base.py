@@ -4,12 +4,12 @@ from abc import abstractmethod, ABC
 from framework import *
 
 
-class IBackbone(ABC, metaclass=EmbedSingleton):
+class IBackbone(ABC, metaclass=SessionSingleton):
 
     """
     CLI backbone interface.
     Declares the bare minimum of business logic needed from a business object for command-line interface.
-    Enforces the Singleton pattern on derived classes.
+    Enforces the Singleton pattern on derived classes, with an instance per Session (see framework.Session).
     """
 
     @abstractmethod
@@ -62,6 +62,7 @@ class IBackbone(ABC, metaclass=EmbedSingleton):
 
         """
         A standard way to save callback results of CLI commands. Accepts input only from registered commands.
+        The operation is added to the meta-config and queued, it is performed by RUN_QUEUE method.
 
         :raises: ValueError : if there is no corresponding command in the COMMANDS dictionary of Backbone class.
 
@@ -70,6 +71,32 @@ class IBackbone(ABC, metaclass=EmbedSingleton):
         :return: None.
         """
 
+    @abstractmethod
+    def run_queue(self) -> None:
+
+        """
+        Performs the queued operations on the source data at once: the source is loaded a single time
+        and the intermediate results stay in memory. The whole sequence is validated before the data is read.
+
+        :raises: ValueError : if any of the operations is not supported or has invalid parameters.
+
+        :return: None.
+        """
+
+    @abstractmethod
+    def execute(self, chunk_size: Optional[int] = None) -> None:
+
+        """
+        Runs the operations from the meta-config dictionary on the source data. The whole sequence is validated
+        against the signatures of supported operations before the data is read.
+
+        :raises: ValueError : if any of the operations is not supported or has invalid parameters.
+
+        :param chunk_size: |OPTIONAL| number of points to process at once. If given, the source is streamed
+        to the destination in chunks instead of being loaded as a whole.
+        :return: None.
+        """
+
     @abstractmethod
     def enqueue_default(self, operation: str) -> None:
 
@@ -104,3 +131,13 @@ class IBackbone(ABC, metaclass=EmbedSingleton):
         :param path: |OPTIONAL| path to save the configuration file to.
         :return: None.
         """
+
+    @abstractmethod
+    def dump_profile(self) -> None:
+
+        """
+        Saves the profiling results (see managers.Profiler) as a JSON summary and/or a Chrome trace_event file
+        to the locations given by profile_path and trace_path. Does nothing if neither is set.
+
+        :return: None.
+        """
@@ -16,7 +16,9 @@ def main() -> None:
             raise
 
     Backbone().dump_config()
-    Model().save_data("")
+    Model().save_data(Backbone().get_from_config("dest"))
+    Model().flush()
+    Backbone().dump_profile()
 
 
 if __name__ == "__main__":
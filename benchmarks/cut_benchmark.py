@@ -0,0 +1,75 @@
+"""
+Benchmark of the cut plugin against the naive approach, which removes the corners one by one.
+
+Run from the repository root:
+    python -m benchmarks.cut_benchmark --points 10000000
+"""
+
+from time import perf_counter
+from typing import Callable, Dict
+
+import click
+import numpy as np
+import open3d as o3d  # type: ignore
+
+from plugins.cut import cut
+from tests.conftest import random_cloud_func
+
+
+def cut_per_corner(
+    data: o3d.geometry.PointCloud, size: float
+) -> o3d.geometry.PointCloud:
+
+    """
+    Reference implementation: one crop pass over the whole cloud for every corner.
+    """
+
+    bounds = data.get_axis_aligned_bounding_box()
+    low, high = bounds.get_min_bound(), bounds.get_max_bound()
+    extent = (high - low) * size
+
+    for x, y in ((0, 0), (0, 1), (1, 0), (1, 1)):
+        corner_low = np.array(
+            [
+                low[0] if x == 0 else high[0] - extent[0],
+                low[1] if y == 0 else high[1] - extent[1],
+                low[2],
+            ]
+        )
+        box = o3d.geometry.AxisAlignedBoundingBox(
+            corner_low, corner_low + [extent[0], extent[1], high[2] - low[2]]
+        )
+        data = data.select_by_index(
+            box.get_point_indices_within_bounding_box(data.points), invert=True
+        )
+
+    return data
+
+
+@click.command()
+@click.option("--points", type=int, default=10_000_000, show_default=True)
+@click.option("--size", type=float, default=0.25, show_default=True)
+@click.option("--repeat", type=int, default=3, show_default=True)
+def main(points: int, size: float, repeat: int) -> None:
+    cloud = random_cloud_func(points, 0, 1000, colors=True)
+
+    runs: Dict[str, Callable[[], o3d.geometry.PointCloud]] = {
+        "cut (single pass)": lambda: cut(cloud, True, True, True, True, size),
+        "per-corner crop": lambda: cut_per_corner(cloud, size),
+    }
+
+    for name, run in runs.items():
+        timings = []
+
+        for _ in range(repeat):
+            start = perf_counter()
+            result = run()
+            timings.append(perf_counter() - start)
+
+        click.echo(
+            f"{name}: best {min(timings):.3f} s, {len(result.points)} of {points} points kept"
+        )
+
+
+if __name__ == "__main__":
+    main()
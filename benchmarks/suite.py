@@ -0,0 +1,274 @@
+"""
+Benchmark suite of the hot paths on synthetic point clouds (with colours and normals).
+
+Every case reports its throughput (points/s) and peak memory growth. Results are compared with the baselines
+stored in a JSON file, and the run fails if the throughput of any case drops by more than the threshold.
+The run also fails if the baseline file is missing or lacks any of the cases measured, so a regression
+can not pass unnoticed for the lack of a baseline.
+
+Baselines depend on the machine, so they are not committed. Record them on the machine running the suite
+(on the code before the change to evaluate), then compare:
+    python -m benchmarks.suite --sizes 1000000,10000000 --update    # store the results as the baselines
+    python -m benchmarks.suite --sizes 1000000,10000000             # compare with the baselines
+
+--update merges the results into the existing baselines, so the sizes may be recorded separately.
+Run from the repository root.
+"""
+
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Event, Thread
+from time import perf_counter
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import click
+import numpy as np
+import open3d as o3d  # type: ignore
+
+from CLI.data_transfer import Backbone
+from managers import FileManager
+from plugins.clear import clear
+from plugins.cut import cut
+from plugins.rotate import rotate
+from tests.conftest import random_cloud_func
+
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def resident_memory() -> int:
+
+    """
+    Returns the current resident set size of the process in bytes (Linux only).
+    """
+
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * PAGE_SIZE
+
+
+class PeakMemory:
+
+    """
+    Context manager sampling the resident memory in a background thread, to find its peak growth inside the block.
+    Unlike tracemalloc, it also sees the allocations made by Open3D.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.__interval = interval
+        self.__stop = Event()
+        self.__thread = Thread(target=self.__sample, daemon=True)
+        self.__start = 0
+        self.__peak = 0
+
+    @property
+    def growth(self) -> int:
+        return max(self.__peak - self.__start, 0)
+
+    def __sample(self) -> None:
+        while not self.__stop.wait(self.__interval):
+            self.__peak = max(self.__peak, resident_memory())
+
+    def __enter__(self) -> "PeakMemory":
+        self.__start = self.__peak = resident_memory()
+        self.__thread.start()
+
+        return self
+
+    def __exit__(
+        self,
+        kind: Optional[Type[BaseException]],
+        error: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.__stop.set()
+        self.__thread.join()
+        self.__peak = max(self.__peak, resident_memory())
+
+
+def terrain_cloud(points: int) -> o3d.geometry.PointCloud:
+
+    """
+    Generates a terrain-like cloud: a smooth surface with noise, random unit normals and random colours.
+    """
+
+    generator = np.random.default_rng(0)
+    plane = generator.uniform(0, 1000, (points, 2))
+    heights = 20 * np.sin(plane[:, 0] / 100) * np.cos(plane[:, 1] / 150)
+    heights += generator.normal(0, 0.5, points)
+
+    return random_cloud_func(
+        np.column_stack((plane, heights)), normals=True, colors=True
+    )
+
+
+def make_cases(
+    cloud: o3d.geometry.PointCloud, directory: Path
+) -> Dict[str, Tuple[Callable[[], Any], Callable[[], Any]]]:
+
+    """
+    Builds the benchmark cases for the given cloud: case name mapped to a setup function (not measured)
+    and the measured function.
+    """
+
+    source = str(directory / "source.ply")
+    FileManager().write(source, cloud)
+
+    # operations are keyed by numbers, as in the YAML configs.
+    config: Dict[Any, Any] = {
+        "src": source,
+        "dest": "",
+        "operations": [1, 2, 3],
+        1: {"type": "rotate", "mode": "Degree", "x": 0.0, "y": 0.0, "z": 30.0},
+        2: {"type": "move", "x": 1.0, "y": 2.0, "z": 3.0},
+        3: {"type": "clear", "height": 10.0, "above": True, "below": False},
+    }
+    Backbone().set_config(config)
+
+    copies: List[o3d.geometry.PointCloud] = []
+
+    def fresh_copy() -> None:
+        copies[:] = [o3d.geometry.PointCloud(cloud)]
+
+    return {
+        "ply_write": (
+            lambda: None,
+            lambda: FileManager().write(str(directory / "output.ply"), cloud),
+        ),
+        "ply_read": (lambda: None, lambda: FileManager().read(source)),
+        "rotate": (fresh_copy, lambda: rotate(copies[0], "Degree", 10.0, 20.0, 30.0)),
+        "clear": (lambda: None, lambda: clear(cloud, 0.0, True, False)),
+        "cut": (lambda: None, lambda: cut(cloud, True, False, False, True, 0.25)),
+        "pipeline": (lambda: None, lambda: Backbone().execute()),
+    }
+
+
+def run_case(
+    setup: Callable[[], Any], function: Callable[[], Any], repeat: int
+) -> Tuple[float, int]:
+
+    """
+    Runs the case several times.
+
+    :return: best wall time in seconds and the largest peak memory growth in bytes.
+    """
+
+    timings, memory = [], []
+
+    for _ in range(repeat):
+        setup()
+
+        with PeakMemory() as peak:
+            start = perf_counter()
+            function()
+            timings.append(perf_counter() - start)
+
+        memory.append(peak.growth)
+
+    return min(timings), max(memory)
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baselines: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[str]:
+
+    """
+    Finds the cases, whose throughput dropped below the baseline by more than the threshold,
+    and the cases without a baseline.
+
+    :param results: measured results.
+    :param baselines: stored baselines.
+    :param threshold: allowed drop in percents.
+    :return: descriptions of the regressions.
+    """
+
+    regressions = []
+
+    for name, result in results.items():
+        if name not in baselines:
+            regressions.append(f"{name}: no baseline (record it with --update)")
+            continue
+
+        expected = baselines[name]["points_per_second"]
+        drop = 100 * (1 - result["points_per_second"] / expected)
+
+        if drop > threshold:
+            regressions.append(
+                f"{name}: {result['points_per_second']:,.0f} points/s is {drop:.1f}% below the baseline "
+                f"({expected:,.0f} points/s)"
+            )
+
+    return regressions
+
+
+@click.command()
+@click.option(
+    "--sizes",
+    default="1000000,10000000,50000000",
+    show_default=True,
+    help="comma-separated numbers of points of the synthetic clouds",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(dir_okay=False),
+    default=str(Path(__file__).parent / "baseline.json"),
+    show_default=True,
+    help="JSON file with the baselines",
+)
+@click.option(
+    "--threshold",
+    type=float,
+    default=20.0,
+    show_default=True,
+    help="allowed throughput drop in percents",
+)
+@click.option("--repeat", type=int, default=3, show_default=True)
+@click.option("--update", is_flag=True, help="store the results as the new baselines")
+def main(
+    sizes: str, baseline: str, threshold: float, repeat: int, update: bool
+) -> None:
+    files = FileManager()
+
+    if os.path.exists(baseline):
+        baselines = files.read(baseline)
+    elif update:
+        baselines = {}
+    else:
+        raise click.ClickException(
+            f"Baseline file {baseline} does not exist, record the baselines with --update first"
+        )
+
+    results: Dict[str, Dict[str, float]] = {}
+
+    for points in (int(size) for size in sizes.split(",")):
+        cloud = terrain_cloud(points)
+
+        with TemporaryDirectory() as directory:
+            for case, (setup, function) in make_cases(cloud, Path(directory)).items():
+                seconds, memory = run_case(setup, function, repeat)
+                name = f"{case}@{points}"
+                results[name] = {
+                    "points_per_second": points / seconds,
+                    "peak_memory_bytes": memory,
+                }
+                click.echo(
+                    f"{name:>24}: {seconds:8.3f} s, {points / seconds:14,.0f} points/s, "
+                    f"peak memory +{memory / 1024 ** 2:,.0f} MiB"
+                )
+
+    if update:
+        files.write(baseline, {**baselines, **results})
+        click.echo(f"Baselines saved to {baseline}")
+        return
+
+    regressions = compare(results, baselines, threshold)
+
+    if regressions:
+        raise click.ClickException("Benchmark check failed:\n" + "\n".join(regressions))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,15 @@
 from .abstract_factory import IFactory
 from .singleton import EmbedSingleton
+from .session import Session, SessionSingleton
 from .command import ICommand, ITarget
+from .lazy import lazy_import
 
-__all__ = ["IFactory", "EmbedSingleton", "ICommand", "ITarget"]
+__all__ = [
+    "IFactory",
+    "EmbedSingleton",
+    "Session",
+    "SessionSingleton",
+    "ICommand",
+    "ITarget",
+    "lazy_import",
+]
@@ -0,0 +1,37 @@
+from importlib import import_module
+from sys import modules
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+
+    """
+    Module placeholder, which imports the actual module on the first attribute access.
+    Allows heavy dependencies (Open3D, numpy) to be imported only when they are actually used.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__module: ModuleType | None = None
+
+    def __getattr__(self, attribute: str) -> Any:
+        if self.__module is None:
+            self.__module = import_module(self.__name__)
+
+        return getattr(self.__module, attribute)
+
+
+def lazy_import(name: str) -> ModuleType:
+
+    """
+    Returns the module, if it is already imported, or a LazyModule placeholder for it otherwise.
+
+    :param name: full name of the module.
+    :return: module or its placeholder.
+    """
+
+    if name in modules:
+        return modules[name]
+
+    return LazyModule(name)
@@ -0,0 +1,133 @@
+from contextvars import ContextVar, Token
+from threading import Lock
+from types import TracebackType
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+from .singleton import EmbedSingleton
+
+
+SessionCallableReturnType = TypeVar("SessionCallableReturnType")
+
+# sessions entered in the current context (thread or asyncio task) with the tokens restoring the previous state,
+# the innermost one is the last.
+_sessions: ContextVar[Tuple[Tuple["Session", Token[Any]], ...]] = ContextVar(
+    "sessions", default=()
+)
+
+
+class Session:
+
+    """
+    Scope of the session singletons (see SessionSingleton). Every session owns its own instances of them,
+    so independent pipelines may run concurrently in one process, each in its own session.
+
+    Sessions are entered per context: a session entered in a thread or an asyncio task doesn't affect
+    the others, and the same session may be entered in several of them at once. Sessions must be exited
+    in the reverse order of entering, in the context they were entered in.
+
+    Once the session is exited everywhere it was entered, its instances having a close() method are closed,
+    so the resources they hold (e.g. background threads) are released.
+    """
+
+    def __init__(self) -> None:
+        self.instances: Dict[type, Any] = {}
+        self.__active = 0
+        self.__lock = Lock()
+
+    def __enter__(self) -> "Session":
+        with self.__lock:
+            self.__active += 1
+
+        # the entry keeps the token restoring the stack as it was before, so exiting resets the stack
+        # of the context instead of editing it.
+        sessions = _sessions.get()
+        token = _sessions.set(sessions)
+        _sessions.set(sessions + ((self, token),))
+
+        return self
+
+    def __exit__(
+        self,
+        kind: Optional[Type[BaseException]],
+        error: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        sessions = _sessions.get()
+
+        if not sessions or sessions[-1][0] is not self:
+            raise RuntimeError(
+                "Sessions must be exited in the reverse order of entering!"
+            )
+
+        _sessions.reset(sessions[-1][1])
+
+        with self.__lock:
+            self.__active -= 1
+            closing = self.__active == 0
+
+        if closing:
+            self.close()
+
+    def close(self) -> None:
+
+        """
+        Closes the instances of the session, which have a close() method. The instances are kept,
+        so the session may be entered again.
+
+        :return: None
+        """
+
+        for instance in list(self.instances.values()):
+            close = getattr(instance, "close", None)
+
+            if callable(close):
+                close()
+
+    @staticmethod
+    def current() -> Optional["Session"]:
+
+        """
+        Returns the innermost session entered in the current context.
+
+        :return: Session or None, if no session is entered.
+        """
+
+        sessions = _sessions.get()
+
+        return sessions[-1][0] if sessions else None
+
+    def run(
+        self,
+        function: Callable[..., SessionCallableReturnType],
+        *args: Any,
+        **kwargs: Any
+    ) -> SessionCallableReturnType:
+
+        """
+        Calls the function inside the session. Handy for submitting work to executors, as their threads
+        don't inherit the context of the caller.
+
+        :param function: function to call.
+        :param args: positional arguments of the function.
+        :param kwargs: key-value arguments of the function.
+        :return: result of the function.
+        """
+
+        with self:
+            return function(*args, **kwargs)
+
+
+class SessionSingleton(EmbedSingleton):
+
+    """
+    Singleton metaclass, whose instances belong to the current Session. Outside any session
+    there is a single process-global instance, as with EmbedSingleton.
+    """
+
+    def _scope(cls) -> Dict[type, Any]:
+        session = Session.current()
+
+        if session is None:
+            return cls._instances
+
+        return session.instances
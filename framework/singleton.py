@@ -1,4 +1,5 @@
 from abc import ABCMeta
+from threading import RLock
 from typing import Any
 
 
@@ -9,9 +10,19 @@ class SingletonMeta(type):
     Provides a simple logic which implements and enforces the aforementioned pattern for any child class.
 
     _instances - is a dictionary to store any singleton class in use.
+    _lock - guards the creation of instances, so concurrent first calls share a single instance.
+    It is reentrant, as constructors of singletons call other singletons.
     """
 
     _instances: dict[type, "SingletonMeta"] = {}
+    _lock = RLock()
+
+    def _scope(cls) -> dict[type, Any]:
+        """
+        Returns the dictionary to store the instance of the class in.
+        """
+
+        return cls._instances
 
     def __call__(cls, *args: list[Any], **kwargs: dict[str, Any]) -> Any:
         """
@@ -22,11 +33,18 @@ class SingletonMeta(type):
         the returned instance.
         """
 
-        if cls not in cls._instances:
-            instance = super().__call__(*args, **kwargs)
-            cls._instances[cls] = instance
+        instances = cls._scope()
+        instance = instances.get(cls)
+
+        # the lock is taken only while the instance is missing, so the usual calls stay cheap.
+        if instance is None:
+            with SingletonMeta._lock:
+                if cls not in instances:
+                    instances[cls] = super().__call__(*args, **kwargs)
+
+                instance = instances[cls]
 
-        return cls._instances[cls]
+        return instance
 
 
 class EmbedSingleton(ABCMeta, SingletonMeta):
@@ -1,4 +1,22 @@
 from .file_manager import *
 from .plugin_manager import *
+from .cache_manager import *
+from .profile_manager import *
+from .index_manager import *
 
-__all__ = ["FileManager", "PluginRegistry", "PluginInfo"]
+__all__ = [
+    "FileManager",
+    "PlyVertices",
+    "PlyWriter",
+    "CompactCloud",
+    "LasPoints",
+    "LasWriter",
+    "TiffImage",
+    "AsyncWriter",
+    "PluginRegistry",
+    "PluginInfo",
+    "StepCache",
+    "CloudCache",
+    "Profiler",
+    "NeighbourIndex",
+]
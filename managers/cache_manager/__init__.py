@@ -0,0 +1,5 @@
+from .cache_base import ICache
+from .cache import StepCache
+from .memory_cache import CloudCache
+
+__all__ = ["ICache", "StepCache", "CloudCache"]
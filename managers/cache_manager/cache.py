@@ -0,0 +1,110 @@
+from hashlib import sha256
+from json import dumps
+from os import utime
+from os.path import join
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from managers.file_manager import CompactCloud, FileManager, PlyVertices
+from .cache_base import ICache
+
+
+class StepCache(ICache):
+
+    """
+    On-disk implementation of ICache interface. Every result is stored as a binary .ply file named by its key.
+    File modification time is used as the last access time for LRU eviction.
+
+    Results are written atomically, so an interrupted run never leaves a truncated result behind. Colours of
+    PointClouds are stored at full precision (see PlyVertices.from_point_cloud), so a run resumed from the cache
+    gives the same result as a fresh one. Stored results are read back as PointClouds.
+    """
+
+    def __init__(
+        self, directory: Optional[str] = None, capacity: int = 4 * 1024**3
+    ) -> None:
+
+        """
+        Constructor method for StepCache class.
+
+        :param directory: |OPTIONAL| directory to store results in.
+        :param capacity: maximum total size of stored results in bytes.
+        """
+
+        if directory is None:
+            directory = join(".", ".cache")
+
+        self.__directory = Path(directory)
+        self.__capacity = capacity
+        self.__sources: Dict[Tuple[str, int, int], str] = {}
+
+        self.__file = FileManager()
+
+    def __path(self, key: str) -> Path:
+        return self.__directory / f"{key}.ply"
+
+    def source_key(self, path: str) -> str:
+        version = self.__file.file_version(path)
+
+        if version not in self.__sources:
+            digest = sha256()
+
+            with open(path, "rb") as source:
+                while chunk := source.read(1 << 24):
+                    digest.update(chunk)
+
+            self.__sources[version] = digest.hexdigest()
+
+        return self.__sources[version]
+
+    def step_key(self, parent: str, operation: str, parameters: Dict[str, Any]) -> str:
+        description = dumps(parameters, sort_keys=True, default=str)
+
+        return sha256(f"{parent}:{operation}:{description}".encode()).hexdigest()
+
+    def contains(self, key: str) -> bool:
+        return self.__path(key).exists()
+
+    def load(self, key: str) -> Any:
+        if not self.contains(key):
+            raise KeyError(f"{key} was not found in the cache!")
+
+        path = self.__path(key)
+        utime(path)
+
+        vertices: PlyVertices = self.__file.read(str(path), "ply_memmap")
+
+        return vertices.to_point_cloud()
+
+    def store(self, key: str, data: Any) -> None:
+        if isinstance(data, CompactCloud):
+            data = data.to_vertices()
+        elif not isinstance(data, PlyVertices):
+            data = PlyVertices.from_point_cloud(data, exact=True)
+
+        self.__file.write_atomic(str(self.__path(key)), data, "ply_memmap")
+
+        self.evict()
+
+    def evict(self) -> None:
+
+        """
+        Removes the least recently used results until the total size fits the capacity.
+
+        :return: None
+        """
+
+        entries = sorted(
+            (entry.stat().st_mtime_ns, entry.stat().st_size, entry)
+            for entry in self.__directory.glob("*.ply")
+            # temporary files of the results being written are left alone.
+            if not entry.name.startswith(".")
+        )
+        size = sum(entry[1] for entry in entries)
+
+        for _, entry_size, entry in entries:
+            if size <= self.__capacity:
+                break
+
+            entry.unlink(missing_ok=True)
+            size -= entry_size
@@ -0,0 +1,75 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+
+class ICache(ABC):
+
+    """
+    Interface for content-addressed storage of intermediate pipeline results.
+
+    Every result is identified by a key, derived from the key of its input and the operation performed on it,
+    so equal inputs processed with equal operations always share the same key.
+    """
+
+    @abstractmethod
+    def source_key(self, path: str) -> str:
+        """
+        Returns the key of a source file, based on its content.
+
+        :raises: ValueError: if the file doesn't exist.
+
+        :param path: path to the source file.
+        :return: key of the file content.
+        """
+
+        pass
+
+    @abstractmethod
+    def step_key(self, parent: str, operation: str, parameters: Dict[str, Any]) -> str:
+        """
+        Returns the key of the result of given operation, performed on the data with the given key.
+
+        :param parent: key of the input data.
+        :param operation: name of the operation.
+        :param parameters: parameters of the operation.
+        :return: key of the result.
+        """
+
+        pass
+
+    @abstractmethod
+    def contains(self, key: str) -> bool:
+        """
+        Checks if the result with the given key is stored.
+
+        :param key: key of the result.
+        :return: boolean check result.
+        """
+
+        pass
+
+    @abstractmethod
+    def load(self, key: str) -> Any:
+        """
+        Returns the stored result with the given key and marks it as recently used.
+
+        :raises: KeyError: if there is no result with the given key.
+
+        :param key: key of the result.
+        :return: stored data.
+        """
+
+        pass
+
+    @abstractmethod
+    def store(self, key: str, data: Any) -> None:
+        """
+        Stores the result under the given key. Evicts the least recently used results if the storage
+        exceeds its capacity.
+
+        :param key: key of the result.
+        :param data: data to store.
+        :return: None
+        """
+
+        pass
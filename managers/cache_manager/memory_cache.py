@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+from framework import lazy_import
+from managers.file_manager import FileManager
+
+if TYPE_CHECKING:
+    import open3d as o3d  # type: ignore
+else:
+    o3d = lazy_import("open3d")
+
+
+def cloud_size(cloud: o3d.geometry.PointCloud) -> int:
+
+    """
+    Returns the memory taken by the points, normals and colours of the PointCloud (float64 each).
+
+    :param cloud: PointCloud to measure.
+    :return: size in bytes.
+    """
+
+    arrays = 1 + int(cloud.has_normals()) + int(cloud.has_colors())
+
+    return len(cloud.points) * arrays * 24
+
+
+class CloudCache:
+
+    """
+    In-memory cache of the source point clouds, keyed by the file version (path, modification time and size),
+    so a changed file is read again.
+
+    The clouds are kept under a memory budget, the least recently used ones are evicted first.
+    Every load hands out a copy, so the callers may change it freely. Thread-safe.
+    """
+
+    def __init__(self, budget: int = 4 * 1024**3) -> None:
+
+        """
+        Constructor method for CloudCache class.
+
+        :param budget: maximum total size of the clouds kept in bytes.
+        """
+
+        self.__budget = budget
+        self.__clouds: OrderedDict[
+            Tuple[str, int, int], o3d.geometry.PointCloud
+        ] = OrderedDict()
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = Lock()
+
+        self.__file = FileManager()
+
+    def load(self, path: str) -> o3d.geometry.PointCloud:
+
+        """
+        Returns a copy of the point cloud stored in the file, reading the file only if it isn't cached.
+
+        :raises: ValueError: if the file doesn't exist or isn't supported.
+
+        :param path: path to the point cloud file.
+        :return: PointCloud
+        """
+
+        version = self.__file.file_version(path)
+
+        with self.__lock:
+            cloud = self.__clouds.get(version)
+
+            if cloud is not None:
+                self.__clouds.move_to_end(version)
+                self.__hits += 1
+
+                return o3d.geometry.PointCloud(cloud)
+
+            self.__misses += 1
+
+        # the file is read outside the lock, so the jobs on the cached clouds aren't held up meanwhile.
+        cloud = self.__file.read(path)
+        self.__store(version, cloud)
+
+        return o3d.geometry.PointCloud(cloud)
+
+    def __store(
+        self, version: Tuple[str, int, int], cloud: o3d.geometry.PointCloud
+    ) -> None:
+        size = cloud_size(cloud)
+
+        if size > self.__budget:
+            return
+
+        with self.__lock:
+            # the same file may have been read by several jobs at once.
+            if version in self.__clouds:
+                return
+
+            # older versions of the file won't be requested again.
+            for stale in [key for key in self.__clouds if key[0] == version[0]]:
+                self.__size -= cloud_size(self.__clouds.pop(stale))
+
+            while self.__clouds and self.__size + size > self.__budget:
+                _, evicted = self.__clouds.popitem(last=False)
+                self.__size -= cloud_size(evicted)
+
+            self.__clouds[version] = cloud
+            self.__size += size
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__clouds.clear()
+            self.__size = 0
+
+    def stats(self) -> Dict[str, Any]:
+
+        """
+        Describes the cache state.
+
+        :return: dictionary with the paths of the cached clouds, their total size, the budget and hit counts.
+        """
+
+        with self.__lock:
+            return {
+                "clouds": [key[0] for key in self.__clouds],
+                "bytes": self.__size,
+                "budget": self.__budget,
+                "hits": self.__hits,
+                "misses": self.__misses,
+            }
@@ -1,4 +1,23 @@
 from .file_manager_base import IFileManager
 from .file_manager import FileManager
+from .parsers import (
+    CompactCloud,
+    LasPoints,
+    LasWriter,
+    PlyVertices,
+    PlyWriter,
+    TiffImage,
+)
+from .async_writer import AsyncWriter
 
-__all__ = ["IFileManager", "FileManager"]
+__all__ = [
+    "IFileManager",
+    "FileManager",
+    "PlyVertices",
+    "PlyWriter",
+    "CompactCloud",
+    "LasPoints",
+    "LasWriter",
+    "TiffImage",
+    "AsyncWriter",
+]
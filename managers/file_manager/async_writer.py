@@ -0,0 +1,116 @@
+from concurrent.futures import Future
+from queue import Queue
+from threading import Lock, Thread
+from typing import Any, List, Optional, Tuple
+
+from .file_manager import FileManager
+
+
+class AsyncWriter:
+
+    """
+    Writes files in a background thread, so the caller goes on computing while the previous results are written.
+
+    Every file is written atomically (see FileManager.write_atomic). The queue is bounded: submit blocks while
+    the given number of writes is pending, so the memory held by the queued data stays bounded too.
+    The data submitted must not be changed until it is written.
+    """
+
+    def __init__(self, capacity: int = 2):
+
+        """
+        Constructor method for AsyncWriter class objects.
+
+        :param capacity: number of writes, which may wait in the queue besides the one being written.
+        """
+
+        self.__queue: Queue[
+            Optional[Tuple[str, Any, Optional[str], Future[None]]]
+        ] = Queue(capacity)
+        self.__pending: List[Future[None]] = []
+        self.__thread: Optional[Thread] = None
+        self.__lock = Lock()
+
+    def __enter__(self) -> "AsyncWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def submit(self, path: str, data: Any, mode: Optional[str] = None) -> Future[None]:
+
+        """
+        Queues the data to be written to the given path.
+
+        :param path: path to file.
+        :param data: data to write to file.
+        :param mode: |OPTIONAL| name of the parser to use instead of the one determined by file extension.
+        :return: Future, which completes once the file is written.
+        """
+
+        future: Future[None] = Future()
+
+        with self.__lock:
+            # the thread is started on demand, so idle writers cost nothing.
+            if self.__thread is None:
+                self.__thread = Thread(target=self.__work, daemon=True)
+                self.__thread.start()
+
+            self.__pending.append(future)
+
+        self.__queue.put((path, data, mode, future))
+
+        return future
+
+    def flush(self) -> None:
+
+        """
+        Waits for all the submitted writes to complete.
+
+        :raises: the error of the first failed write, if any.
+        :return: None.
+        """
+
+        with self.__lock:
+            pending, self.__pending = self.__pending, []
+
+        for future in pending:
+            future.exception()
+
+        for future in pending:
+            future.result()
+
+    def close(self) -> None:
+
+        """
+        Waits for all the submitted writes to complete and stops the background thread.
+        Errors of the writes are not raised here, they are kept by the futures (see submit and flush).
+
+        :return: None.
+        """
+
+        with self.__lock:
+            thread, self.__thread = self.__thread, None
+
+        if thread is not None:
+            self.__queue.put(None)
+            thread.join()
+
+    def __work(self) -> None:
+        while True:
+            item = self.__queue.get()
+
+            if item is None:
+                return
+
+            path, data, mode, future = item
+
+            if future.set_running_or_notify_cancel():
+                try:
+                    FileManager().write_atomic(path, data, mode)
+                    future.set_result(None)
+                except BaseException as error:
+                    future.set_exception(error)
+
+            # the data is released as soon as it is written.
+            del item, data
@@ -1,10 +1,19 @@
+import os
+import sys
+from importlib import import_module
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from threading import get_ident
+from typing import Dict, List, Optional, Any, Tuple
 
+from ..profile_manager import Profiler
 from .parsers import IParser, ParserFactory
 from .file_manager_base import IFileManager
 
 
+# modules, which the parsers import lazily. Their import is recorded on its own while profiling (see read, write).
+PARSER_MODULES = ("numpy", "open3d")
+
+
 class FileManager(IFileManager):
 
     """
@@ -22,7 +31,13 @@ class FileManager(IFileManager):
         if parsers is None:
             parsers = {
                 "yml": ParserFactory.create_yml(),
+                "json": ParserFactory.create_json(),
                 "ply": ParserFactory.create_ply(),
+                "ply_memmap": ParserFactory.create_ply_memmap(),
+                "las": ParserFactory.create_las(),
+                "las_memmap": ParserFactory.create_las_memmap(),
+                "tiff": ParserFactory.create_tiff(),
+                "tif": ParserFactory.create_tiff("tif"),
             }
 
         self.__modes = parsers
@@ -60,6 +75,15 @@ class FileManager(IFileManager):
 
         return False
 
+    def file_version(self, path: str) -> Tuple[str, int, int]:
+        if not self.path_exists(path):
+            raise ValueError(f"The file does not exist! (Couldn't access {path})")
+
+        p = Path(path).resolve()
+        stat = p.stat()
+
+        return str(p), stat.st_mtime_ns, stat.st_size
+
     def create_path(self, path: str) -> None:
         p = Path(path)
         p.mkdir(parents=True)
@@ -73,8 +97,9 @@ class FileManager(IFileManager):
 
         return False
 
-    def read(self, path: str) -> Any:
-        mode = FileManager.get_format(path)
+    def read(self, path: str, mode: Optional[str] = None) -> Any:
+        if mode is None:
+            mode = FileManager.get_format(path)
 
         if not self.is_supported(mode):
             raise ValueError(f"{mode} file type is not supported!")
@@ -82,10 +107,19 @@ class FileManager(IFileManager):
         if not self.path_exists(path):
             raise ValueError(f"The file does not exist! (Couldn't access {path})")
 
-        return self.__modes[mode].file_input(path)
+        FileManager.__import_parser_modules()
+
+        with Profiler().measure(
+            "io", f"read {mode}", details={"path": path}
+        ) as measurement:
+            data = self.__modes[mode].file_input(path)
+            measurement.finish(data)
+
+        return data
 
-    def write(self, path: str, data: Any) -> None:
-        mode = FileManager.get_format(path)
+    def write(self, path: str, data: Any, mode: Optional[str] = None) -> None:
+        if mode is None:
+            mode = FileManager.get_format(path)
 
         if not self.is_supported(mode):
             raise ValueError(f"{mode} file type is not supported!")
@@ -93,4 +127,50 @@ class FileManager(IFileManager):
         if not self.path_exists(self.get_file_location(path)):
             self.create_path(self.get_file_location(path))
 
-        self.__modes[mode].file_output(file_path=path, data=data)
+        FileManager.__import_parser_modules()
+
+        with Profiler().measure("io", f"write {mode}", data, {"path": path}):
+            self.__modes[mode].file_output(file_path=path, data=data)
+
+    @staticmethod
+    def __import_parser_modules() -> None:
+
+        """
+        Imports the modules, which the parsers import lazily, each measured as an "import" record, while
+        profiling is enabled. Otherwise the first file operation would be charged for the import.
+
+        :return: None
+        """
+
+        if not Profiler().enabled:
+            return
+
+        for name in PARSER_MODULES:
+            if name not in sys.modules:
+                with Profiler().measure("import", name):
+                    import_module(name)
+
+    def write_atomic(self, path: str, data: Any, mode: Optional[str] = None) -> None:
+        if mode is None:
+            mode = FileManager.get_format(path)
+
+        if not self.path_exists(self.get_file_location(path)):
+            self.create_path(self.get_file_location(path))
+
+        # the temporary name is unique per process and thread, and keeps the extension,
+        # as some writers (Open3D) pick the format by it.
+        target = Path(path)
+        temporary = str(
+            target.with_name(
+                f".{target.stem}-{os.getpid()}-{get_ident()}{target.suffix}"
+            )
+        )
+
+        try:
+            self.write(temporary, data, mode)
+            os.replace(temporary, path)
+        except BaseException:
+            if self.path_exists(temporary):
+                os.remove(temporary)
+
+            raise
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Any
+from typing import List, Any, Optional, Tuple
 
 from framework import EmbedSingleton
 
@@ -48,6 +48,21 @@ class IFileManager(ABC, metaclass=EmbedSingleton):
 
         pass
 
+    @abstractmethod
+    def file_version(self, path: str) -> Tuple[str, int, int]:
+
+        """
+        Helper method to identify the current version of the file: its absolute path, modification time
+        and size. Used as a key to detect if a previously read file has changed.
+
+        :raises: ValueError: if the file doesn't exist.
+
+        :param path: path to the file.
+        :return: absolute path, modification time (ns) and size (bytes) of the file.
+        """
+
+        pass
+
     @abstractmethod
     def create_path(self, path: str) -> None:
 
@@ -61,7 +76,7 @@ class IFileManager(ABC, metaclass=EmbedSingleton):
         pass
 
     @abstractmethod
-    def read(self, path: str) -> Any:
+    def read(self, path: str, mode: Optional[str] = None) -> Any:
 
         """
         Extract data from file of supported format.
@@ -69,19 +84,36 @@ class IFileManager(ABC, metaclass=EmbedSingleton):
         :raises: ValueError: if file format is not supported or the file doesn't exist.
 
         :param path: path to file.
+        :param mode: |OPTIONAL| name of the parser to use instead of the one determined by file extension.
         :return: data from file.
         """
 
         pass
 
     @abstractmethod
-    def write(self, path: str, data: Any) -> None:
+    def write(self, path: str, data: Any, mode: Optional[str] = None) -> None:
 
         """
         Output data to file along the given path. Creates the file if it doesn't exist.
 
         :param path: path to file.
         :param data: data to write to file.
+        :param mode: |OPTIONAL| name of the parser to use instead of the one determined by file extension.
+        :return: None.
+        """
+
+        pass
+
+    @abstractmethod
+    def write_atomic(self, path: str, data: Any, mode: Optional[str] = None) -> None:
+
+        """
+        Output data to file along the given path atomically: the data is written to a temporary file
+        in the same directory, which then replaces the target. Readers never see a partially written file.
+
+        :param path: path to file.
+        :param data: data to write to file.
+        :param mode: |OPTIONAL| name of the parser to use instead of the one determined by file extension.
         :return: None.
         """
 
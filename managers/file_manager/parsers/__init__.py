@@ -1,5 +1,19 @@
 from .parser_base import IParser, IParserFactory, read_stream, write_stream
 from .parser_factory import ParserFactory
 from .parser import Parser
+from .ply import PlyVertices, PlyWriter
+from .compact import CompactCloud
+from .las import LasPoints, LasWriter
+from .tiff import TiffImage
 
-__all__ = ["IParser", "Parser", "ParserFactory"]
+__all__ = [
+    "IParser",
+    "Parser",
+    "ParserFactory",
+    "PlyVertices",
+    "PlyWriter",
+    "CompactCloud",
+    "LasPoints",
+    "LasWriter",
+    "TiffImage",
+]
@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from framework import lazy_import
+from .ply import PlyVertices
+
+if TYPE_CHECKING:
+    import numpy as np
+    import open3d as o3d  # type: ignore
+    from numpy import ndarray, dtype
+    from numpy.typing import ArrayLike
+else:
+    np = lazy_import("numpy")
+    o3d = lazy_import("open3d")
+
+
+# points are converted and transformed in chunks of this many, so the float64 temporaries stay small.
+CHUNK_POINTS = 1 << 20
+
+
+class CompactCloud:
+
+    """
+    Compact in-memory point cloud.
+
+    Coordinates are stored relative to a float64 origin, either as float32 offsets or (LAS-style)
+    as int32 multiples of the given scale. Normals are stored as float32 and colours as uint8.
+    Compared to an Open3D PointCloud (float64 everywhere) a cloud with normals and colours takes 27 bytes
+    per point instead of 72.
+
+    Shifts change only the origin. Transformations and selections work on the compact arrays,
+    absolute coordinates are computed on demand (see coordinates).
+    """
+
+    __slots__ = ("__origin", "__offsets", "__scale", "__normals", "__colors")
+
+    def __init__(
+        self,
+        origin: ArrayLike,
+        offsets: ndarray[Any, dtype[Any]],
+        scale: Optional[float] = None,
+        normals: Optional[ndarray[Any, dtype[Any]]] = None,
+        colors: Optional[ndarray[Any, dtype[Any]]] = None,
+    ):
+
+        """
+        Constructor method for CompactCloud class.
+
+        :raises: ValueError: if the arrays have different lengths or types other than described above.
+
+        :param origin: float64 origin of the coordinates.
+        :param offsets: (N, 3) float32 offsets from the origin, or int32 ones if the scale is given.
+        :param scale: |OPTIONAL| size of the quantization step of the offsets.
+        :param normals: |OPTIONAL| (N, 3) float32 normals.
+        :param colors: |OPTIONAL| (N, 3) uint8 colours.
+        """
+
+        expected = np.int32 if scale is not None else np.float32
+
+        if offsets.ndim != 2 or offsets.shape[1] != 3 or offsets.dtype != expected:
+            raise ValueError(f"Offsets must be an (N, 3) array of {expected.__name__}!")
+
+        for name, values, kind in (
+            ("Normals", normals, np.float32),
+            ("Colours", colors, np.uint8),
+        ):
+            if values is not None and (
+                values.shape != offsets.shape or values.dtype != kind
+            ):
+                raise ValueError(
+                    f"{name} must be an (N, 3) array of {kind.__name__} matching the points!"
+                )
+
+        self.__origin = np.asarray(origin, dtype=np.float64).reshape(3)
+        self.__offsets = offsets
+        self.__scale = scale
+        self.__normals = normals
+        self.__colors = colors
+
+    def __len__(self) -> int:
+        return len(self.__offsets)
+
+    @property
+    def origin(self) -> ndarray[Any, dtype[Any]]:
+        return self.__origin
+
+    @property
+    def offsets(self) -> ndarray[Any, dtype[Any]]:
+        return self.__offsets
+
+    @property
+    def scale(self) -> Optional[float]:
+        return self.__scale
+
+    @property
+    def normals(self) -> Optional[ndarray[Any, dtype[Any]]]:
+        return self.__normals
+
+    @property
+    def colors(self) -> Optional[ndarray[Any, dtype[Any]]]:
+        return self.__colors
+
+    def has_points(self) -> bool:
+        return len(self.__offsets) > 0
+
+    def has_normals(self) -> bool:
+        return self.__normals is not None
+
+    def has_colors(self) -> bool:
+        return self.__colors is not None
+
+    @property
+    def nbytes(self) -> int:
+
+        """
+        Memory taken by the arrays of the cloud in bytes.
+        """
+
+        return sum(
+            values.nbytes
+            for values in (self.__offsets, self.__normals, self.__colors)
+            if values is not None
+        )
+
+    def coordinates(
+        self, axis: Optional[int] = None, start: int = 0, stop: Optional[int] = None
+    ) -> ndarray[Any, dtype[Any]]:
+
+        """
+        Computes float64 absolute coordinates of the points.
+
+        :param axis: |OPTIONAL| index of the single axis to compute.
+        :param start: first point.
+        :param stop: point after the last one, the end of the cloud by default.
+        :return: (N, 3) array, or (N,) one if the axis is given.
+        """
+
+        columns = slice(None) if axis is None else axis
+        coordinates = self.__offsets[start:stop, columns].astype(np.float64)
+
+        if self.__scale is not None:
+            coordinates *= self.__scale
+
+        coordinates += self.__origin[columns]
+
+        return coordinates
+
+    def copy(self) -> "CompactCloud":
+
+        """
+        Builds a CompactCloud with copies of the arrays, which may be changed independently of this one.
+
+        :return: CompactCloud
+        """
+
+        return CompactCloud(
+            self.__origin,
+            self.__offsets.copy(),
+            self.__scale,
+            None if self.__normals is None else self.__normals.copy(),
+            None if self.__colors is None else self.__colors.copy(),
+        )
+
+    def select(self, indices: ndarray[Any, dtype[Any]]) -> "CompactCloud":
+
+        """
+        Builds a CompactCloud of the given points, taking their normals and colours along.
+
+        :param indices: indices (or a boolean mask) of the points to keep.
+        :return: CompactCloud
+        """
+
+        return CompactCloud(
+            self.__origin,
+            self.__offsets[indices],
+            self.__scale,
+            None if self.__normals is None else self.__normals[indices],
+            None if self.__colors is None else self.__colors[indices],
+        )
+
+    def translate(self, shift: ArrayLike) -> None:
+
+        """
+        Shifts the points in place. Only the origin is changed.
+
+        :param shift: x, y and z shift values.
+        :return: None
+        """
+
+        self.__origin = self.__origin + np.asarray(shift, dtype=np.float64)
+
+    def transform(self, matrix: ArrayLike) -> None:
+
+        """
+        Applies the affine transformation to the points (and normals) in place.
+        The origin is transformed as a point, the offsets and normals are only rotated (scaled, sheared).
+        Quantized offsets are rounded back to the scale.
+
+        :raises: ValueError: if the transformed quantized offsets may not fit into int32.
+
+        :param matrix: 4x4 affine matrix.
+        :return: None
+        """
+
+        affine = np.asarray(matrix, dtype=np.float64)
+        linear = affine[:3, :3]
+
+        # the bound is checked before anything is changed, so a failed transformation leaves the cloud intact.
+        if self.__scale is not None and len(self):
+            extents = np.abs(self.__offsets.min(axis=0).astype(np.float64))
+            extents = np.maximum(extents, self.__offsets.max(axis=0))
+
+            if (np.abs(linear) @ extents).max() >= np.iinfo(np.int32).max:
+                raise ValueError(
+                    f"Scale {self.__scale} is too fine for the transformed cloud!"
+                )
+
+        self.__origin = linear @ self.__origin + affine[:3, 3]
+
+        for start in range(0, len(self), CHUNK_POINTS):
+            chunk = slice(start, start + CHUNK_POINTS)
+            offsets = self.__offsets[chunk] @ linear.T
+
+            if self.__scale is None:
+                self.__offsets[chunk] = offsets
+            else:
+                self.__offsets[chunk] = np.rint(offsets)
+
+            if self.__normals is not None:
+                self.__normals[chunk] = self.__normals[chunk] @ linear.T
+
+    @staticmethod
+    def pack(
+        points: ndarray[Any, dtype[Any]],
+        scale: Optional[float] = None,
+        normals: Optional[ndarray[Any, dtype[Any]]] = None,
+        colors: Optional[ndarray[Any, dtype[Any]]] = None,
+    ) -> "CompactCloud":
+
+        """
+        Packs the absolute coordinates with their normals and colours. The origin is put to the centre
+        of the bounding box, which halves the largest offset compared to its corner.
+
+        :raises: ValueError: if the quantized offsets don't fit into int32.
+
+        :param points: (N, 3) array of coordinates.
+        :param scale: |OPTIONAL| size of the quantization step, the offsets are stored as float32 if not given.
+        :param normals: |OPTIONAL| (N, 3) array of normals.
+        :param colors: |OPTIONAL| (N, 3) array of colours, either as uint8 or as floats in [0, 1].
+        :return: CompactCloud
+        """
+
+        origin = (
+            (points.min(axis=0) + points.max(axis=0)) / 2
+            if len(points)
+            else np.zeros(3)
+        )
+        origin = origin.astype(np.float64)
+
+        if scale is not None:
+            extent = np.abs(points - origin).max() if len(points) else 0.0
+
+            if extent / scale >= np.iinfo(np.int32).max:
+                raise ValueError(
+                    f"Scale {scale} is too fine for the extent of the cloud!"
+                )
+
+        offsets = np.empty(points.shape, np.float32 if scale is None else np.int32)
+
+        for start in range(0, len(points), CHUNK_POINTS):
+            chunk = slice(start, start + CHUNK_POINTS)
+            relative = points[chunk].astype(np.float64) - origin
+            offsets[chunk] = relative if scale is None else np.rint(relative / scale)
+
+        if colors is not None and colors.dtype != np.uint8:
+            colors = np.rint(np.clip(colors, 0, 1) * 255)
+
+        return CompactCloud(
+            origin,
+            offsets,
+            scale,
+            None if normals is None else normals.astype(np.float32),
+            None if colors is None else colors.astype(np.uint8),
+        )
+
+    @staticmethod
+    def from_point_cloud(
+        cloud: o3d.geometry.PointCloud, scale: Optional[float] = None
+    ) -> "CompactCloud":
+
+        """
+        Packs the Open3D PointCloud.
+
+        :param cloud: PointCloud to pack.
+        :param scale: |OPTIONAL| size of the quantization step (see pack).
+        :return: CompactCloud
+        """
+
+        return CompactCloud.pack(
+            np.asarray(cloud.points),
+            scale,
+            np.asarray(cloud.normals) if cloud.has_normals() else None,
+            np.asarray(cloud.colors) if cloud.has_colors() else None,
+        )
+
+    @staticmethod
+    def from_vertices(
+        vertices: PlyVertices, scale: Optional[float] = None
+    ) -> "CompactCloud":
+
+        """
+        Packs the PLY vertices (e.g. memory-mapped ones) without going through Open3D.
+        Integer colours other than uint8 are normalized by their maximum.
+
+        :param vertices: PlyVertices to pack.
+        :param scale: |OPTIONAL| size of the quantization step (see pack).
+        :return: CompactCloud
+        """
+
+        colors = vertices.colors
+
+        if colors is not None and colors.dtype != np.uint8:
+            if np.issubdtype(colors.dtype, np.integer):
+                colors = colors / np.iinfo(colors.dtype).max
+
+        return CompactCloud.pack(vertices.points, scale, vertices.normals, colors)
+
+    def to_point_cloud(self) -> o3d.geometry.PointCloud:
+
+        """
+        Unpacks the cloud into an Open3D PointCloud.
+
+        :return: PointCloud
+        """
+
+        cloud = o3d.geometry.PointCloud()
+        cloud.points = o3d.utility.Vector3dVector(self.coordinates())
+
+        if self.__normals is not None:
+            cloud.normals = o3d.utility.Vector3dVector(
+                self.__normals.astype(np.float64)
+            )
+
+        if self.__colors is not None:
+            cloud.colors = o3d.utility.Vector3dVector(self.__colors / 255)
+
+        return cloud
+
+    def to_vertices(self) -> PlyVertices:
+
+        """
+        Unpacks the cloud into vertex records of the same layout, as PlyVertices.from_point_cloud builds.
+
+        :return: PlyVertices
+        """
+
+        fields = [("x", "<f8"), ("y", "<f8"), ("z", "<f8")]
+
+        if self.__normals is not None:
+            fields += [("nx", "<f8"), ("ny", "<f8"), ("nz", "<f8")]
+
+        if self.__colors is not None:
+            fields += [("red", "u1"), ("green", "u1"), ("blue", "u1")]
+
+        vertices = np.empty(len(self), dtype=np.dtype(fields))
+
+        for start in range(0, len(self), CHUNK_POINTS):
+            chunk = vertices[start : start + CHUNK_POINTS]
+
+            for axis, name in enumerate("xyz"):
+                chunk[name] = self.coordinates(axis, start, start + CHUNK_POINTS)
+
+        if self.__normals is not None:
+            for name, values in zip(("nx", "ny", "nz"), self.__normals.T):
+                vertices[name] = values
+
+        if self.__colors is not None:
+            for name, values in zip(("red", "green", "blue"), self.__colors.T):
+                vertices[name] = values
+
+        return PlyVertices(vertices)
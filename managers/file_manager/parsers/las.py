@@ -0,0 +1,716 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING, Any, BinaryIO, Mapping, Optional, Tuple
+
+from framework import lazy_import
+from .compact import CompactCloud
+
+if TYPE_CHECKING:
+    import numpy as np
+    import open3d as o3d  # type: ignore
+    from numpy import ndarray, dtype
+    from numpy.lib import recfunctions
+    from numpy.typing import ArrayLike
+else:
+    np = lazy_import("numpy")
+    o3d = lazy_import("open3d")
+    recfunctions = lazy_import("numpy.lib.recfunctions")
+
+
+# public header block of LAS 1.2, extended by LAS 1.3 and LAS 1.4 (all little-endian).
+LAS_HEADER = [
+    ("signature", "S4"),
+    ("source_id", "<u2"),
+    ("encoding", "<u2"),
+    ("guid", "V16"),
+    ("version_major", "u1"),
+    ("version_minor", "u1"),
+    ("system", "S32"),
+    ("software", "S32"),
+    ("day", "<u2"),
+    ("year", "<u2"),
+    ("header_size", "<u2"),
+    ("points_offset", "<u4"),
+    ("vlr_count", "<u4"),
+    ("point_format", "u1"),
+    ("record_length", "<u2"),
+    ("legacy_count", "<u4"),
+    ("legacy_by_return", "<u4", (5,)),
+    ("scale", "<f8", (3,)),
+    ("offset", "<f8", (3,)),
+    ("max_x", "<f8"),
+    ("min_x", "<f8"),
+    ("max_y", "<f8"),
+    ("min_y", "<f8"),
+    ("max_z", "<f8"),
+    ("min_z", "<f8"),
+]
+LAS_HEADER_13 = LAS_HEADER + [("waveform_offset", "<u8")]
+LAS_HEADER_14 = LAS_HEADER_13 + [
+    ("evlr_offset", "<u8"),
+    ("evlr_count", "<u4"),
+    ("count", "<u8"),
+    ("by_return", "<u8", (15,)),
+]
+
+# legacy point data record formats (0-3), supported by LAS 1.2-1.4.
+LAS_POINT = [
+    ("X", "<i4"),
+    ("Y", "<i4"),
+    ("Z", "<i4"),
+    ("intensity", "<u2"),
+    ("flags", "u1"),
+    ("classification", "u1"),
+    ("scan_angle", "i1"),
+    ("user_data", "u1"),
+    ("point_source", "<u2"),
+]
+LAS_GPS = [("gps_time", "<f8")]
+LAS_RGB = [("red", "<u2"), ("green", "<u2"), ("blue", "<u2")]
+POINT_FORMATS = {
+    0: LAS_POINT,
+    1: LAS_POINT + LAS_GPS,
+    2: LAS_POINT + LAS_RGB,
+    3: LAS_POINT + LAS_GPS + LAS_RGB,
+}
+
+# default quantization step of the coordinates written (millimetres for metric data).
+DEFAULT_SCALE = 0.001
+
+# flags of a single return: return number 1 of 1.
+SINGLE_RETURN = 1 | 1 << 3
+
+
+def point_dtype(point_format: int, record_length: Optional[int] = None) -> dtype[Any]:
+
+    """
+    Builds the type of the point data records. Records may be longer than the format requires,
+    the extra bytes are skipped.
+
+    :raises: ValueError: if the format is not supported.
+
+    :param point_format: point data record format.
+    :param record_length: |OPTIONAL| length of a record in bytes.
+    :return: numpy structured type.
+    """
+
+    if point_format not in POINT_FORMATS:
+        raise ValueError(
+            f"Point data record format {point_format} is not supported (only 0-3 are)!"
+        )
+
+    standard = np.dtype(POINT_FORMATS[point_format])
+
+    if record_length is None or record_length == standard.itemsize:
+        return standard
+
+    if record_length < standard.itemsize:
+        raise ValueError(
+            f"Point data record length {record_length} is too short for format {point_format}!"
+        )
+
+    fields: Mapping[str, Any] = standard.fields or {}
+    padded: dtype[Any] = np.dtype(
+        {
+            "names": list(fields),
+            "formats": [fields[name][0] for name in fields],
+            "offsets": [fields[name][1] for name in fields],
+            "itemsize": record_length,
+        }
+    )
+
+    return padded
+
+
+class LasPoints:
+
+    """
+    Array-backed view of the point data records of a LAS file.
+
+    Stores the records as a structured numpy array (usually a numpy.memmap) together with the scale
+    and the offset of the coordinates. Coordinates are scaled only when asked for (see coordinates),
+    so the records are never copied as a whole.
+    """
+
+    def __init__(
+        self,
+        records: ndarray[Any, dtype[Any]],
+        scale: ArrayLike,
+        offset: ArrayLike,
+    ):
+
+        """
+        Constructor method for LasPoints class.
+
+        :param records: structured array of point data records, containing at least X, Y and Z fields.
+        :param scale: scale of the X, Y and Z integer coordinates.
+        :param offset: offset of the X, Y and Z coordinates.
+        """
+
+        if records.dtype.names is None or not {"X", "Y", "Z"}.issubset(
+            records.dtype.names
+        ):
+            raise ValueError("Point records must have X, Y and Z fields!")
+
+        self.__records = records
+        self.__scale = np.asarray(scale, dtype=np.float64).reshape(3)
+        self.__offset = np.asarray(offset, dtype=np.float64).reshape(3)
+
+    def __len__(self) -> int:
+        return len(self.__records)
+
+    def __getitem__(self, index: slice) -> "LasPoints":
+        return LasPoints(self.__records[index], self.__scale, self.__offset)
+
+    @property
+    def array(self) -> ndarray[Any, dtype[Any]]:
+
+        """
+        Underlying structured array of point data records.
+        """
+
+        return self.__records
+
+    @property
+    def scale(self) -> ndarray[Any, dtype[Any]]:
+        return self.__scale
+
+    @property
+    def offset(self) -> ndarray[Any, dtype[Any]]:
+        return self.__offset
+
+    @property
+    def point_format(self) -> int:
+
+        """
+        Point data record format matching the fields of the records.
+        """
+
+        names = set(self.__records.dtype.names or [])
+
+        return ("gps_time" in names) + 2 * ("red" in names)
+
+    @property
+    def integer_coordinates(self) -> ndarray[Any, dtype[Any]]:
+
+        """
+        Raw X, Y and Z integer coordinates as an (N, 3) view into the records.
+        """
+
+        coordinates: ndarray[Any, dtype[Any]] = recfunctions.structured_to_unstructured(
+            self.__records[["X", "Y", "Z"]], copy=False
+        )
+
+        return coordinates
+
+    @property
+    def colors(self) -> Optional[ndarray[Any, dtype[Any]]]:
+
+        """
+        16-bit red, green and blue values as an (N, 3) view into the records, if the format has them.
+        """
+
+        if "red" not in (self.__records.dtype.names or []):
+            return None
+
+        colors: ndarray[Any, dtype[Any]] = recfunctions.structured_to_unstructured(
+            self.__records[["red", "green", "blue"]], copy=False
+        )
+
+        return colors
+
+    def coordinates(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> ndarray[Any, dtype[Any]]:
+
+        """
+        Applies the scale and the offset to the coordinates of the given points.
+
+        :param start: first point.
+        :param stop: point after the last one, the end of the records by default.
+        :return: (N, 3) float64 array.
+        """
+
+        coordinates: ndarray[Any, dtype[Any]] = (
+            self.integer_coordinates[start:stop] * self.__scale
+        )
+        coordinates += self.__offset
+
+        return coordinates
+
+    def bounds(self) -> Tuple[ndarray[Any, dtype[Any]], ndarray[Any, dtype[Any]]]:
+
+        """
+        Computes the bounding box of the points from the integer coordinates.
+
+        :return: minimum and maximum coordinates.
+        """
+
+        if not len(self):
+            return np.zeros(3), np.zeros(3)
+
+        integers = self.integer_coordinates
+        low = integers.min(axis=0) * self.__scale + self.__offset
+        high = integers.max(axis=0) * self.__scale + self.__offset
+
+        # negative scales swap the ends.
+        return np.minimum(low, high), np.maximum(low, high)
+
+    def to_point_cloud(self) -> o3d.geometry.PointCloud:
+
+        """
+        Copies the points into an Open3D PointCloud. Colours are normalized to [0, 1].
+
+        :return: PointCloud
+        """
+
+        cloud = o3d.geometry.PointCloud()
+        cloud.points = o3d.utility.Vector3dVector(self.coordinates())
+
+        colors = self.colors
+
+        if colors is not None:
+            cloud.colors = o3d.utility.Vector3dVector(colors / 65535)
+
+        return cloud
+
+    def to_compact(self, scale: Optional[float] = None) -> CompactCloud:
+
+        """
+        Packs the points into a CompactCloud. If the scale is not given and the coordinates share the same
+        scale, the integer coordinates are taken as they are, with the offset as the origin.
+
+        :param scale: |OPTIONAL| quantization step of the result, float32 offsets are used if not given
+            and the scales of the coordinates differ.
+        :return: CompactCloud
+        """
+
+        colors = self.colors
+
+        if colors is not None:
+            colors = (colors >> 8).astype(np.uint8)
+
+        if scale is None and np.all(self.__scale == self.__scale[0]):
+            return CompactCloud(
+                self.__offset,
+                self.integer_coordinates.astype(np.int32),
+                float(self.__scale[0]),
+                colors=colors,
+            )
+
+        return CompactCloud.pack(self.coordinates(), scale, colors=colors)
+
+    @staticmethod
+    def pack(
+        points: ndarray[Any, dtype[Any]],
+        colors: Optional[ndarray[Any, dtype[Any]]] = None,
+        scale: float = DEFAULT_SCALE,
+    ) -> "LasPoints":
+
+        """
+        Quantizes the coordinates into records of format 0, or 2 if the colours are given.
+        The offset is put to the (whole) minimum of the coordinates.
+
+        :raises: ValueError: if the quantized coordinates don't fit into int32.
+
+        :param points: (N, 3) array of coordinates.
+        :param colors: |OPTIONAL| (N, 3) array of 16-bit colours.
+        :param scale: quantization step of the coordinates.
+        :return: LasPoints
+        """
+
+        offset = np.floor(points.min(axis=0)) if len(points) else np.zeros(3)
+        extent = (points.max(axis=0) - offset).max() if len(points) else 0.0
+
+        if extent / scale >= np.iinfo(np.int32).max:
+            raise ValueError(f"Scale {scale} is too fine for the extent of the cloud!")
+
+        records = np.zeros(len(points), point_dtype(0 if colors is None else 2))
+        records["flags"] = SINGLE_RETURN
+
+        for axis, name in enumerate("XYZ"):
+            records[name] = np.rint((points[:, axis] - offset[axis]) / scale)
+
+        if colors is not None:
+            for axis, name in enumerate(("red", "green", "blue")):
+                records[name] = colors[:, axis]
+
+        return LasPoints(records, [scale] * 3, offset)
+
+    @staticmethod
+    def from_point_cloud(
+        cloud: o3d.geometry.PointCloud, scale: float = DEFAULT_SCALE
+    ) -> "LasPoints":
+
+        """
+        Quantizes the Open3D PointCloud (see pack). Normals are not stored by the supported formats.
+
+        :param cloud: PointCloud to pack.
+        :param scale: quantization step of the coordinates.
+        :return: LasPoints
+        """
+
+        colors = None
+
+        if cloud.has_colors():
+            colors = np.rint(np.clip(np.asarray(cloud.colors), 0, 1) * 65535)
+
+        return LasPoints.pack(np.asarray(cloud.points), colors, scale)
+
+    @staticmethod
+    def from_compact(cloud: CompactCloud, scale: float = DEFAULT_SCALE) -> "LasPoints":
+
+        """
+        Packs the CompactCloud. Quantized offsets are taken as they are, with the origin as the offset,
+        float32 ones are quantized with the given scale (see pack).
+
+        :param cloud: CompactCloud to pack.
+        :param scale: quantization step of float32 offsets.
+        :return: LasPoints
+        """
+
+        # 8-bit colours are spread over the 16-bit range: 255 becomes 65535.
+        colors = None if cloud.colors is None else cloud.colors.astype(np.uint16) * 257
+
+        if cloud.scale is None:
+            return LasPoints.pack(cloud.coordinates(), colors, scale)
+
+        records = np.zeros(len(cloud), point_dtype(0 if colors is None else 2))
+        records["flags"] = SINGLE_RETURN
+
+        for axis, name in enumerate("XYZ"):
+            records[name] = cloud.offsets[:, axis]
+
+        if colors is not None:
+            for axis, name in enumerate(("red", "green", "blue")):
+                records[name] = colors[:, axis]
+
+        return LasPoints(records, [cloud.scale] * 3, cloud.origin)
+
+
+def read_las_header(path: str) -> Tuple[ndarray[Any, dtype[Any]], int]:
+
+    """
+    Reads the public header block of a LAS file.
+
+    :raises: ValueError: if the file is not an uncompressed LAS 1.2-1.4 file.
+
+    :param path: path to the file.
+    :return: header record (of the LAS_HEADER type or its extensions) and the number of points.
+    """
+
+    with open(path, "rb") as source:
+        raw = source.read(np.dtype(LAS_HEADER_14).itemsize)
+
+    if raw[:4] != b"LASF":
+        raise ValueError(f"{path} is not a LAS file!")
+
+    version = (raw[24], raw[25])
+
+    if version[0] != 1 or not 2 <= version[1] <= 4:
+        raise ValueError(
+            f"LAS {version[0]}.{version[1]} is not supported (only 1.2-1.4 are)!"
+        )
+
+    layout = {2: LAS_HEADER, 3: LAS_HEADER_13, 4: LAS_HEADER_14}[version[1]]
+    header = np.frombuffer(raw, np.dtype(layout), 1)[0]
+
+    # compressed (LAZ) files mark the format with the two highest bits.
+    if header["point_format"] & 0xC0:
+        raise ValueError(f"{path} is compressed (LAZ), which is not supported!")
+
+    count = int(header["legacy_count"])
+
+    # LAS 1.4 keeps the legacy count at zero, if the number of points doesn't fit into it.
+    if version[1] == 4 and int(header["count"]):
+        count = int(header["count"])
+
+    return header, count
+
+
+def read_las_memmap(path: str) -> LasPoints:
+
+    """
+    Maps the point data records of a LAS file into memory without reading them.
+
+    The mapping is copy-on-write: in-place modifications of the arrays never reach the file.
+
+    :raises: ValueError: if the file is not an uncompressed LAS 1.2-1.4 file with point format 0-3.
+
+    :param path: path to the file.
+    :return: LasPoints
+    """
+
+    header, count = read_las_header(path)
+    records = point_dtype(int(header["point_format"]), int(header["record_length"]))
+
+    if not count:
+        return LasPoints(np.empty(0, dtype=records), header["scale"], header["offset"])
+
+    return LasPoints(
+        np.memmap(
+            path,
+            dtype=records,
+            mode="c",
+            offset=int(header["points_offset"]),
+            shape=(count,),
+        ),
+        header["scale"],
+        header["offset"],
+    )
+
+
+def read_las(path: str) -> o3d.geometry.PointCloud:
+
+    """
+    Reads a LAS file into an Open3D PointCloud.
+
+    :param path: path to the file.
+    :return: PointCloud
+    """
+
+    return read_las_memmap(path).to_point_cloud()
+
+
+def las_header(
+    point_format: int,
+    record_length: int,
+    scale: ArrayLike,
+    offset: ArrayLike,
+    bounds: Tuple[ndarray[Any, dtype[Any]], ndarray[Any, dtype[Any]]],
+    returns: ArrayLike,
+    count: int,
+    legacy: bool = True,
+) -> bytes:
+
+    """
+    Builds the public header block of an uncompressed LAS file without variable length records.
+
+    :param point_format: point data record format.
+    :param record_length: length of a point data record in bytes.
+    :param scale: scale of the X, Y and Z integer coordinates.
+    :param offset: offset of the X, Y and Z coordinates.
+    :param bounds: minimum and maximum coordinates of the points.
+    :param returns: (16,) numbers of points by return number (0-15).
+    :param count: number of points.
+    :param legacy: version 1.2 header, if the count fits into it, 1.4 otherwise.
+    :return: encoded header.
+    """
+
+    legacy = legacy and count <= np.iinfo(np.uint32).max
+    layout = np.dtype(LAS_HEADER if legacy else LAS_HEADER_14)
+    low, high = bounds
+    returns = np.asarray(returns)
+    today = date.today()
+
+    header = np.zeros((), dtype=layout)
+    header["signature"] = b"LASF"
+    header["version_major"] = 1
+    header["version_minor"] = 2 if legacy else 4
+    header["system"] = b"OTHER"
+    header["software"] = b"airofoto"
+    header["day"] = today.timetuple().tm_yday
+    header["year"] = today.year
+    header["header_size"] = layout.itemsize
+    header["points_offset"] = layout.itemsize
+    header["point_format"] = point_format
+    header["record_length"] = record_length
+    header["scale"] = scale
+    header["offset"] = offset
+    header["max_x"], header["max_y"], header["max_z"] = high
+    header["min_x"], header["min_y"], header["min_z"] = low
+
+    # points by return number (1-5 in the legacy header, 1-15 in the LAS 1.4 one). LAS 1.4 files keep
+    # the legacy fields too, as long as the count fits into them.
+    if count <= np.iinfo(np.uint32).max:
+        header["legacy_count"] = count
+        header["legacy_by_return"] = returns[1:6]
+
+    if not legacy:
+        header["count"] = count
+        header["by_return"] = returns[1:16]
+
+    return header.tobytes()
+
+
+def write_las(
+    path: str, data: LasPoints | CompactCloud | o3d.geometry.PointCloud
+) -> None:
+
+    """
+    Writes the points into an uncompressed LAS file: version 1.2, or 1.4 if the number of points
+    doesn't fit into the legacy count. The records are written as they are, without variable length records.
+
+    :param path: path to the file.
+    :param data: LasPoints, CompactCloud or PointCloud to write.
+    :return: None
+    """
+
+    if isinstance(data, CompactCloud):
+        data = LasPoints.from_compact(data)
+    elif not isinstance(data, LasPoints):
+        data = LasPoints.from_point_cloud(data)
+
+    returns = np.bincount(data.array["flags"] & 0b111, minlength=16)
+
+    with open(path, "wb") as destination:
+        destination.write(
+            las_header(
+                data.point_format,
+                data.array.dtype.itemsize,
+                data.scale,
+                data.offset,
+                data.bounds(),
+                returns,
+                len(data),
+            )
+        )
+        data.array.tofile(destination)
+
+
+class LasWriter:
+
+    """
+    Incremental LAS 1.4 writer. Points are appended in chunks, so the whole cloud never has to be held in memory.
+    The count, the bounds and the numbers of returns in the header are filled in when the writer is closed.
+
+    All the chunks share the scale and the offset of the first one: the integer coordinates of the following
+    chunks are shifted to that offset (or quantized again, if their scale differs).
+    """
+
+    def __init__(self, path: str):
+
+        """
+        Constructor method for LasWriter class.
+
+        :param path: path to the file to write.
+        """
+
+        self.__path = path
+        self.__stream: Optional[BinaryIO] = None
+        self.__dtype: Optional[dtype[Any]] = None
+        self.__format = 0
+        self.__scale = np.full(3, DEFAULT_SCALE)
+        self.__offset = np.zeros(3)
+        self.__low = np.full(3, np.inf)
+        self.__high = np.full(3, -np.inf)
+        self.__returns = np.zeros(16, dtype=np.int64)
+        self.__count = 0
+        self.__closed = False
+
+    def __enter__(self) -> "LasWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    def write(self, points: LasPoints | CompactCloud | o3d.geometry.PointCloud) -> None:
+
+        """
+        Appends the points to the file. The first written chunk determines the point format, the scale and the offset.
+
+        :raises: ValueError: if the point format differs from the one of previous chunks, or the coordinates
+        don't fit into int32 at the offset of the first chunk.
+
+        :param points: LasPoints, CompactCloud or PointCloud to append.
+        :return: None
+        """
+
+        if self.__closed:
+            raise ValueError("Writing to a closed LasWriter!")
+
+        if isinstance(points, CompactCloud):
+            points = LasPoints.from_compact(points)
+        elif not isinstance(points, LasPoints):
+            points = LasPoints.from_point_cloud(points)
+
+        if self.__stream is None:
+            self.__dtype = points.array.dtype
+            self.__format = points.point_format
+            self.__scale = points.scale
+            self.__offset = points.offset
+            self.__stream = open(self.__path, "wb")
+            self.__stream.write(bytes(np.dtype(LAS_HEADER_14).itemsize))
+
+        if points.array.dtype != self.__dtype:
+            raise ValueError("Point format differs from the previous chunks!")
+
+        if not len(points):
+            return
+
+        records = points.array
+
+        if not np.array_equal(points.scale, self.__scale) or not np.array_equal(
+            points.offset, self.__offset
+        ):
+            if np.array_equal(points.scale, self.__scale):
+                shift = np.rint((points.offset - self.__offset) / self.__scale)
+                integers = points.integer_coordinates.astype(np.int64) + shift
+            else:
+                integers = np.rint(
+                    (points.coordinates() - self.__offset) / self.__scale
+                )
+
+            limits = np.iinfo(np.int32)
+
+            if integers.min() < limits.min or integers.max() > limits.max:
+                raise ValueError(
+                    "Coordinates don't fit into int32 at the offset of the first chunk!"
+                )
+
+            records = records.copy()
+
+            for axis, name in enumerate("XYZ"):
+                records[name] = integers[:, axis]
+
+            points = LasPoints(records, self.__scale, self.__offset)
+
+        low, high = points.bounds()
+        self.__low = np.minimum(self.__low, low)
+        self.__high = np.maximum(self.__high, high)
+        self.__returns += np.bincount(records["flags"] & 0b111, minlength=16)
+
+        records.tofile(self.__stream)
+        self.__count += len(points)
+
+    def close(self) -> None:
+
+        """
+        Rewrites the header with the final count, bounds and numbers of returns and closes the file.
+        If nothing was written, an empty cloud (point format 0) is written.
+
+        :return: None
+        """
+
+        if self.__closed:
+            return
+
+        if self.__stream is None:
+            self.write(
+                LasPoints(np.empty(0, point_dtype(0)), [DEFAULT_SCALE] * 3, np.zeros(3))
+            )
+
+        assert self.__stream is not None and self.__dtype is not None
+
+        bounds = (self.__low, self.__high) if self.__count else (np.zeros(3),) * 2
+
+        self.__stream.seek(0)
+        self.__stream.write(
+            las_header(
+                self.__format,
+                self.__dtype.itemsize,
+                self.__scale,
+                self.__offset,
+                bounds,
+                self.__returns,
+                self.__count,
+                legacy=False,
+            )
+        )
+        self.__stream.close()
+        self.__closed = True
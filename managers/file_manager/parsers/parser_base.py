@@ -86,6 +86,17 @@ class IParserFactory(ABC):
 
         pass
 
+    @staticmethod
+    @abstractmethod
+    def create_json() -> IParser:
+        """
+        Returns a .json file oriented IParser instance.
+
+        :return: IParser
+        """
+
+        pass
+
     @staticmethod
     @abstractmethod
     def create_ply() -> IParser:
@@ -97,6 +108,51 @@ class IParserFactory(ABC):
 
         pass
 
+    @staticmethod
+    @abstractmethod
+    def create_ply_memmap() -> IParser:
+        """
+        Returns a binary .ply file oriented IParser instance, which maps the file into memory instead of reading it.
+
+        :return: IParser
+        """
+
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def create_tiff(extension: str = "tiff") -> IParser:
+        """
+        Returns a .tiff (GeoTIFF) file oriented IParser instance. Images are opened lazily and only read.
+
+        :param extension: file extension to register the parser for (tiff or tif).
+        :return: IParser
+        """
+
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def create_las() -> IParser:
+        """
+        Returns a .las file oriented IParser instance, which reads the points into an Open3D PointCloud.
+
+        :return: IParser
+        """
+
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def create_las_memmap() -> IParser:
+        """
+        Returns a .las file oriented IParser instance, which maps the point records into memory instead of reading them.
+
+        :return: IParser
+        """
+
+        pass
+
 
 #   Compatability wrappers for Parser creation with functions requiring file stream for file access.
 
@@ -1,9 +1,21 @@
-from typing import Callable, Any
-import open3d as o3d  # type: ignore
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Any
+import json
 import yaml
 
+from framework import lazy_import
+
 from .parser_base import IParserFactory, read_stream, write_stream
 from .parser import Parser
+from .las import read_las, read_las_memmap, write_las
+from .ply import read_ply, read_ply_memmap, write_ply_binary
+from .tiff import TiffImage, write_tiff
+
+if TYPE_CHECKING:
+    import open3d as o3d  # type: ignore
+else:
+    o3d = lazy_import("open3d")
 
 
 class ParserFactory(IParserFactory):
@@ -41,8 +53,84 @@ class ParserFactory(IParserFactory):
             "yml", read_stream(yaml.safe_load), write_stream(yml_write_wo_sorting)
         )
 
+    @staticmethod
+    def create_json() -> Parser:
+        """
+        Returns a .json file oriented Parser instance. Output is indented to stay readable.
+
+        :return: Parser
+        """
+
+        def json_write_indented(stream: Any, data: Any) -> None:
+            json.dump(data, stream, indent=2)
+
+        return ParserFactory.create(
+            "json", read_stream(json.load), write_stream(json_write_indented)
+        )
+
     @staticmethod
     def create_ply() -> Parser:
+        """
+        Returns a .ply file oriented Parser instance. Reading fails on corrupt files (see read_ply)
+        instead of returning an empty cloud.
+
+        :return: Parser
+        """
+
+        # Open3D functions are looked up on call, so creating the parser does not import Open3D.
         return ParserFactory.create(
-            "ply", o3d.io.read_point_cloud, o3d.io.write_point_cloud
+            "ply",
+            read_ply,
+            lambda path, data: o3d.io.write_point_cloud(path, data),
         )
+
+    @staticmethod
+    def create_ply_memmap() -> Parser:
+        """
+        Returns a binary .ply file oriented Parser instance.
+
+        Reading maps the vertex records into memory (see PlyVertices) instead of parsing them,
+        so the file is paged in only as the data is accessed.
+
+        :return: Parser
+        """
+
+        return ParserFactory.create("ply_memmap", read_ply_memmap, write_ply_binary)
+
+    @staticmethod
+    def create_tiff(extension: str = "tiff") -> Parser:
+        """
+        Returns a .tiff (GeoTIFF) file oriented Parser instance.
+
+        Reading only parses the tags and returns a TiffImage, which reads the pixels by windows.
+
+        :param extension: file extension to register the parser for (tiff or tif).
+        :return: Parser
+        """
+
+        return ParserFactory.create(extension, TiffImage, write_tiff)
+
+    @staticmethod
+    def create_las() -> Parser:
+        """
+        Returns an uncompressed .las (LAS 1.2-1.4, point formats 0-3) file oriented Parser instance.
+
+        Reading scales the coordinates into an Open3D PointCloud. Writing quantizes PointCloud and CompactCloud
+        data, and writes LasPoints records as they are.
+
+        :return: Parser
+        """
+
+        return ParserFactory.create("las", read_las, write_las)
+
+    @staticmethod
+    def create_las_memmap() -> Parser:
+        """
+        Returns an uncompressed .las file oriented Parser instance.
+
+        Reading maps the point records into memory (see LasPoints), the coordinates are scaled only when accessed.
+
+        :return: Parser
+        """
+
+        return ParserFactory.create("las_memmap", read_las_memmap, write_las)
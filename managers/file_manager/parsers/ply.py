@@ -0,0 +1,490 @@
+from __future__ import annotations
+
+from io import SEEK_END
+from typing import TYPE_CHECKING, Any, BinaryIO, List, Optional, Tuple
+
+from framework import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+    import open3d as o3d  # type: ignore
+    from numpy import ndarray, dtype
+    from numpy.lib import recfunctions
+else:
+    np = lazy_import("numpy")
+    o3d = lazy_import("open3d")
+    recfunctions = lazy_import("numpy.lib.recfunctions")
+
+
+# PLY scalar type names (both the original and the sized ones) mapped to little-endian numpy types.
+PLY_TYPES = {
+    "char": "i1",
+    "uchar": "u1",
+    "short": "<i2",
+    "ushort": "<u2",
+    "int": "<i4",
+    "uint": "<u4",
+    "float": "<f4",
+    "double": "<f8",
+    "int8": "i1",
+    "uint8": "u1",
+    "int16": "<i2",
+    "uint16": "<u2",
+    "int32": "<i4",
+    "uint32": "<u4",
+    "float32": "<f4",
+    "float64": "<f8",
+}
+
+# numpy type strings (numpy.dtype.str) mapped to PLY scalar type names.
+PLY_NAMES = {
+    "|i1": "char",
+    "|u1": "uchar",
+    "<i2": "short",
+    "<u2": "ushort",
+    "<i4": "int",
+    "<u4": "uint",
+    "<f4": "float",
+    "<f8": "double",
+}
+
+
+class PlyElement:
+
+    """
+    Description of a single element (e.g. vertex or face) from the PLY header.
+    """
+
+    def __init__(self, name: str, count: int):
+        self.name = name
+        self.count = count
+        self.properties: List[Tuple[str, str]] = []
+        self.has_lists = False
+
+    def dtype(self) -> dtype[Any]:
+
+        """
+        Builds a packed structured numpy type of a single element record.
+
+        :raises: ValueError: if the element contains list properties (its records have no fixed size).
+
+        :return: numpy.dtype
+        """
+
+        if self.has_lists:
+            raise ValueError(f"Element {self.name} has variable-sized records!")
+
+        return np.dtype(self.properties)
+
+
+def read_ply_header(stream: BinaryIO) -> Tuple[str, List[PlyElement], int]:
+
+    """
+    Parses the header of a PLY file.
+
+    :raises: ValueError: if the stream does not contain a valid PLY header.
+
+    :param stream: binary stream positioned at the beginning of the file.
+    :return: format name, list of elements and the length of the header in bytes.
+    """
+
+    if stream.readline().strip() != b"ply":
+        raise ValueError("Not a PLY file!")
+
+    file_format = ""
+    elements: List[PlyElement] = []
+
+    while True:
+        line = stream.readline()
+
+        if not line:
+            raise ValueError("Unexpected end of PLY header!")
+
+        words = line.decode("ascii").split()
+
+        if not words or words[0] in ("comment", "obj_info"):
+            continue
+
+        if words[0] == "end_header":
+            break
+
+        if words[0] == "format":
+            file_format = words[1]
+        elif words[0] == "element":
+            elements.append(PlyElement(words[1], int(words[2])))
+        elif words[0] == "property":
+            if not elements:
+                raise ValueError("PLY property declared outside of an element!")
+
+            if words[1] == "list":
+                elements[-1].has_lists = True
+            elif words[1] in PLY_TYPES:
+                elements[-1].properties.append((words[2], PLY_TYPES[words[1]]))
+            else:
+                raise ValueError(f"Unknown PLY property type {words[1]}!")
+
+    return file_format, elements, stream.tell()
+
+
+class PlyVertices:
+
+    """
+    Array-backed view of the vertex element of a PLY file.
+
+    Stores the vertex records as a structured numpy array (usually a numpy.memmap) and exposes the coordinates,
+    normals and colours as views into it, so no data is copied until it is actually needed.
+    """
+
+    def __init__(self, vertices: ndarray[Any, dtype[Any]]):
+
+        """
+        Constructor method for PlyVertices class.
+
+        :param vertices: structured array of vertex records, containing at least x, y and z fields.
+        """
+
+        if vertices.dtype.names is None or not {"x", "y", "z"}.issubset(
+            vertices.dtype.names
+        ):
+            raise ValueError("Vertices must have x, y and z properties!")
+
+        self.__vertices = vertices
+
+    def __len__(self) -> int:
+        return len(self.__vertices)
+
+    def __getitem__(self, index: slice) -> "PlyVertices":
+        return PlyVertices(self.__vertices[index])
+
+    @property
+    def array(self) -> ndarray[Any, dtype[Any]]:
+
+        """
+        Underlying structured array of vertex records.
+        """
+
+        return self.__vertices
+
+    def fields(self, *names: str) -> Optional[ndarray[Any, dtype[Any]]]:
+
+        """
+        Returns the given fields as an (N, len(names)) array. The result is a view into the records
+        if the fields share the same type and are evenly spaced (which is the case for any common PLY layout).
+
+        :param names: names of the vertex properties.
+        :return: array of the properties or None if any of them is missing.
+        """
+
+        if self.__vertices.dtype.names is None or not set(names).issubset(
+            self.__vertices.dtype.names
+        ):
+            return None
+
+        fields: ndarray[Any, dtype[Any]] = recfunctions.structured_to_unstructured(
+            self.__vertices[list(names)], copy=False
+        )
+
+        return fields
+
+    @property
+    def points(self) -> ndarray[Any, dtype[Any]]:
+        points = self.fields("x", "y", "z")
+        assert points is not None
+
+        return points
+
+    @property
+    def normals(self) -> Optional[ndarray[Any, dtype[Any]]]:
+        return self.fields("nx", "ny", "nz")
+
+    @property
+    def colors(self) -> Optional[ndarray[Any, dtype[Any]]]:
+        return self.fields("red", "green", "blue")
+
+    def to_point_cloud(self) -> o3d.geometry.PointCloud:
+
+        """
+        Copies the vertices into an Open3D PointCloud. Colours are normalized to [0, 1] if stored as integers.
+
+        :return: PointCloud
+        """
+
+        cloud = o3d.geometry.PointCloud()
+        cloud.points = o3d.utility.Vector3dVector(self.points.astype(np.float64))
+
+        if self.normals is not None:
+            cloud.normals = o3d.utility.Vector3dVector(self.normals.astype(np.float64))
+
+        colors = self.colors
+
+        if colors is not None:
+            if np.issubdtype(colors.dtype, np.integer):
+                colors = colors / np.iinfo(colors.dtype).max
+
+            cloud.colors = o3d.utility.Vector3dVector(colors.astype(np.float64))
+
+        return cloud
+
+    @staticmethod
+    def from_point_cloud(
+        cloud: o3d.geometry.PointCloud, exact: bool = False
+    ) -> "PlyVertices":
+
+        """
+        Packs the Open3D PointCloud into vertex records of the same layout, as Open3D itself writes.
+
+        Colours are rounded to 8 bits, unless exact colours are requested: then they are kept as float64
+        in [0, 1], which to_point_cloud restores as they were (Open3D itself reads such colours wrong).
+
+        :param cloud: PointCloud to pack.
+        :param exact: |OPTIONAL| boolean flag to keep the colours at full precision.
+        :return: PlyVertices
+        """
+
+        fields = [("x", "<f8"), ("y", "<f8"), ("z", "<f8")]
+
+        if cloud.has_normals():
+            fields += [("nx", "<f8"), ("ny", "<f8"), ("nz", "<f8")]
+
+        if cloud.has_colors():
+            color = "<f8" if exact else "u1"
+            fields += [("red", color), ("green", color), ("blue", color)]
+
+        vertices = np.empty(len(cloud.points), dtype=np.dtype(fields))
+
+        for name, values in zip("xyz", np.asarray(cloud.points).T):
+            vertices[name] = values
+
+        if cloud.has_normals():
+            for name, values in zip(("nx", "ny", "nz"), np.asarray(cloud.normals).T):
+                vertices[name] = values
+
+        if cloud.has_colors() and exact:
+            for name, values in zip(
+                ("red", "green", "blue"), np.asarray(cloud.colors).T
+            ):
+                vertices[name] = values
+        elif cloud.has_colors():
+            colors = np.rint(np.clip(np.asarray(cloud.colors), 0, 1) * 255)
+
+            for name, values in zip(("red", "green", "blue"), colors.T):
+                vertices[name] = values
+
+        return PlyVertices(vertices)
+
+
+def ply_header(vertices: dtype[Any], count: int, padding: int = 0) -> bytes:
+
+    """
+    Builds a binary little-endian PLY header for a single vertex element.
+
+    :param vertices: structured numpy type of vertex records.
+    :param count: number of vertices.
+    :param padding: number of spaces to pad the header with (used to rewrite the header in place).
+    :return: encoded header.
+    """
+
+    if vertices.names is None or vertices.fields is None:
+        raise ValueError("Vertices must be a structured type!")
+
+    lines = ["ply", "format binary_little_endian 1.0"]
+
+    if padding:
+        lines.append("comment" + " " * padding)
+
+    lines.append(f"element vertex {count}")
+
+    for name in vertices.names:
+        lines.append(f"property {PLY_NAMES[vertices.fields[name][0].str]} {name}")
+
+    lines.append("end_header")
+
+    return ("\n".join(lines) + "\n").encode("ascii")
+
+
+def read_ply(path: str) -> o3d.geometry.PointCloud:
+
+    """
+    Reads a PLY file into an Open3D PointCloud. Open3D reports unreadable files only by a warning
+    and an empty (or a partly read) cloud, so the header is checked first: binary files must hold all
+    the records it declares, and the number of points read must match it.
+
+    :raises: ValueError: if the file is not a PLY file, is truncated or fewer vertices were read
+    than the header declares.
+
+    :param path: path to the file.
+    :return: PointCloud
+    """
+
+    with open(path, "rb") as source:
+        file_format, elements, offset = read_ply_header(source)
+        size = source.seek(0, SEEK_END)
+
+    # records with lists have no fixed length, so such files are not checked.
+    if file_format.startswith("binary") and not any(
+        element.has_lists for element in elements
+    ):
+        required = offset + sum(
+            element.dtype().itemsize * element.count for element in elements
+        )
+
+        if size < required:
+            raise ValueError(f"{path} is truncated: {size} of {required} bytes!")
+
+    declared = sum(element.count for element in elements if element.name == "vertex")
+    cloud = o3d.io.read_point_cloud(path, format="ply")
+
+    if len(cloud.points) != declared:
+        raise ValueError(
+            f"{path} is corrupt: {len(cloud.points)} of {declared} vertices were read!"
+        )
+
+    return cloud
+
+
+def read_ply_memmap(path: str) -> PlyVertices:
+
+    """
+    Maps the vertex element of a binary little-endian PLY file into memory without reading it.
+
+    The mapping is copy-on-write: in-place modifications of the arrays never reach the file.
+
+    :raises: ValueError: if the file is not a binary little-endian PLY or has no vertex element.
+
+    :param path: path to the file.
+    :return: PlyVertices
+    """
+
+    with open(path, "rb") as source:
+        file_format, elements, offset = read_ply_header(source)
+
+    if file_format != "binary_little_endian":
+        raise ValueError(f"{file_format} PLY files can not be memory-mapped!")
+
+    for element in elements:
+        if element.name == "vertex":
+            if not element.count:
+                return PlyVertices(np.empty(0, dtype=element.dtype()))
+
+            return PlyVertices(
+                np.memmap(
+                    path,
+                    dtype=element.dtype(),
+                    mode="c",
+                    offset=offset,
+                    shape=(element.count,),
+                )
+            )
+
+        offset += element.dtype().itemsize * element.count
+
+    raise ValueError(f"No vertex element found in {path}!")
+
+
+def write_ply_binary(path: str, data: PlyVertices | o3d.geometry.PointCloud) -> None:
+
+    """
+    Writes vertices into a binary little-endian PLY file.
+
+    :param path: path to the file.
+    :param data: PlyVertices or PointCloud to write.
+    :return: None
+    """
+
+    if not isinstance(data, PlyVertices):
+        data = PlyVertices.from_point_cloud(data)
+
+    with open(path, "wb") as destination:
+        destination.write(ply_header(data.array.dtype, len(data)))
+        data.array.tofile(destination)
+
+
+class PlyWriter:
+
+    """
+    Incremental binary little-endian PLY writer. Vertices are appended in chunks, so the whole cloud never has
+    to be held in memory. The vertex count in the header is filled in when the writer is closed.
+    """
+
+    # room for the vertex count digits, reserved in the header until the writer is closed.
+    __reserved = 21
+
+    def __init__(self, path: str):
+
+        """
+        Constructor method for PlyWriter class.
+
+        :param path: path to the file to write.
+        """
+
+        self.__path = path
+        self.__stream: Optional[BinaryIO] = None
+        self.__dtype: Optional[dtype[Any]] = None
+        self.__count = 0
+        self.__closed = False
+
+    def __enter__(self) -> "PlyWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    def write(self, vertices: PlyVertices | o3d.geometry.PointCloud) -> None:
+
+        """
+        Appends the vertices to the file. The first written chunk determines the layout of vertex records.
+
+        :raises: ValueError: if the layout of the vertices differs from the one of previous chunks.
+
+        :param vertices: PlyVertices or PointCloud to append.
+        :return: None
+        """
+
+        if self.__closed:
+            raise ValueError("Writing to a closed PlyWriter!")
+
+        if not isinstance(vertices, PlyVertices):
+            vertices = PlyVertices.from_point_cloud(vertices)
+
+        if self.__stream is None:
+            self.__dtype = vertices.array.dtype
+            self.__stream = open(self.__path, "wb")
+            self.__stream.write(ply_header(self.__dtype, 0, PlyWriter.__reserved))
+
+        if vertices.array.dtype != self.__dtype:
+            raise ValueError("Vertices layout differs from the previous chunks!")
+
+        vertices.array.tofile(self.__stream)
+        self.__count += len(vertices)
+
+    def close(self) -> None:
+
+        """
+        Rewrites the header with the final vertex count and closes the file.
+        If nothing was written, an empty cloud (coordinates only) is written.
+
+        :return: None
+        """
+
+        if self.__closed:
+            return
+
+        if self.__stream is None:
+            self.write(
+                PlyVertices(
+                    np.empty(0, dtype=[("x", "<f8"), ("y", "<f8"), ("z", "<f8")])
+                )
+            )
+
+        assert self.__stream is not None and self.__dtype is not None
+
+        padding = PlyWriter.__reserved - (len(str(self.__count)) - 1)
+
+        self.__stream.seek(0)
+        self.__stream.write(ply_header(self.__dtype, self.__count, padding))
+        self.__stream.close()
+        self.__closed = True
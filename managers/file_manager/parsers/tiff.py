@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import zlib
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Optional, Tuple
+
+from framework import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy import ndarray
+else:
+    np = lazy_import("numpy")
+
+
+# TIFF (and GeoTIFF) tags, used by the reader, mapped to the names of the values.
+TIFF_TAGS = {
+    256: "width",
+    257: "height",
+    258: "bits",
+    259: "compression",
+    273: "strip_offsets",
+    277: "samples",
+    278: "rows_per_strip",
+    279: "strip_counts",
+    284: "planar",
+    317: "predictor",
+    322: "tile_width",
+    323: "tile_height",
+    324: "tile_offsets",
+    325: "tile_counts",
+    339: "sample_format",
+    33550: "pixel_scale",
+    33922: "tiepoint",
+    34264: "transformation",
+    34735: "geo_keys",
+}
+
+# TIFF field types mapped to numpy types (without the byte order) and the number of numbers per value.
+FIELD_TYPES = {
+    1: ("u1", 1),
+    2: ("u1", 1),
+    3: ("u2", 1),
+    4: ("u4", 1),
+    5: ("u4", 2),
+    6: ("i1", 1),
+    7: ("u1", 1),
+    8: ("i2", 1),
+    9: ("i4", 1),
+    10: ("i4", 2),
+    11: ("f4", 1),
+    12: ("f8", 1),
+    16: ("u8", 1),
+    17: ("i8", 1),
+    18: ("u8", 1),
+}
+
+# TIFF SampleFormat values mapped to numpy type kinds.
+SAMPLE_KINDS = {1: "u", 2: "i", 3: "f"}
+
+# supported Compression values: none, Adobe deflate and the old deflate code.
+COMPRESSIONS = {1: "none", 8: "deflate", 32946: "deflate"}
+
+# GeoTIFF GTRasterTypeGeoKey and its RasterPixelIsPoint value.
+RASTER_TYPE_KEY = 1025
+PIXEL_IS_POINT = 2
+
+
+def read_tiff_tags(stream: BinaryIO) -> Tuple[str, Dict[str, List[Any]]]:
+
+    """
+    Reads the tags of the first image (IFD) of a classic or a BigTIFF file.
+
+    :raises: ValueError: if the file is not a TIFF file.
+
+    :param stream: binary stream, positioned at the beginning of the file.
+    :return: byte order ("<" or ">") and the known tags (see TIFF_TAGS) with their values.
+    """
+
+    header = stream.read(16)
+    orders = {b"II": "<", b"MM": ">"}
+
+    if header[:2] not in orders:
+        raise ValueError("Not a TIFF file!")
+
+    order = orders[header[:2]]
+    version = int(np.frombuffer(header, order + "u2", 1, 2)[0])
+
+    if version not in (42, 43):
+        raise ValueError(f"Unknown TIFF version {version}!")
+
+    # classic TIFF uses 4-byte counts and offsets, BigTIFF (version 43) uses 8-byte ones.
+    big = version == 43
+    size, count_type = (8, order + "u8") if big else (4, order + "u4")
+    offset = int(np.frombuffer(header, count_type, 1, 8 if big else 4)[0])
+
+    stream.seek(offset)
+    entries_type = np.dtype(count_type if big else order + "u2")
+    entries = int(np.frombuffer(stream.read(entries_type.itemsize), entries_type)[0])
+    entry = np.dtype(
+        [
+            ("tag", order + "u2"),
+            ("type", order + "u2"),
+            ("count", count_type),
+            ("value", f"V{size}"),
+        ]
+    )
+    table = np.frombuffer(stream.read(entries * entry.itemsize), entry)
+
+    tags: Dict[str, List[Any]] = {}
+
+    for tag, field, count, value in table.tolist():
+        if tag not in TIFF_TAGS or field not in FIELD_TYPES:
+            continue
+
+        kind, numbers = FIELD_TYPES[field]
+        values = np.dtype(order + kind)
+        length = count * numbers * values.itemsize
+
+        # values, which fit into the entry, are stored in place of the offset.
+        if length <= size:
+            raw = bytes(value)[:length]
+        else:
+            stream.seek(int(np.frombuffer(value, count_type)[0]))
+            raw = stream.read(length)
+
+        tags[TIFF_TAGS[tag]] = np.frombuffer(raw, values).tolist()
+
+    return order, tags
+
+
+def write_tiff(path: str, data: Any) -> None:
+
+    """
+    Placeholder writer for the TIFF Parser: TIFF images are only read.
+
+    :raises: ValueError: always.
+    """
+
+    raise ValueError(f"Writing TIFF files is not supported! (Couldn't write {path})")
+
+
+class TiffImage:
+
+    """
+    Lazily read (Geo)TIFF raster.
+
+    Only the tags are parsed on creation. Pixels are read by windows (see window), touching only the strips
+    or tiles, which overlap the window: uncompressed ones are memory-mapped, deflated ones are read and unpacked.
+    """
+
+    def __init__(self, path: str):
+
+        """
+        Constructor method for TiffImage class objects.
+
+        :raises: ValueError: if the file is not a TIFF file or uses an unsupported layout.
+
+        :param path: path to the .tiff file.
+        """
+
+        with open(path, "rb") as stream:
+            order, tags = read_tiff_tags(stream)
+
+        self.__path = path
+        self.__width = int(tags["width"][0])
+        self.__height = int(tags["height"][0])
+        self.__samples = int(tags.get("samples", [1])[0])
+
+        bits = set(tags.get("bits", [1]))
+        kind = SAMPLE_KINDS.get(int(tags.get("sample_format", [1])[0]))
+
+        if len(bits) != 1 or bits.pop() not in (8, 16, 32, 64) or kind is None:
+            raise ValueError(
+                "Only 8/16/32/64-bit integer or float samples are supported!"
+            )
+
+        self.__dtype = np.dtype(f"{order}{kind}{tags['bits'][0] // 8}")
+
+        if self.__samples > 1 and tags.get("planar", [1])[0] != 1:
+            raise ValueError("Only interleaved (chunky) TIFF images are supported!")
+
+        self.__compression = int(tags.get("compression", [1])[0])
+        self.__predictor = int(tags.get("predictor", [1])[0])
+
+        if self.__compression not in COMPRESSIONS or self.__predictor not in (1, 2):
+            raise ValueError(
+                f"Unsupported TIFF compression {self.__compression} (predictor {self.__predictor})!"
+            )
+
+        # strips are handled as tiles spanning the whole width of the image.
+        self.__tiled = "tile_offsets" in tags
+
+        if self.__tiled:
+            self.__chunk = (int(tags["tile_height"][0]), int(tags["tile_width"][0]))
+            offsets, counts = tags["tile_offsets"], tags["tile_counts"]
+        else:
+            rows = int(tags.get("rows_per_strip", [self.__height])[0])
+            self.__chunk = (min(rows, self.__height), self.__width)
+            offsets, counts = tags["strip_offsets"], tags["strip_counts"]
+
+        self.__offsets = np.asarray(offsets, dtype=np.int64)
+        self.__counts = np.asarray(counts, dtype=np.int64)
+        self.__chunks_across = -(-self.__width // self.__chunk[1])
+        self.__map: Optional[np.memmap[Any, np.dtype[Any]]] = None
+        self.__transform = TiffImage.geotransform(tags)
+
+    @property
+    def width(self) -> int:
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        return self.__height
+
+    @property
+    def samples(self) -> int:
+        return self.__samples
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        return self.__dtype
+
+    @property
+    def transform(self) -> Optional[ndarray[Any, np.dtype[Any]]]:
+
+        """
+        Affine transformation from raster to world coordinates: [x, y] = transform @ [column, row, 1].
+        Raster coordinates are continuous, with the corner of the image at (0, 0) and pixel centres at halves.
+
+        :return: 2x3 matrix, or None if the image is not georeferenced.
+        """
+
+        return self.__transform
+
+    @staticmethod
+    def geotransform(
+        tags: Dict[str, List[Any]]
+    ) -> Optional[ndarray[Any, np.dtype[Any]]]:
+
+        """
+        Builds the raster to world transformation from the GeoTIFF tags.
+
+        :param tags: tags of the image, as returned by read_tiff_tags.
+        :return: 2x3 matrix, or None if the image is not georeferenced.
+        """
+
+        if "transformation" in tags:
+            matrix = np.asarray(tags["transformation"], dtype=np.float64).reshape(4, 4)
+            transform = matrix[:2, [0, 1, 3]]
+        elif "pixel_scale" in tags and "tiepoint" in tags:
+            column, row, _, x, y, _ = tags["tiepoint"][:6]
+            scale_x, scale_y = tags["pixel_scale"][:2]
+            transform = np.array(
+                [
+                    [scale_x, 0.0, x - column * scale_x],
+                    [0.0, -scale_y, y + row * scale_y],
+                ]
+            )
+        else:
+            return None
+
+        keys = tags.get("geo_keys", [])
+
+        # with RasterPixelIsPoint the transformation refers to the pixel centres, not to their corners.
+        for index in range(4, len(keys) - 3, 4):
+            if keys[index] == RASTER_TYPE_KEY and keys[index + 3] == PIXEL_IS_POINT:
+                transform[:, 2] -= transform[:, :2] @ [0.5, 0.5]
+
+        return transform
+
+    def raster_coordinates(
+        self, x: ndarray[Any, np.dtype[Any]], y: ndarray[Any, np.dtype[Any]]
+    ) -> Tuple[ndarray[Any, np.dtype[Any]], ndarray[Any, np.dtype[Any]]]:
+
+        """
+        Converts world coordinates to continuous raster coordinates (see transform).
+
+        :raises: ValueError: if the image is not georeferenced.
+
+        :param x: world x coordinates.
+        :param y: world y coordinates.
+        :return: columns and rows.
+        """
+
+        if self.__transform is None:
+            raise ValueError(f"{self.__path} is not georeferenced!")
+
+        inverse = np.linalg.inv(self.__transform[:, :2])
+        world = np.stack((x, y)) - self.__transform[:, 2:]
+        columns, rows = inverse @ world
+
+        return columns, rows
+
+    def window(
+        self, left: int, top: int, right: int, bottom: int
+    ) -> ndarray[Any, np.dtype[Any]]:
+
+        """
+        Reads a rectangular part of the image. Only the strips or tiles overlapping it are accessed.
+
+        :param left: first column.
+        :param top: first row.
+        :param right: column after the last one.
+        :param bottom: row after the last one.
+        :return: array of (rows, columns, samples) shape.
+        """
+
+        left, top = max(left, 0), max(top, 0)
+        right, bottom = min(right, self.__width), min(bottom, self.__height)
+        result = np.empty(
+            (max(bottom - top, 0), max(right - left, 0), self.__samples), self.__dtype
+        )
+
+        if not result.size:
+            return result
+
+        height, width = self.__chunk
+
+        for chunk_row in range(top // height, (bottom - 1) // height + 1):
+            for chunk_column in range(left // width, (right - 1) // width + 1):
+                # tiles are padded to the full size, while the last strip holds only the remaining rows.
+                chunk = self.__read_chunk(
+                    chunk_row * self.__chunks_across + chunk_column,
+                    height
+                    if self.__tiled
+                    else min(height, self.__height - chunk_row * height),
+                )
+                row, column = chunk_row * height, chunk_column * width
+
+                rows = slice(max(top - row, 0), min(bottom - row, height))
+                columns = slice(max(left - column, 0), min(right - column, width))
+                result[
+                    row + rows.start - top : row + rows.stop - top,
+                    column + columns.start - left : column + columns.stop - left,
+                ] = chunk[rows, columns]
+
+        return result
+
+    def __read_chunk(self, index: int, rows: int) -> ndarray[Any, np.dtype[Any]]:
+
+        """
+        Reads a single strip or tile.
+
+        :param index: index of the strip or tile.
+        :param rows: number of rows stored in it.
+        :return: array of (rows, chunk width, samples) shape.
+        """
+
+        offset, count = int(self.__offsets[index]), int(self.__counts[index])
+        shape = (rows, self.__chunk[1], self.__samples)
+
+        if COMPRESSIONS[self.__compression] == "none":
+            if self.__map is None:
+                self.__map = np.memmap(self.__path, dtype=np.uint8, mode="r")
+
+            size = int(np.prod(shape)) * self.__dtype.itemsize
+            return self.__map[offset : offset + size].view(self.__dtype).reshape(shape)
+
+        with open(self.__path, "rb") as stream:
+            stream.seek(offset)
+            raw = zlib.decompress(stream.read(count))
+
+        chunk = np.frombuffer(raw, self.__dtype, int(np.prod(shape))).reshape(shape)
+
+        # horizontal differencing: every sample is stored as the difference from the one on its left.
+        if self.__predictor == 2:
+            chunk = np.cumsum(chunk, axis=1, dtype=self.__dtype)
+
+        return chunk
@@ -0,0 +1,4 @@
+from .index_base import INeighbourIndex
+from .neighbour_index import NeighbourIndex, QUERY_BATCH
+
+__all__ = ["INeighbourIndex", "NeighbourIndex", "QUERY_BATCH"]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Tuple
+
+if TYPE_CHECKING:
+    from numpy import ndarray, dtype
+
+
+class INeighbourIndex(ABC):
+
+    """
+    Interface for the spatial index over the points of a cloud for k nearest neighbour queries.
+
+    Built once per cloud, it is shared by the neighbourhood operations (see Model.task, plugins tagged
+    "neighbours").
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Returns the number of the indexed points.
+
+        :return: int
+        """
+
+        pass
+
+    @property
+    @abstractmethod
+    def points(self) -> ndarray[Any, dtype[Any]]:
+        """
+        Returns the (N, 3) float64 coordinates of the indexed points.
+
+        :return: ndarray
+        """
+
+        pass
+
+    @abstractmethod
+    def query(
+        self, queries: ndarray[Any, dtype[Any]], k: int
+    ) -> Tuple[ndarray[Any, dtype[Any]], ndarray[Any, dtype[Any]]]:
+        """
+        Finds the k nearest indexed points of every query point.
+
+        :param queries: (M, 3) coordinates of the query points.
+        :param k: number of neighbours, at most the number of indexed points.
+        :return: (M, k) indices of the neighbours and (M, k) distances to them, ascending.
+        """
+
+        pass
+
+    @abstractmethod
+    def knn(self, k: int) -> Tuple[ndarray[Any, dtype[Any]], ndarray[Any, dtype[Any]]]:
+        """
+        Finds the k nearest neighbours of every indexed point, the point itself excluded.
+        Fewer neighbours are found, if the cloud has no more than k points.
+
+        :param k: number of neighbours.
+        :return: (N, k) indices of the neighbours and (N, k) distances to them, ascending.
+        """
+
+        pass
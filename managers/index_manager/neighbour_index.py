@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+from framework import lazy_import
+from .index_base import INeighbourIndex
+
+if TYPE_CHECKING:
+    import numpy as np
+    import open3d as o3d  # type: ignore
+    from numpy import ndarray, dtype
+else:
+    np = lazy_import("numpy")
+    o3d = lazy_import("open3d")
+
+
+# neighbours are queried in batches of this many points, the batches are split between the threads.
+QUERY_BATCH = 1 << 16
+
+
+class NeighbourIndex(INeighbourIndex):
+
+    """
+    Concrete implementation of INeighbourIndex interface over the KD-tree of Open3D.
+
+    The neighbours of the indexed points are cached for the largest k queried so far,
+    so the following queries of the same or smaller k cost a slice.
+    """
+
+    def __init__(self, points: ndarray[Any, dtype[Any]], workers: Optional[int] = None):
+
+        """
+        Constructor method for NeighbourIndex class.
+
+        :param points: (N, 3) coordinates of the points to index.
+        :param workers: |OPTIONAL| number of threads to query in (all the CPUs by default).
+        """
+
+        self.__points = np.ascontiguousarray(points, dtype=np.float64)
+        self.__workers = workers or cpu_count() or 1
+
+        self.__search = o3d.core.nns.NearestNeighborSearch(
+            o3d.core.Tensor(self.__points)
+        )
+        self.__search.knn_index()
+
+        self.__indices: Optional[ndarray[Any, dtype[Any]]] = None
+        self.__distances: Optional[ndarray[Any, dtype[Any]]] = None
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__points)
+
+    @property
+    def points(self) -> ndarray[Any, dtype[Any]]:
+        return self.__points
+
+    def query(
+        self, queries: ndarray[Any, dtype[Any]], k: int
+    ) -> Tuple[ndarray[Any, dtype[Any]], ndarray[Any, dtype[Any]]]:
+        queries = np.ascontiguousarray(queries, dtype=np.float64)
+        indices = np.empty((len(queries), k), dtype=np.int64)
+        distances = np.empty((len(queries), k))
+
+        def query_batch(start: int) -> None:
+            batch = slice(start, start + QUERY_BATCH)
+            found, squared = self.__search.knn_search(
+                o3d.core.Tensor(queries[batch]), k
+            )
+            indices[batch] = found.numpy()
+            distances[batch] = np.sqrt(squared.numpy())
+
+        # the batches are split between the threads by point range.
+        starts = range(0, len(queries), QUERY_BATCH)
+
+        if k and len(starts) > 1 and self.__workers > 1:
+            with ThreadPoolExecutor(self.__workers) as pool:
+                list(pool.map(query_batch, starts))
+        elif k:
+            for start in starts:
+                query_batch(start)
+
+        return indices, distances
+
+    def knn(self, k: int) -> Tuple[ndarray[Any, dtype[Any]], ndarray[Any, dtype[Any]]]:
+        k = min(k, len(self) - 1) if len(self) else 0
+
+        with self.__lock:
+            indices, distances = self.__indices, self.__distances
+
+            if indices is None or distances is None or indices.shape[1] < k:
+                indices, distances = self.query(self.__points, k + 1)
+
+                # the nearest point found is the query point itself.
+                indices, distances = indices[:, 1:], distances[:, 1:]
+                self.__indices, self.__distances = indices, distances
+
+        return indices[:, :k], distances[:, :k]
@@ -1,6 +1,9 @@
+from importlib.util import find_spec
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 from framework import ITarget
+from ..file_manager import FileManager
 from .plugin_registry_base import IPluginRegistry, PluginInfo
 from .plugin_wrapper import PluginFactory, IPlugin
 
@@ -17,9 +20,25 @@ class PluginRegistry(IPluginRegistry):
     def add_plugin(self, name: str, package: Optional[str] = None) -> None:
         self.__plugins[name] = PluginFactory.make_plugin(name, package)
 
+    def discover(self, package: str = "plugins") -> None:
+        spec = find_spec(package)
+
+        if spec is None or not spec.submodule_search_locations:
+            raise ValueError(f"Package {package} was not found!")
+
+        manifest = FileManager().read(
+            str(Path(spec.submodule_search_locations[0]) / "manifest.yml")
+        )
+
+        for name in manifest["plugins"]:
+            self.__plugins[name] = PluginFactory.make_lazy_plugin(name, package)
+
     def set_target(self, target: ITarget) -> None:
         self.__target = target
 
+    def copy(self) -> "PluginRegistry":
+        return PluginRegistry(self.__plugins)
+
     def supported_plugins(self) -> List[str]:
         return list(self.__plugins.keys())
 
@@ -31,6 +50,8 @@ class PluginRegistry(IPluginRegistry):
             plugin,
             self.__plugins[plugin].get_help(),
             self.__plugins[plugin].get_signature(),
+            self.__plugins[plugin].get_tags(),
+            self.__plugins[plugin].get_hooks(),
         )
 
     def invoke(self, plugin: str, *args: List[Any], **kwargs: Dict[str, Any]) -> None:
@@ -40,4 +61,5 @@ class PluginRegistry(IPluginRegistry):
         if self.__target is None:
             raise TypeError("No target for plugin invocation!")
 
+        # the call is recorded by the plugin itself (see Plugin.execute), so it is counted once.
         self.__plugins[plugin].execute(self.__target, *args, **kwargs)
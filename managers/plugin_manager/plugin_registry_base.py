@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from inspect import Signature
-from typing import Any, List, Dict, Optional
+from typing import Any, Callable, List, Dict, FrozenSet, Optional
 
 from framework import ITarget
 
@@ -15,6 +15,8 @@ class PluginInfo:
     name: str
     desc: str
     signature: Signature
+    tags: FrozenSet[str] = field(default_factory=frozenset)
+    hooks: Dict[str, Callable[..., Any]] = field(default_factory=dict)
 
 
 class IPluginRegistry(ABC):
@@ -36,6 +38,20 @@ class IPluginRegistry(ABC):
 
         pass
 
+    @abstractmethod
+    def discover(self, package: str = "plugins") -> None:
+        """
+        Registers every plugin listed in the manifest.yml file of the given package, without importing the plugin
+        modules: each module is imported on the first use of its plugin.
+
+        :raises: ValueError: if the package or its manifest can not be found.
+
+        :param package: name of the package with the plugins.
+        :return: None
+        """
+
+        pass
+
     @abstractmethod
     def invoke(self, plugin: str, *args: List[Any], **kwargs: Dict[str, Any]) -> None:
         """
@@ -82,3 +98,13 @@ class IPluginRegistry(ABC):
         :return: None
         """
         pass
+
+    @abstractmethod
+    def copy(self) -> "IPluginRegistry":
+        """
+        Returns a registry sharing the registered plugins, with a target of its own. Allows several targets
+        to invoke the plugins concurrently without loading them again.
+
+        :return: IPluginRegistry instance.
+        """
+        pass
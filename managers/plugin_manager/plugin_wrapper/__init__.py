@@ -1,5 +1,6 @@
 from .plugin_base import IPlugin, IPluginFactory
 from .plugin import Plugin
+from .lazy_plugin import LazyPlugin
 from .plugin_factory import PluginFactory
 
-__all__ = ["IPlugin", "IPluginFactory", "Plugin", "PluginFactory"]
+__all__ = ["IPlugin", "IPluginFactory", "Plugin", "LazyPlugin", "PluginFactory"]
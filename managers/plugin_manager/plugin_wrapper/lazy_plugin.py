@@ -0,0 +1,43 @@
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+from inspect import Signature
+
+from framework import ITarget
+from .plugin_base import IPlugin
+
+
+class LazyPlugin(IPlugin):
+
+    """
+    IPlugin proxy, which creates the actual plugin (importing its module) on first use and caches it.
+    """
+
+    def __init__(self, loader: Callable[[], IPlugin]) -> None:
+        self.__loader = loader
+        self.__plugin: Optional[IPlugin] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.__plugin is not None
+
+    def __resolve(self) -> IPlugin:
+        if self.__plugin is None:
+            self.__plugin = self.__loader()
+
+        return self.__plugin
+
+    def get_signature(self) -> Signature:
+        return self.__resolve().get_signature()
+
+    def get_help(self) -> str:
+        return self.__resolve().get_help()
+
+    def get_tags(self) -> FrozenSet[str]:
+        return self.__resolve().get_tags()
+
+    def get_hooks(self) -> Dict[str, Callable[..., Any]]:
+        return self.__resolve().get_hooks()
+
+    def execute(
+        self, target: ITarget, *args: List[Any], **kwargs: Dict[str, Any]
+    ) -> Any:
+        return self.__resolve().execute(target, *args, **kwargs)
@@ -1,7 +1,8 @@
-from typing import Any, List, Dict, Callable, TypeVar
+from typing import Any, List, Dict, Callable, FrozenSet, Iterable, Optional, TypeVar
 from inspect import signature, Signature
 
 from framework import ITarget
+from ...profile_manager import Profiler
 from .plugin_base import IPlugin
 
 
@@ -9,8 +10,15 @@ PluginCallableReturnType = TypeVar("PluginCallableReturnType")
 
 
 class Plugin(IPlugin):
-    def __init__(self, executable: Callable[[Any], PluginCallableReturnType]) -> None:
+    def __init__(
+        self,
+        executable: Callable[[Any], PluginCallableReturnType],
+        tags: Iterable[str] = (),
+        hooks: Optional[Dict[str, Callable[..., Any]]] = None,
+    ) -> None:
         self.__executable = executable
+        self.__tags = frozenset(tags)
+        self.__hooks = dict(hooks or {})
 
     def get_signature(self) -> Signature:
         return signature(self.__executable)
@@ -18,7 +26,21 @@ class Plugin(IPlugin):
     def get_help(self) -> str:
         return str(self.__executable.__doc__)
 
+    def get_tags(self) -> FrozenSet[str]:
+        return self.__tags
+
+    def get_hooks(self) -> Dict[str, Callable[..., Any]]:
+        return self.__hooks
+
     def execute(
         self, target: ITarget, *args: List[Any], **kwargs: Dict[str, Any]
-    ) -> None:
-        target.receive(self.__executable(*args, **kwargs))
+    ) -> Any:
+        with Profiler().measure(
+            "plugin", self.__executable.__name__, args[0] if args else None
+        ) as measurement:
+            result = self.__executable(*args, **kwargs)
+            measurement.finish(result)
+
+        target.receive(result)
+
+        return result
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
 from inspect import Signature
-from typing import Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
-from framework import ICommand
+from framework import ICommand, ITarget
 
 
 class IPlugin(ICommand):
@@ -32,6 +32,41 @@ class IPlugin(ICommand):
         """
         pass
 
+    @abstractmethod
+    def get_tags(self) -> FrozenSet[str]:
+        """
+        Method to get the properties of the function wrapped by the IPlugin instance, which the pipeline planner
+        relies on (e.g. "pointwise" for functions processing every point independently).
+
+        :return: FrozenSet[str]: set of tags, usually the TAGS attribute of the plugin module.
+        """
+        pass
+
+    @abstractmethod
+    def execute(
+        self, target: ITarget, *args: List[Any], **kwargs: Dict[str, Any]
+    ) -> Any:
+        """
+        Invokes the wrapped function and sends its result to the target.
+
+        :param target: the receiver for the result of the function. (ITarget instance)
+        :param args: list of positional arguments for the function.
+        :param kwargs: dictionary of key-value arguments for the function.
+        :return: Any: the result of the function, also sent to the target.
+        """
+        pass
+
+    @abstractmethod
+    def get_hooks(self) -> Dict[str, Callable[..., Any]]:
+        """
+        Method to get the functions, which the plugin module provides to the pipeline besides the wrapped function
+        (e.g. "matrix" building the affine matrix of an operation tagged "affine"). They are taken from the plugin
+        module, so the core never imports plugin modules itself.
+
+        :return: Dict[str, Callable]: hook names mapped to the functions, usually the HOOKS attribute of the plugin module.
+        """
+        pass
+
 
 class IPluginFactory(ABC):
 
@@ -52,3 +87,17 @@ class IPluginFactory(ABC):
         """
 
         pass
+
+    @staticmethod
+    @abstractmethod
+    def make_lazy_plugin(name: str, package: Optional[str] = None) -> IPlugin:
+        """
+        Static method for IPlugin instance creation, which postpones the import of the plugin module
+        (see make_plugin) until the plugin is first used.
+
+        :param name: string containing the exact name of the module AND target function in the module to wrap.
+        :param package: [Optional] name of the package to import from.
+        :return: IPlugin: instance of the IPlugin wrapper class.
+        """
+
+        pass
@@ -3,6 +3,7 @@ from typing import Optional
 
 from .plugin_base import IPluginFactory, IPlugin
 from .plugin import Plugin
+from .lazy_plugin import LazyPlugin
 
 
 class PluginFactory(IPluginFactory):
@@ -11,15 +12,26 @@ class PluginFactory(IPluginFactory):
     Concrete implementation of IPluginFactory interface.
 
     __plugin_directory: a basic package, containing required plugin function definitions.
+
+    Plugin modules may declare a TAGS list, describing the properties of the plugin function,
+    and a HOOKS dictionary of the functions they provide to the pipeline (see IPlugin.get_hooks).
     """
 
     __plugin_directory = "plugins"
 
     @staticmethod
     def make_plugin(name: str, package: Optional[str] = None) -> IPlugin:
-        if package:
-            return Plugin(import_module(f"{package}.{name}").__dict__[name])
+        if not package:
+            package = PluginFactory.__plugin_directory
+
+        module = import_module(f"{package}.{name}")
 
         return Plugin(
-            import_module(f"{PluginFactory.__plugin_directory}.{name}").__dict__[name]
+            module.__dict__[name],
+            module.__dict__.get("TAGS", ()),
+            module.__dict__.get("HOOKS", {}),
         )
+
+    @staticmethod
+    def make_lazy_plugin(name: str, package: Optional[str] = None) -> IPlugin:
+        return LazyPlugin(lambda: PluginFactory.make_plugin(name, package))
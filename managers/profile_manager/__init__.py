@@ -0,0 +1,4 @@
+from .profile_base import IProfiler, IMeasurement, ProfileRecord
+from .profiler import Profiler
+
+__all__ = ["IProfiler", "IMeasurement", "ProfileRecord", "Profiler"]
@@ -0,0 +1,143 @@
+from abc import abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, ContextManager, Dict, List, Optional
+
+from framework import EmbedSingleton
+
+
+@dataclass(init=True, repr=True)
+class ProfileRecord:
+    """
+    DTO-object describing a single measured call.
+    """
+
+    category: str
+    name: str
+    start: float
+    wall: float
+    cpu: float
+    rss: int
+    points_in: Optional[int] = None
+    points_out: Optional[int] = None
+    pid: int = 0
+    tid: int = 0
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+class IMeasurement(ContextManager["IMeasurement"]):
+
+    """
+    Interface for a running measurement, returned by IProfiler.measure.
+    """
+
+    @abstractmethod
+    def finish(self, result: Any) -> None:
+        """
+        Reports the result of the measured call, so that its size (number of points) is recorded.
+
+        :param result: result of the measured call.
+        :return: None
+        """
+
+        pass
+
+
+class IProfiler(metaclass=EmbedSingleton):
+
+    """
+    Interface for the profiler, recording the cost of plugin invocations and file operations.
+
+    Utilizes Singleton pattern, so every instrumented call reports to the same profiler.
+    """
+
+    @property
+    @abstractmethod
+    def enabled(self) -> bool:
+        """
+        Tells if the calls are being recorded.
+
+        :return: bool
+        """
+
+        pass
+
+    @abstractmethod
+    def enable(self) -> None:
+        """
+        Starts recording the calls.
+
+        :return: None
+        """
+
+        pass
+
+    @abstractmethod
+    def disable(self) -> None:
+        """
+        Stops recording the calls. Records made so far are kept.
+
+        :return: None
+        """
+
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        """
+        Drops all the records.
+
+        :return: None
+        """
+
+        pass
+
+    @abstractmethod
+    def measure(
+        self,
+        category: str,
+        name: str,
+        source: Any = None,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> IMeasurement:
+        """
+        Returns a context manager measuring wall time, CPU time of the calling thread and the change of
+        the resident memory (RSS) of the enclosed block. Does nothing if the profiler is disabled.
+
+        :param category: kind of the call (e.g. plugin, io, import).
+        :param name: name of the call.
+        :param source: input data of the call, to record its size (number of points).
+        :param details: additional information to attach to the record.
+        :return: IMeasurement
+        """
+
+        pass
+
+    @abstractmethod
+    def records(self) -> List[ProfileRecord]:
+        """
+        Returns the records made so far.
+
+        :return: List[ProfileRecord]
+        """
+
+        pass
+
+    @abstractmethod
+    def summary(self) -> Dict[str, Any]:
+        """
+        Aggregates the records by category and name.
+
+        :return: JSON-compatible dictionary.
+        """
+
+        pass
+
+    @abstractmethod
+    def trace(self) -> Dict[str, Any]:
+        """
+        Converts the records into Chrome trace_event format (viewable in chrome://tracing or Perfetto).
+
+        :return: JSON-compatible dictionary.
+        """
+
+        pass
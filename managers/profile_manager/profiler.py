@@ -0,0 +1,231 @@
+from os import getpid, sysconf
+from resource import RUSAGE_SELF, getrusage
+from threading import Lock, get_ident
+from time import perf_counter, thread_time
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Type
+
+from .profile_base import IMeasurement, IProfiler, ProfileRecord
+
+
+def count_points(data: Any) -> Optional[int]:
+
+    """
+    Returns the number of points in the given data (PointCloud or PlyVertices), if it holds any.
+
+    :param data: data to measure.
+    :return: number of points or None.
+    """
+
+    if hasattr(data, "points"):
+        return len(data.points)
+
+    return None
+
+
+PAGE_SIZE = sysconf("SC_PAGE_SIZE")
+
+
+def current_rss() -> int:
+
+    """
+    Returns the current resident set size of the process.
+    Falls back to the peak resident set size, where /proc is not available.
+
+    :return: size in bytes.
+    """
+
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        # ru_maxrss is reported in kilobytes on Linux.
+        return getrusage(RUSAGE_SELF).ru_maxrss * 1024
+
+
+class Measurement(IMeasurement):
+
+    """
+    Concrete implementation of IMeasurement interface. Adds a ProfileRecord to the profiler on exit.
+    """
+
+    def __init__(
+        self,
+        profiler: "Profiler",
+        category: str,
+        name: str,
+        source: Any,
+        details: Optional[Dict[str, Any]],
+    ) -> None:
+        self.__profiler = profiler
+        self.__record = ProfileRecord(
+            category,
+            name,
+            0.0,
+            0.0,
+            0.0,
+            0,
+            count_points(source),
+            pid=getpid(),
+            tid=get_ident(),
+            details=details or {},
+        )
+
+    def __enter__(self) -> IMeasurement:
+        self.__rss = current_rss()
+        self.__cpu = thread_time()
+        self.__record.start = perf_counter()
+
+        return self
+
+    def __exit__(
+        self,
+        kind: Optional[Type[BaseException]],
+        error: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.__record.wall = perf_counter() - self.__record.start
+        self.__record.cpu = thread_time() - self.__cpu
+        self.__record.rss = current_rss() - self.__rss
+
+        if error is not None:
+            self.__record.details["error"] = repr(error)
+
+        self.__profiler.add(self.__record)
+
+    def finish(self, result: Any) -> None:
+        self.__record.points_out = count_points(result)
+
+
+class NoMeasurement(IMeasurement):
+
+    """
+    Measurement of a disabled profiler: does nothing.
+    """
+
+    def __enter__(self) -> IMeasurement:
+        return self
+
+    def __exit__(
+        self,
+        kind: Optional[Type[BaseException]],
+        error: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+    def finish(self, result: Any) -> None:
+        pass
+
+
+class Profiler(IProfiler):
+
+    """
+    Concrete implementation of IProfiler interface. Records are kept in memory.
+
+    Disabled profiler hands out a shared NoMeasurement, so the instrumented calls cost a flag check.
+    """
+
+    __disabled = NoMeasurement()
+
+    def __init__(self) -> None:
+        self.__enabled = False
+        self.__records: List[ProfileRecord] = []
+        self.__lock = Lock()
+        self.__epoch = perf_counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    def enable(self) -> None:
+        self.__enabled = True
+
+    def disable(self) -> None:
+        self.__enabled = False
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__records = []
+
+    def measure(
+        self,
+        category: str,
+        name: str,
+        source: Any = None,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> IMeasurement:
+        if not self.__enabled:
+            return Profiler.__disabled
+
+        return Measurement(self, category, name, source, details)
+
+    def add(self, record: ProfileRecord) -> None:
+        with self.__lock:
+            self.__records.append(record)
+
+    def records(self) -> List[ProfileRecord]:
+        with self.__lock:
+            return list(self.__records)
+
+    def summary(self) -> Dict[str, Any]:
+        operations: Dict[str, Dict[str, Any]] = {}
+
+        for record in self.records():
+            entry = operations.setdefault(
+                f"{record.category}:{record.name}",
+                {
+                    "category": record.category,
+                    "name": record.name,
+                    "calls": 0,
+                    "wall_seconds": 0.0,
+                    "cpu_seconds": 0.0,
+                    "max_rss_delta_bytes": 0,
+                    "points_in": 0,
+                    "points_out": 0,
+                },
+            )
+            entry["calls"] += 1
+            entry["wall_seconds"] += record.wall
+            entry["cpu_seconds"] += record.cpu
+            entry["max_rss_delta_bytes"] = max(entry["max_rss_delta_bytes"], record.rss)
+            entry["points_in"] += record.points_in or 0
+            entry["points_out"] += record.points_out or 0
+
+        return {
+            "operations": sorted(
+                operations.values(), key=lambda entry: -entry["wall_seconds"]
+            )
+        }
+
+    def trace(self) -> Dict[str, Any]:
+        events = []
+
+        for record in self.records():
+            arguments = {
+                "cpu_ms": record.cpu * 1e3,
+                "rss_delta_bytes": record.rss,
+                **record.details,
+            }
+
+            if record.points_in is not None:
+                arguments["points_in"] = record.points_in
+
+            if record.points_out is not None:
+                arguments["points_out"] = record.points_out
+
+            # complete ("X") events with timestamps and durations in microseconds.
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.category,
+                    "ph": "X",
+                    "ts": (record.start - self.__epoch) * 1e6,
+                    "dur": record.wall * 1e6,
+                    "pid": record.pid,
+                    "tid": record.tid,
+                    "args": arguments,
+                }
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
@@ -1,3 +1,6 @@
 from .model import *
+from .pipeline import *
+from .batch import run_batch
+from .server import Server, send
 
-__all__ = ["Model"]
+__all__ = ["Model", "Planner", "Step", "run_batch", "Server", "send"]
@@ -0,0 +1,133 @@
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from importlib import import_module
+from multiprocessing import get_context
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Tuple
+
+from managers import AsyncWriter, PlyVertices
+from .model import Model
+from .pipeline import Planner
+
+
+GROUPS_PER_WORKER = 4
+
+
+def prepare_worker(config: Dict[str | int, Any]) -> None:
+
+    """
+    Initializer of the worker processes. Imports Open3D and the plugins of the operations before the first file,
+    so their import time is not counted in the time of processing it.
+
+    :param config: meta-config dictionary (see Backbone).
+    :return: None
+    """
+
+    import_module("open3d")
+
+    planner = Planner(Model().operation_info)
+    planner.validate(planner.plan(config))
+
+
+def process_files(
+    files: List[Tuple[str, str]], config: Dict[str | int, Any]
+) -> List[Dict[str, Any]]:
+
+    """
+    Runs the operations from the meta-config dictionary on every file of the group and writes the results.
+    Executed in a worker process, so every worker has its own Model instance.
+
+    Results are written in the background, so the next file is processed while the previous one is written.
+
+    :param files: paths to the source point clouds with the paths to write the results to.
+    :param config: meta-config dictionary (see Backbone).
+    :return: manifest entries describing the processed files.
+    """
+
+    model = Model()
+    steps = Planner(model.operation_info).plan(config)
+    entries: List[Dict[str, Any]] = []
+    writes: List[Tuple[Dict[str, Any], Future[None]]] = []
+
+    with AsyncWriter() as writer:
+        for source, destination in files:
+            entry: Dict[str, Any] = {"src": source, "dest": destination}
+            start = perf_counter()
+
+            try:
+                model.load_data(source)
+                model.execute_tasks(steps)
+
+                data = PlyVertices.from_point_cloud(model.data)
+                writes.append((entry, writer.submit(destination, data, "ply_memmap")))
+
+                entry["points"] = len(data)
+            except Exception as error:
+                entry["error"] = f"{type(error).__name__}: {error}"
+
+            entry["seconds"] = round(perf_counter() - start, 3)
+            entries.append(entry)
+
+    for entry, write in writes:
+        failure = write.exception()
+
+        if failure is not None:
+            entry["error"] = f"{type(failure).__name__}: {failure}"
+
+    return entries
+
+
+def run_batch(
+    sources: List[str], directory: str, config: Dict[str | int, Any], workers: int
+) -> Iterator[Dict[str, Any]]:
+
+    """
+    Runs the operations from the meta-config dictionary on every source file in a pool of worker processes.
+    Results are written to the given directory under the names of the sources. The operations are validated
+    once before any file is read.
+
+    :raises: ValueError: if any of the operations is not supported or has invalid parameters.
+
+    :param sources: paths to the source point clouds.
+    :param directory: directory to write the results to.
+    :param config: meta-config dictionary (see Backbone).
+    :param workers: number of worker processes.
+    :return: manifest entries in order of completion (of the groups of files).
+    """
+
+    planner = Planner(Model().operation_info)
+    planner.validate(planner.plan(config))
+
+    destinations: List[str] = []
+
+    for source in sources:
+        name = Path(source).stem
+        destination = str(Path(directory) / f"{name}.ply")
+
+        # tiles from different directories may share the same name.
+        copy = 1
+        while destination in destinations:
+            destination = str(Path(directory) / f"{name}_{copy}.ply")
+            copy += 1
+
+        destinations.append(destination)
+
+    # files are handed out in groups, so the writes overlap the processing inside a group,
+    # while there are still enough groups to balance the load between the workers.
+    files = list(zip(sources, destinations))
+    size = max(len(files) // (workers * GROUPS_PER_WORKER), 1)
+
+    # workers are spawned rather than forked, as forking a process with running Open3D threads is unsafe.
+    with ProcessPoolExecutor(
+        workers,
+        mp_context=get_context("spawn"),
+        initializer=prepare_worker,
+        initargs=(config,),
+    ) as pool:
+        futures = [
+            pool.submit(process_files, files[start : start + size], config)
+            for start in range(0, len(files), size)
+        ]
+
+        for future in as_completed(futures):
+            yield from future.result()
@@ -1,9 +1,29 @@
-from typing import List, Any, Dict, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Any, Dict, Optional, Tuple, Type
 from os.path import join
-import open3d  # type: ignore
 
+from framework import lazy_import
 from .model_base import IModel
-from managers import PluginRegistry, FileManager, PluginInfo
+from managers import (
+    AsyncWriter,
+    CompactCloud,
+    LasPoints,
+    LasWriter,
+    NeighbourIndex,
+    PluginRegistry,
+    FileManager,
+    PluginInfo,
+    PlyVertices,
+    PlyWriter,
+    StepCache,
+)
+from mvp.pipeline import Planner, Step
+
+if TYPE_CHECKING:
+    import open3d  # type: ignore
+else:
+    open3d = lazy_import("open3d")
 
 
 class Model(IModel):
@@ -11,28 +31,370 @@ class Model(IModel):
 
         if registry is None:
             self.__operations = PluginRegistry()
-            self.__operations.add_plugin("rotate")
+            self.__operations.discover()
         else:
             self.__operations = registry
 
         self.__operations.set_target(self)
 
+        self.__planner = Planner(self.__operations.get_info)
+
         self.__output_name = join(".", "output.ply")
+        self.__writer = AsyncWriter()
+
+        self.__data: open3d.geometry.PointCloud | CompactCloud | None = None
+        self.__source: Tuple[str, int, int] | None = None
+
+        # version of the file last parsed and the store it was parsed for, and the parsed file kept aside
+        # once the same file is loaded again (see load_data).
+        self.__original: open3d.geometry.PointCloud | CompactCloud | None = None
+        self.__parsed: Tuple[Tuple[str, int, int], bool, Optional[float]] | None = None
+
+        # compact store: data is kept as a CompactCloud with the given quantization scale (None for float32).
+        self.__compact = False
+        self.__scale: Optional[float] = None
+
+        # operations performed on the data since it was loaded, used to address the cached results.
+        self.__history: List[Step] = []
+        self.__cache: StepCache | None = None
 
-        self.__data: open3d.geometry.PointCloud | None = None
+        # spatial index of the data stored, shared by the neighbourhood operations, and the data it was built for.
+        self.__index: NeighbourIndex | None = None
+        self.__indexed: open3d.geometry.PointCloud | CompactCloud | None = None
 
-    def receive(self, result: open3d.geometry.PointCloud) -> None:
+    @property
+    def data(self) -> open3d.geometry.PointCloud | None:
+        # the compact store is unpacked into a copy, changing it doesn't affect the data stored.
+        if isinstance(self.__data, CompactCloud):
+            return self.__data.to_point_cloud()
+
+        return self.__data
+
+    def receive(self, result: open3d.geometry.PointCloud | CompactCloud) -> None:
         self.__data = result
 
+    def set_compact(self, compact: bool, scale: Optional[float] = None) -> None:
+        self.__compact = compact
+        self.__scale = scale if compact else None
+
+        if self.__data is not None:
+            self.__data = self.__pack(self.data)
+
+    def __pack(
+        self, data: open3d.geometry.PointCloud
+    ) -> open3d.geometry.PointCloud | CompactCloud:
+
+        """
+        Converts the PointCloud into the representation of the data stored.
+
+        :param data: PointCloud to convert.
+        :return: CompactCloud if the compact store is on, the same PointCloud otherwise.
+        """
+
+        if not self.__compact:
+            return data
+
+        return CompactCloud.from_point_cloud(data, self.__scale)
+
+    def __records(self, mode: str) -> PlyVertices | LasPoints:
+
+        """
+        Packs the data stored into the records of the given file format.
+
+        :raises: ValueError: if the format doesn't store point clouds.
+
+        :param mode: file format (ply or las).
+        :return: PlyVertices or LasPoints
+        """
+
+        if mode == "ply":
+            if isinstance(self.__data, CompactCloud):
+                return self.__data.to_vertices()
+
+            return PlyVertices.from_point_cloud(self.__data)
+
+        if mode == "las":
+            if isinstance(self.__data, CompactCloud):
+                return LasPoints.from_compact(self.__data)
+
+            return LasPoints.from_point_cloud(self.__data)
+
+        raise ValueError(f"Point clouds are saved to .ply or .las files only! ({mode})")
+
     def load_data(self, path: str) -> None:
-        self.__data = FileManager().read(path)
+        file = FileManager()
+        version = file.file_version(path)
+        parsed = (version, self.__compact, self.__scale)
+
+        if self.__parsed != parsed:
+            # the first load hands out the parsed file itself, so one-shot runs hold a single cloud.
+            self.__data = self.__original = None
+            self.__data = self.__read(path)
+            self.__parsed = parsed
+        else:
+            # the file is loaded again: from now on it is kept aside, and every load gets a copy of it.
+            if self.__original is None:
+                self.__data = None
+                self.__original = self.__freeze(self.__read(path))
+
+            self.__data = self.__copy(self.__original)
+
+        self.__source = version
+        self.__history = []
+
+    def __read(self, path: str) -> open3d.geometry.PointCloud | CompactCloud:
+
+        """
+        Parses the file into the representation of the data stored.
+
+        :param path: path to the file.
+        :return: PointCloud or CompactCloud
+        """
+
+        file = FileManager()
+        mode = FileManager.get_format(path)
+        data: open3d.geometry.PointCloud | CompactCloud | None = None
+
+        # binary PLY and LAS files are packed straight from the mapped records, without an Open3D copy of the cloud.
+        if self.__compact and mode in ("ply", "las"):
+            try:
+                records: PlyVertices | LasPoints = file.read(path, f"{mode}_memmap")
+            except ValueError:
+                pass
+            else:
+                data = (
+                    records.to_compact(self.__scale)
+                    if isinstance(records, LasPoints)
+                    else CompactCloud.from_vertices(records, self.__scale)
+                )
+
+        if data is None:
+            data = self.__pack(file.read(path))
+
+        return data
+
+    @staticmethod
+    def __freeze(
+        data: open3d.geometry.PointCloud | CompactCloud,
+    ) -> open3d.geometry.PointCloud | CompactCloud:
+
+        """
+        Makes the arrays of a CompactCloud read-only, so the parsed file kept aside is never changed in place.
+
+        :param data: parsed file.
+        :return: the same PointCloud or CompactCloud
+        """
+
+        if isinstance(data, CompactCloud):
+            for values in (data.offsets, data.normals, data.colors):
+                if values is not None:
+                    values.flags.writeable = False
+
+        return data
+
+    @staticmethod
+    def __copy(
+        data: open3d.geometry.PointCloud | CompactCloud,
+    ) -> open3d.geometry.PointCloud | CompactCloud:
+        if isinstance(data, CompactCloud):
+            return data.copy()
+
+        return open3d.geometry.PointCloud(data)
 
     def save_data(self, path: str) -> None:
-        if self.__data is not None:
-            FileManager().write(self.__output_name, self.__data)
+        if self.__data is None:
+            return
+
+        if not path:
+            path = self.__output_name
+
+        mode = FileManager.get_format(path)
+
+        # the points are packed into a single buffer here, so the tasks performed after saving don't affect it.
+        self.__writer.submit(path, self.__records(mode), f"{mode}_memmap")
+
+    def flush(self) -> None:
+        self.__writer.flush()
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self.__writer.close()
 
     def task(self, operation: str, *args: List[Any], **kwargs: Dict[str, Any]) -> None:
-        self.__operations.invoke(operation, *args, **kwargs)
+        if self.__data is None:
+            raise RuntimeError("No data was loaded to perform tasks on!")
+
+        data: Any = self.__data
+        tags = self.operation_info(operation).tags
+
+        # plugins, which don't handle CompactCloud, get an Open3D copy, and their result is packed back.
+        compact = isinstance(data, CompactCloud)
+
+        if compact and "compact" not in tags:
+            data = self.data
+
+        parameters: Dict[str, Any] = dict(kwargs)
+
+        if "neighbours" in tags and parameters.get("index") is None:
+            parameters["index"] = self.__neighbours()
+
+        stored = self.__data
+        self.__operations.invoke(operation, data, *args, **parameters)
+        self.__history.append(Step(operation, dict(kwargs)))
+
+        if compact and not isinstance(self.__data, CompactCloud):
+            self.__data = CompactCloud.from_point_cloud(self.__data, self.__scale)
+
+        # the index stays valid only for the operations, which keep the points intact.
+        if "preserving" in tags and self.__indexed is stored:
+            self.__indexed = self.__data
+        else:
+            self.__index = self.__indexed = None
+
+    def __neighbours(self) -> NeighbourIndex:
+
+        """
+        Returns the spatial index of the data stored, building it if the data has changed since.
+
+        :return: NeighbourIndex
+        """
+
+        data: Any = self.__data
+
+        if self.__index is None or self.__indexed is not data:
+            points = (
+                data.coordinates() if isinstance(data, CompactCloud) else data.points
+            )
+            self.__index = NeighbourIndex(points)
+            self.__indexed = data
+
+        return self.__index
+
+    def set_cache(self, cache: StepCache | None) -> None:
+        self.__cache = cache
+
+    def execute_tasks(self, tasks: List[Step]) -> None:
+        if self.__data is None:
+            raise RuntimeError("No data was loaded to perform tasks on!")
+
+        history = list(self.__history)
+
+        if self.__cache is None or self.__source is None:
+            for step in self.__planner.optimize(tasks):
+                self.task(step.operation, **step.parameters)
+
+            self.__history = history + list(tasks)
+
+            return
+
+        # the data stored is addressed by the source file and the steps requested since loading (as they are,
+        # not optimized), so editing a step keeps the keys of the steps before it.
+        key = self.__cache.source_key(self.__source[0])
+
+        for step in history:
+            key = self.__cache.step_key(key, step.operation, step.parameters)
+
+        # keys[i] addresses the data after the first i tasks, so the longest cached prefix can be resumed from.
+        keys = [key]
+
+        for step in tasks:
+            keys.append(
+                self.__cache.step_key(keys[-1], step.operation, step.parameters)
+            )
+
+        done = 0
+
+        for index in range(len(tasks), 0, -1):
+            if self.__cache.contains(keys[index]):
+                self.__data = self.__pack(self.__cache.load(keys[index]))
+                done = index
+
+                break
+
+        # the rest is optimized after the lookup. A result is stored after the optimized steps, which perform
+        # exactly the first k tasks of the rest, under the key of these tasks.
+        rest = tasks[done:]
+        steps = self.__planner.optimize(rest)
+        checkpoints: Dict[int, int] = {}
+
+        for count in range(1, len(rest) + 1):
+            prefix = self.__planner.optimize(rest[:count])
+
+            if steps[: len(prefix)] == prefix:
+                checkpoints[len(prefix)] = done + count
+
+        for number, step in enumerate(steps, start=1):
+            self.task(step.operation, **step.parameters)
+
+            if number in checkpoints:
+                self.__cache.store(keys[checkpoints[number]], self.__data)
+
+        self.__history = history + list(tasks)
+
+    def stream_tasks(
+        self,
+        source: str,
+        destination: str,
+        tasks: List[Step],
+        chunk_size: int = 1_000_000,
+    ) -> None:
+        writers: Dict[str, Type[PlyWriter] | Type[LasWriter]] = {
+            "ply": PlyWriter,
+            "las": LasWriter,
+        }
+        output = FileManager.get_format(destination)
+
+        if output not in writers:
+            raise ValueError(
+                f"Streamed point clouds are written to .ply or .las files only! ({output})"
+            )
+
+        steps = self.__planner.optimize(tasks)
+
+        if not self.__planner.streamable(steps):
+            raise ValueError("Only point-wise operations can be performed in chunks!")
+
+        # a trailing reducing step accumulates the results of all the chunks, which are written once at the end.
+        accumulator: Any = None
+
+        if steps and self.__planner.is_reducing(steps[-1]):
+            hooks = self.operation_info(steps[-1].operation).hooks
+            accumulator = hooks["accumulator"](**steps[-1].parameters)
+            steps = steps[:-1]
+
+        file = FileManager()
+        mode = "las_memmap" if FileManager.get_format(source) == "las" else "ply_memmap"
+        vertices: PlyVertices | LasPoints = file.read(source, mode)
+
+        if not file.path_exists(file.get_file_location(destination)):
+            file.create_path(file.get_file_location(destination))
+
+        data = self.__data
+        history = list(self.__history)
+
+        try:
+            with writers[output](destination) as writer:
+                for start in range(0, len(vertices), chunk_size):
+                    self.__data = vertices[start : start + chunk_size].to_point_cloud()
+
+                    for step in steps:
+                        self.task(step.operation, **step.parameters)
+
+                    if accumulator is not None:
+                        accumulator.add(self.__data)
+                    elif self.__data.has_points():
+                        writer.write(self.__data)
+
+                if accumulator is not None:
+                    result = accumulator.result()
+
+                    if result.has_points():
+                        writer.write(result)
+        finally:
+            self.__data = data
+            self.__history = history
 
     def operation_info(self, name: str) -> PluginInfo:
         return self.__operations.get_info(name)
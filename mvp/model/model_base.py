@@ -1,14 +1,16 @@
 from abc import abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
-from framework import ITarget, EmbedSingleton
-from managers import PluginInfo
+from framework import ITarget, SessionSingleton
+from managers import PluginInfo, StepCache
+from mvp.pipeline import Step
 
 
-class IModel(ITarget, metaclass=EmbedSingleton):
+class IModel(ITarget, metaclass=SessionSingleton):
 
     """
     Interface for Model object from MVP pattern. Defines the essential data management and processing logic.
+    Every Session owns its own instance (see framework.Session).
     """
 
     @abstractmethod
@@ -16,18 +18,67 @@ class IModel(ITarget, metaclass=EmbedSingleton):
         """
         Loads the PointCloud data from file along the given path. Stores internally.
 
+        Every load starts from the contents of the file. The first load stores the parsed file itself, so
+        a single load holds a single cloud. Once the same file is loaded again, the parsed file is kept aside,
+        and the data stored is a fresh copy of it. The file is parsed again only if its version (path,
+        modification time and size) or the store (see set_compact) changes. Operations are chained by performing them one after another
+        on the data stored (see task, execute_tasks).
+
         :param path: path to the raw data file.
         :return: None
         """
 
         pass
 
+    @abstractmethod
+    def set_compact(self, compact: bool, scale: Optional[float] = None) -> None:
+        """
+        Switches the compact store of the data: points are kept as a CompactCloud (float32 or, given the scale,
+        int32 coordinates relative to a float64 origin, uint8 colours) instead of an Open3D PointCloud.
+
+        Plugins tagged "compact" process the CompactCloud directly, the rest get an Open3D copy of it,
+        and their result is packed back. The data already loaded is converted.
+
+        :param compact: boolean flag to keep the data compact.
+        :param scale: |OPTIONAL| size of the quantization step of the coordinates.
+        :return: None
+        """
+
+        pass
+
     @abstractmethod
     def save_data(self, path: str) -> None:
         """
         Saves the current PointCloud data stored in IModel instance to the file along the given path.
 
-        :param path: path to save file to.
+        The file is written in the background (see flush), so the tasks may go on meanwhile.
+
+        :raises: ValueError: if the path is not a .ply or .las file.
+
+        :param path: path to save file to, "./output.ply" if empty.
+        :return: None
+        """
+
+        pass
+
+    @abstractmethod
+    def flush(self) -> None:
+        """
+        Waits until all the data saved is written.
+
+        :raises: the error of the first failed write, if any.
+        :return: None
+        """
+
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Waits until all the data saved is written and stops the background writing. Called by the Session
+        owning the instance, once it is exited (see framework.Session). Saving afterwards starts it again.
+
+        :raises: the error of the first failed write, if any.
         :return: None
         """
 
@@ -39,6 +90,10 @@ class IModel(ITarget, metaclass=EmbedSingleton):
         Perform a single task of processing the data stored.
         Updates the data stored with the result of the performed operation.
 
+        Plugins tagged "neighbours" get the spatial index of the data (see managers.NeighbourIndex)
+        as the index argument. The index is built on first use and kept until an operation, which is not tagged
+        "preserving" (keeping the points intact), changes the data.
+
         :raises: RuntimeError: if the data was not loaded to IModel instance prior to the task() invocation.
 
         :param operation: name/type of the operation to perform on data.
@@ -49,9 +104,55 @@ class IModel(ITarget, metaclass=EmbedSingleton):
 
         pass
 
-    # @abstractmethod
-    # def execute_tasks(self, tasks: Dict[str, Dict[str, Any]]) -> None:
-    #     pass
+    @abstractmethod
+    def set_cache(self, cache: StepCache | None) -> None:
+        """
+        Sets the on-disk cache for the results of execute_tasks(). Results are addressed by the source file and
+        the steps as they were requested (before optimization), and the execution resumes from the longest
+        sequence of steps with a cached result. The remaining steps are optimized after the lookup, and a result
+        is stored wherever the optimized steps performed so far match a prefix of the requested ones.
+
+        :param cache: StepCache instance or None to disable caching.
+        :return: None
+        """
+
+        pass
+
+    @abstractmethod
+    def execute_tasks(self, tasks: List[Step]) -> None:
+        """
+        Perform a sequence of tasks on the data stored. The sequence is optimized beforehand,
+        so the number of passes over the data may be lower than the number of tasks.
+
+        :raises: RuntimeError: if the data was not loaded to IModel instance prior to the execute_tasks() invocation.
+
+        :param tasks: ordered list of Steps to perform.
+        :return: None
+        """
+
+        pass
+
+    @abstractmethod
+    def stream_tasks(
+        self, source: str, destination: str, tasks: List[Step], chunk_size: int
+    ) -> None:
+        """
+        Perform a sequence of point-wise tasks on a binary .ply file chunk by chunk, writing every processed chunk
+        to the destination file right away. Memory usage depends on the chunk size, not on the size of the file.
+        The sequence may end with a reducing task (e.g. voxel): the results of all the chunks are accumulated
+        and written at the end, so the memory then depends on the size of the accumulated result too. The data stored in IModel instance is left intact.
+
+        :raises: ValueError: if any of the tasks can not be performed on separate chunks of the point cloud,
+        or the destination is neither a .ply nor a .las file.
+
+        :param source: path to the binary .ply or .las file to process.
+        :param destination: path to the .ply or .las file to write results to.
+        :param tasks: ordered list of Steps to perform.
+        :param chunk_size: number of points processed at once.
+        :return: None
+        """
+
+        pass
 
     @abstractmethod
     def operation_info(self, name: str) -> PluginInfo:
@@ -0,0 +1,4 @@
+from .pipeline_base import IPlanner, Step
+from .planner import Planner
+
+__all__ = ["IPlanner", "Planner", "Step"]
@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+
+@dataclass(init=True, repr=True)
+class Step:
+    """
+    DTO-object describing a single operation of the processing pipeline.
+    """
+
+    operation: str
+    parameters: Dict[str, Any]
+
+
+class IPlanner(ABC):
+
+    """
+    Interface for pipeline planner. Turns the operations from configuration file into an ordered list of Steps
+    and rewrites it into an equivalent, but cheaper to execute, one.
+    """
+
+    @abstractmethod
+    def plan(self, config: Dict[str | int, Any]) -> List[Step]:
+        """
+        Builds a list of Steps from the meta-config dictionary (see Backbone), preserving the order of operations.
+
+        :raises: KeyError: if an operation listed in "operations" is missing from the config.
+
+        :param config: meta-config dictionary.
+        :return: List[Step]
+        """
+
+        pass
+
+    @abstractmethod
+    def validate(self, steps: List[Step]) -> None:
+        """
+        Checks that every Step refers to a supported operation and that its parameters match
+        the signature of the operation. Meant to be called before any data is read.
+
+        :raises: ValueError: if any of the Steps is invalid.
+
+        :param steps: Steps to check.
+        :return: None
+        """
+
+        pass
+
+    @abstractmethod
+    def optimize(self, steps: List[Step]) -> List[Step]:
+        """
+        Rewrites the given Steps into an equivalent sequence, which produces the same result with less work.
+
+        :param steps: Steps to optimize.
+        :return: List[Step]
+        """
+
+        pass
+
+    @abstractmethod
+    def streamable(self, steps: List[Step]) -> bool:
+        """
+        Checks if the given Steps can be executed on the point cloud chunk by chunk,
+        i.e. if every Step processes each point independently of the others. The last Step may be
+        a reducing one instead, accumulating the results of all the chunks (see Planner.is_reducing).
+
+        :param steps: Steps to check.
+        :return: boolean check result.
+        """
+
+        pass
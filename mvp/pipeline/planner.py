@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import struct
+from inspect import Parameter
+from math import inf, isfinite
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional
+
+from framework import lazy_import
+from managers import PluginInfo
+from .pipeline_base import IPlanner, Step
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy import ndarray, dtype
+else:
+    np = lazy_import("numpy")
+
+
+# order key of the largest finite float64 value (its bits read as an integer).
+FLOAT64_MAX_KEY = 0x7FEFFFFFFFFFFFFF
+
+
+def upper_threshold_func(height: float, shift: float) -> float:
+
+    """
+    Finds the largest float64 threshold t, such that z + shift <= height (the sum rounded to float64) holds
+    exactly for z <= t. The rounded sum grows monotonically with z, so t is found by a binary search over
+    the finite float64 values in their order.
+
+    :param height: finite height to compare the shifted values with.
+    :param shift: finite shift of the values.
+    :return: threshold, -inf if no finite value passes.
+    """
+
+    def value(key: int) -> float:
+        # keys of the float64 values in ascending order: negative values are mirrored below zero.
+        bits = key if key >= 0 else -key | 1 << 63
+        number: float = struct.unpack("<d", struct.pack("<Q", bits))[0]
+
+        return number
+
+    low, high = -FLOAT64_MAX_KEY, FLOAT64_MAX_KEY
+
+    if value(low) + shift > height:
+        return -inf
+
+    while low < high:
+        middle = (low + high + 1) // 2
+
+        if value(middle) + shift <= height:
+            low = middle
+        else:
+            high = middle - 1
+
+    return value(low)
+
+
+class Planner(IPlanner):
+
+    """
+    Concrete implementation of IPlanner interface.
+
+    Optimizations rely on the tags of the operations, reported by PluginInfo:
+        "affine" - the operation is an affine transformation, its module provides the "matrix" hook
+            building the matrix from the parameters of the operation (see IPlugin.get_hooks);
+        "filter" - the operation removes points without changing the rest;
+        "pointwise" - the operation processes every point independently of the others;
+        "reducing" - the result of the operation may be accumulated chunk by chunk, its module provides
+            the "accumulator" hook creating an object with add(data) and result() methods from the parameters
+            of the operation.
+    """
+
+    # types of plugin parameters, which are checked against the values from configuration file.
+    __checked_types: Dict[str, tuple[type, ...]] = {
+        "bool": (bool,),
+        "int": (int,),
+        "float": (int, float),
+        "str": (str,),
+    }
+
+    def __init__(self, info: Callable[[str], PluginInfo]):
+
+        """
+        Constructor method for Planner class.
+
+        :param info: function returning the PluginInfo of an operation by its name (e.g. Model.operation_info).
+        """
+
+        self.__info = info
+
+    def tags(self, operation: str) -> FrozenSet[str]:
+
+        """
+        Helper method to get the tags of the operation. Unsupported operations have no tags.
+
+        :param operation: name of the operation.
+        :return: FrozenSet[str]
+        """
+
+        try:
+            return self.__info(operation).tags
+        except KeyError:
+            return frozenset()
+
+    def matrix(self, step: Step) -> ndarray[Any, dtype[Any]]:
+
+        """
+        Builds a homogeneous (4x4) matrix, equivalent to the given affine Step.
+
+        :raises: KeyError: if the operation is not an affine transformation with a known matrix.
+
+        :param step: affine Step.
+        :return: 4x4 affine matrix.
+        """
+
+        hooks = self.__info(step.operation).hooks
+
+        if "matrix" not in hooks:
+            raise KeyError(f"{step.operation} is not an affine transformation!")
+
+        matrix: ndarray[Any, dtype[Any]] = hooks["matrix"](**step.parameters)
+
+        return matrix
+
+    def plan(self, config: Dict[str | int, Any]) -> List[Step]:
+        steps = []
+
+        for number in config["operations"]:
+            if number not in config:
+                raise KeyError(f"Operation {number} was not found in config!")
+
+            parameters = dict(config[number])
+            operation = parameters.pop("type")
+
+            steps.append(Step(operation, parameters))
+
+        return steps
+
+    def validate(self, steps: List[Step]) -> None:
+        for number, step in enumerate(steps, start=1):
+            try:
+                signature = self.__info(step.operation).signature
+            except KeyError:
+                raise ValueError(f"Step {number}: {step.operation} is not supported!")
+
+            try:
+                # the first parameter of every plugin is the data it processes.
+                bound = signature.bind(None, **step.parameters)
+            except TypeError as error:
+                raise ValueError(f"Step {number} ({step.operation}): {error}")
+
+            for name, value in list(bound.arguments.items())[1:]:
+                annotation = signature.parameters[name].annotation
+
+                if annotation is Parameter.empty:
+                    continue
+
+                if not isinstance(annotation, str):
+                    annotation = getattr(annotation, "__name__", "")
+
+                expected = Planner.__checked_types.get(annotation)
+
+                if expected is None:
+                    continue
+
+                if not isinstance(value, expected) or (
+                    isinstance(value, bool) and bool not in expected
+                ):
+                    raise ValueError(
+                        f"Step {number} ({step.operation}): {name} must be {annotation}, "
+                        f"got {type(value).__name__}!"
+                    )
+
+    def optimize(self, steps: List[Step]) -> List[Step]:
+        return self.fuse(self.pushdown(steps))
+
+    def streamable(self, steps: List[Step]) -> bool:
+        if steps and self.is_reducing(steps[-1]):
+            steps = steps[:-1]
+
+        return all("pointwise" in self.tags(step.operation) for step in steps)
+
+    def is_reducing(self, step: Step) -> bool:
+
+        """
+        Helper method to check if the Step reduces the points, so that its result may be accumulated
+        chunk by chunk.
+
+        :param step: Step to check.
+        :return: boolean check result.
+        """
+
+        return (
+            "reducing" in self.tags(step.operation)
+            and "accumulator" in self.__info(step.operation).hooks
+        )
+
+    def is_affine(self, step: Step) -> bool:
+
+        """
+        Helper method to check if the Step is an affine transformation with a known matrix.
+
+        :param step: Step to check.
+        :return: boolean check result.
+        """
+
+        return (
+            "affine" in self.tags(step.operation)
+            and "matrix" in self.__info(step.operation).hooks
+        )
+
+    def pushdown(self, steps: List[Step]) -> List[Step]:
+
+        """
+        Moves every filter ahead of the affine transformations preceding it, so that the transformations
+        process only the points left after filtering. A filter is moved only if it can be mapped back through
+        the transformation exactly (see pull_back), so the result stays the same.
+
+        :param steps: Steps to optimize.
+        :return: List[Step]
+        """
+
+        pushed: List[Step] = []
+
+        for step in steps:
+            position = len(pushed)
+
+            if "filter" in self.tags(step.operation):
+                while position and self.is_affine(pushed[position - 1]):
+                    previous = pushed[position - 1]
+                    moved = Planner.pull_back(step, self.matrix(previous))
+
+                    if moved is None:
+                        break
+
+                    step = moved
+                    position -= 1
+
+            pushed.insert(position, step)
+
+        return pushed
+
+    @staticmethod
+    def pull_back(step: Step, matrix: ndarray[Any, dtype[Any]]) -> Optional[Step]:
+
+        """
+        Builds a filter, which, applied before the given affine transformation, removes exactly the same points
+        as the given filter applied after it. Filters are moved only past translations of float64 points,
+        where the rounding of the shifted coordinates can be accounted for. Rotations (any linear part other than
+        the identity) round the coordinates inside Open3D or the compact store, which a filter can not reproduce
+        exactly, so filters stay behind them:
+            clear - the height is replaced by the threshold of the unshifted heights (see upper_threshold_func),
+            a height index built for the shifted points is dropped;
+            cut - corners are cut relative to the bounding box, so only shifts along the z axis keep them.
+
+        :param step: filter Step.
+        :param matrix: 4x4 matrix of the affine transformation.
+        :return: equivalent filter Step or None, if the filter can not be moved past the transformation.
+        """
+
+        linear, shift = matrix[:3, :3], matrix[:3, 3]
+
+        if not np.array_equal(linear, np.identity(3)) or not np.isfinite(shift).all():
+            return None
+
+        if step.operation == "clear":
+            parameters = {
+                name: value
+                for name, value in step.parameters.items()
+                if name != "index"
+            }
+            height, lift = float(parameters["height"]), float(shift[2])
+
+            if not parameters["above"] and not parameters["below"]:
+                return Step("clear", parameters)
+
+            if not isfinite(height):
+                return None
+
+            thresholds = set()
+
+            if parameters["above"]:
+                thresholds.add(upper_threshold_func(height, lift))
+
+            # z + lift >= height is the mirrored z' + (-lift) <= -height for z' = -z, as rounding is symmetric.
+            if parameters["below"]:
+                thresholds.add(-upper_threshold_func(-height, -lift))
+
+            # the points kept by both flags are a single height only if both thresholds meet.
+            if len(thresholds) > 1:
+                return None
+
+            return Step("clear", {**parameters, "height": thresholds.pop()})
+
+        if step.operation == "cut" and shift[0] == 0 and shift[1] == 0:
+            return step
+
+        return None
+
+    def fuse(self, steps: List[Step]) -> List[Step]:
+
+        """
+        Replaces every run of consecutive affine operations (rotate, move, affine) with a single "affine" Step,
+        so that the points are traversed once per run instead of once per operation.
+
+        :param steps: Steps to optimize.
+        :return: List[Step]
+        """
+
+        fused: List[Step] = []
+        run: List[Step] = []
+
+        for step in steps:
+            if self.is_affine(step):
+                run.append(step)
+                continue
+
+            fused.extend(self.compose(run))
+            run = []
+
+            fused.append(step)
+
+        fused.extend(self.compose(run))
+
+        return fused
+
+    def compose(self, run: List[Step]) -> List[Step]:
+
+        """
+        Composes a run of affine Steps into a single "affine" Step with a homogeneous matrix.
+        Runs shorter than two Steps are returned as is.
+
+        :param run: consecutive affine Steps.
+        :return: List[Step]
+        """
+
+        if len(run) < 2:
+            return run
+
+        matrix = np.identity(4)
+
+        for step in run:
+            matrix = self.matrix(step) @ matrix
+
+        return [Step("affine", {"matrix": matrix.tolist()})]
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Dict
+
+from framework import ITarget, lazy_import
+from managers import CloudCache, FileManager, PluginRegistry
+from .pipeline import Planner
+
+if TYPE_CHECKING:
+    import open3d  # type: ignore
+else:
+    open3d = lazy_import("open3d")
+
+
+class Job(ITarget):
+
+    """
+    Target of the plugin invocations of a single job. Every job has its own, so the jobs may run concurrently.
+    """
+
+    def __init__(self, data: open3d.geometry.PointCloud) -> None:
+        self.data = data
+
+    def receive(self, result: open3d.geometry.PointCloud) -> None:
+        self.data = result
+
+
+def job_config(message: Dict[str, Any]) -> Dict[str | int, Any]:
+
+    """
+    Converts the JSON job into the meta-config dictionary (see Backbone). JSON keys are always strings,
+    so the numeric keys of the operations are converted back to numbers.
+
+    :raises: ValueError: if the job lacks the source or the operations.
+
+    :param message: job in the shape of the YAML config.
+    :return: meta-config dictionary.
+    """
+
+    if "src" not in message or "operations" not in message:
+        raise ValueError("Jobs must provide src and operations!")
+
+    return {
+        int(key) if isinstance(key, str) and key.isdigit() else key: value
+        for key, value in message.items()
+    }
+
+
+class Server:
+
+    """
+    Long-running server, which keeps Open3D, the plugins and the recently used source clouds in memory
+    and runs the jobs sent to a Unix socket.
+
+    Messages are JSON objects, one per line, and every message is answered with a JSON line:
+        {"src": "cloud.ply", "dest": "out.ply", "operations": [1], "1": {"type": "move", "x": 1, ...}}
+        {"command": "status"}
+        {"command": "shutdown"}
+
+    Jobs have the shape of the YAML config. The result is written to dest, if given. Jobs of a connection run
+    one after another, jobs of different connections run concurrently on the worker pool.
+    """
+
+    def __init__(self, path: str, budget: int = 4 * 1024**3, workers: int = 1):
+
+        """
+        Constructor method for Server class.
+
+        :param path: path to the Unix socket to listen on.
+        :param budget: memory budget of the cached source clouds in bytes.
+        :param workers: number of jobs run at once.
+        """
+
+        self.__path = path
+        self.__clouds = CloudCache(budget)
+        self.__pool = ThreadPoolExecutor(workers)
+
+        self.__registry = PluginRegistry()
+        self.__registry.discover()
+        self.__planner = Planner(self.__registry.get_info)
+
+        # Open3D is imported and the plugins are loaded up front, so the first job doesn't pay for it.
+        open3d.geometry.PointCloud()
+
+        for plugin in self.__registry.supported_plugins():
+            self.__registry.get_info(plugin)
+
+        self.__server: ThreadingUnixStreamServer | None = None
+
+    def run(self, message: Dict[str, Any]) -> Dict[str, Any]:
+
+        """
+        Runs the job and describes its result.
+
+        :raises: ValueError: if the job is invalid or any of its operations is not supported.
+
+        :param message: job in the shape of the YAML config.
+        :return: dictionary with the number of points in the result and the time taken.
+        """
+
+        start = perf_counter()
+
+        config = job_config(message)
+        steps = self.__planner.plan(config)
+        self.__planner.validate(steps)
+
+        job = Job(self.__clouds.load(config["src"]))
+        operations = self.__registry.copy()
+        operations.set_target(job)
+
+        for step in self.__planner.optimize(steps):
+            operations.invoke(step.operation, job.data, **step.parameters)
+
+        if config.get("dest"):
+            FileManager().write_atomic(config["dest"], job.data)
+
+        return {
+            "status": "ok",
+            "points": len(job.data.points),
+            "seconds": round(perf_counter() - start, 4),
+        }
+
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+
+        """
+        Answers the message: runs the job on the worker pool or performs the command.
+
+        :param message: job or command.
+        :return: answer to send back.
+        """
+
+        command = message.get("command", "run")
+
+        try:
+            if command == "run":
+                return self.__pool.submit(self.run, message).result()
+
+            if command == "status":
+                return {"status": "ok", **self.__clouds.stats()}
+
+            if command == "shutdown" and self.__server is not None:
+                self.__server.shutdown()
+
+                return {"status": "ok"}
+
+            raise ValueError(f"{command} is not supported!")
+        except Exception as error:
+            return {"status": "error", "error": f"{type(error).__name__}: {error}"}
+
+    def serve(self) -> None:
+
+        """
+        Listens on the socket until the shutdown command is received.
+
+        :return: None
+        """
+
+        if os.path.exists(self.__path):
+            os.remove(self.__path)
+
+        server = self
+
+        class Handler(StreamRequestHandler):
+            def handle(self) -> None:
+                for line in self.rfile:
+                    try:
+                        message = json.loads(line)
+                    except ValueError as error:
+                        message = f"Invalid JSON: {error}"
+
+                    if isinstance(message, dict):
+                        answer = server.handle(message)
+                    else:
+                        answer = {
+                            "status": "error",
+                            "error": "Messages must be objects!",
+                        }
+
+                    self.wfile.write(json.dumps(answer).encode() + b"\n")
+
+        with ThreadingUnixStreamServer(self.__path, Handler) as listener:
+            # the socket grants running jobs on behalf of the user, so it is kept private.
+            os.chmod(self.__path, 0o600)
+            listener.daemon_threads = True
+            self.__server = listener
+
+            try:
+                listener.serve_forever()
+            finally:
+                self.__server = None
+                self.__pool.shutdown()
+                os.remove(self.__path)
+
+
+def send(path: str, message: Dict[str, Any]) -> Dict[str, Any]:
+
+    """
+    Sends the message to the server listening on the Unix socket and waits for the answer.
+
+    :param path: path to the Unix socket.
+    :param message: job or command (see Server).
+    :return: answer of the server.
+    """
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        connection.sendall(json.dumps(message).encode() + b"\n")
+
+        with connection.makefile("rb") as answers:
+            answer: Dict[str, Any] = json.loads(answers.readline())
+
+    return answer
@@ -1,7 +1,3 @@
-from .clear import clear
-from .cut import cut
-from .mount import mount
-from .patch import patch
-from .rotate import rotate
-
-__all__ = ["clear", "cut", "mount", "patch", "rotate"]
+# plugin modules are imported on the first use of their plugins (see PluginRegistry.discover),
+# so nothing is imported along with the package.
+__all__: list[str] = []
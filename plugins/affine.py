@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+
+from framework import lazy_import
+from managers import CompactCloud
+
+if TYPE_CHECKING:
+    import numpy as np
+    import open3d as o3d  # type: ignore
+    from numpy import ndarray, dtype
+else:
+    np = lazy_import("numpy")
+    o3d = lazy_import("open3d")
+
+
+TAGS = ["affine", "pointwise", "compact"]
+
+
+def matrix_affine_func(matrix: List[List[float]]) -> ndarray[Any, dtype[Any]]:
+
+    """
+    Converts the parameter of the affine plugin into a homogeneous (4x4) matrix.
+
+    :param matrix: 4x4 affine matrix as nested lists.
+    :return: 4x4 affine matrix.
+    """
+
+    return np.asarray(matrix, dtype=np.float64)
+
+
+# functions provided to the pipeline planner (see IPlugin.get_hooks): the matrix of the operation.
+HOOKS: Dict[str, Callable[..., ndarray[Any, dtype[Any]]]] = {
+    "matrix": matrix_affine_func,
+}
+
+
+def affine(
+    point_cloud: o3d.geometry.PointCloud | CompactCloud, matrix: List[List[float]]
+) -> o3d.geometry.PointCloud:
+
+    """
+    Affine transformation plugin. Applies the given homogeneous matrix to points (and normals) in a single pass.
+
+    :param point_cloud: PointCloud or CompactCloud to transform.
+    :param matrix: 4x4 affine matrix.
+    :return: cloud of the same type
+    """
+
+    point_cloud.transform(np.asarray(matrix, dtype=np.float64))
+
+    return point_cloud
@@ -1,17 +1,146 @@
-import open3d as o3d  # type: ignore
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+from framework import lazy_import
+from managers import CompactCloud
+
+if TYPE_CHECKING:
+    import numpy as np
+    import open3d as o3d  # type: ignore
+    from numpy import ndarray, dtype
+else:
+    np = lazy_import("numpy")
+    o3d = lazy_import("open3d")
+
+
+TAGS = ["filter", "pointwise", "compact"]
+
+
+@dataclass(init=True, repr=False, frozen=True)
+class HeightIndex:
+
+    """
+    Points of a PointCloud ordered by height. Built once by height_index_func, it lets clear
+    answer threshold queries on the same cloud with a binary search instead of a full scan.
+    """
+
+    order: ndarray[Any, dtype[Any]]
+    heights: ndarray[Any, dtype[Any]]
+
+
+def column_func(
+    data: o3d.geometry.PointCloud | CompactCloud, axis: int
+) -> ndarray[Any, dtype[Any]]:
+
+    """
+    Returns the coordinates of the points along the given axis.
+
+    :param data: PointCloud or CompactCloud.
+    :param axis: index of the axis.
+    :return: float64 coordinates (a view for a PointCloud, computed for a CompactCloud).
+    """
+
+    if isinstance(data, CompactCloud):
+        return data.coordinates(axis)
+
+    column: ndarray[Any, dtype[Any]] = np.asarray(data.points)[:, axis]
+
+    return column
+
+
+def height_index_func(data: o3d.geometry.PointCloud | CompactCloud) -> HeightIndex:
+
+    """
+    Sorts the points of the cloud by their z-axis coordinate.
+
+    :param data: PointCloud or CompactCloud to index.
+    :return: HeightIndex
+    """
+
+    heights = column_func(data, 2)
+    order = np.argsort(heights, kind="stable")
+
+    return HeightIndex(order=order, heights=heights[order])
+
+
+def select_func(
+    data: o3d.geometry.PointCloud | CompactCloud, indices: ndarray[Any, dtype[Any]]
+) -> o3d.geometry.PointCloud:
+
+    """
+    Builds a cloud of the given points, taking their normals and colours along.
+    Unlike select_by_index, which walks the whole cloud, only the selected points are copied.
+
+    :param data: PointCloud or CompactCloud to select from.
+    :param indices: ascending indices of the points to keep.
+    :return: cloud of the same type
+    """
+
+    if isinstance(data, CompactCloud):
+        return data.select(indices)
+
+    result = o3d.geometry.PointCloud()
+    result.points = o3d.utility.Vector3dVector(np.asarray(data.points)[indices])
+
+    if data.has_normals():
+        result.normals = o3d.utility.Vector3dVector(np.asarray(data.normals)[indices])
+
+    if data.has_colors():
+        result.colors = o3d.utility.Vector3dVector(np.asarray(data.colors)[indices])
+
+    return result
 
 
 def clear(
-    data: o3d.geometry.PointCloud, height: float, above: bool, below: bool
+    data: o3d.geometry.PointCloud | CompactCloud,
+    height: float,
+    above: bool,
+    below: bool,
+    index: Optional[HeightIndex] = None,
 ) -> o3d.geometry.PointCloud:
     """
-     Dummy function for height-filtering of PointCloud.
+    Height filtering plugin. Removes the points above and/or below the given height.
 
-    :param data: PointCloud to transform.
+    Without an index the z column is scanned once. With an index (see height_index_func) the kept
+    points are found by a binary search, so the query costs O(log n) plus the size of the result.
+
+    :raises: ValueError: if the index was built for a cloud of a different size.
+
+    :param data: PointCloud or CompactCloud to transform.
     :param height: z-axis value to filter by.
     :param above: boolean flag to switch filtering above the given height.
     :param below: boolean flag to switch filtering below the given height.
-    :return: PointCloud
+    :param index: precomputed height index of the cloud.
+    :return: cloud of the same type
     """
 
-    return data
+    if not above and not below:
+        return data
+
+    if index is None:
+        heights = column_func(data, 2)
+        keep = np.ones(len(heights), dtype=bool)
+
+        if above:
+            keep &= heights <= height
+
+        if below:
+            keep &= heights >= height
+
+        return select_func(data, np.flatnonzero(keep))
+
+    if len(index.order) != (
+        len(data) if isinstance(data, CompactCloud) else len(data.points)
+    ):
+        raise ValueError("Height index does not match the point cloud!")
+
+    start = np.searchsorted(index.heights, height, side="left") if below else 0
+    stop = (
+        np.searchsorted(index.heights, height, side="right")
+        if above
+        else len(index.heights)
+    )
+
+    return select_func(data, np.sort(index.order[start:stop]))
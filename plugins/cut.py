@@ -1,18 +1,72 @@
-import open3d as o3d  # type: ignore
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from framework import lazy_import
+from managers import CompactCloud
+from .clear import column_func, select_func
+
+if TYPE_CHECKING:
+    import numpy as np
+    import open3d as o3d  # type: ignore
+else:
+    np = lazy_import("numpy")
+    o3d = lazy_import("open3d")
+
+
+TAGS = ["filter", "compact"]
+
+# cells of the 3x3 grid (row * 3 + column, rows and columns counted from the lower-left corner) at each corner.
+CORNER_CELLS = {"ll": 0, "lr": 2, "ul": 6, "ur": 8}
 
 
 def cut(
-    data: o3d.geometry.PointCloud, ul: bool, ur: bool, ll: bool, lr: bool
+    data: o3d.geometry.PointCloud | CompactCloud,
+    ul: bool,
+    ur: bool,
+    ll: bool,
+    lr: bool,
+    size: float = 0.5,
 ) -> o3d.geometry.PointCloud:
     """
-    Dummy function for cut transformation of PointCloud
+    Corner removal plugin. Removes the points in the selected corners of the XY bounding box.
+
+    Each point is assigned a cell of the 3x3 grid, formed by the corner bands along both axes,
+    and all the selected corners are dropped in a single masked pass.
+
+    :raises: ValueError: if the corner size is not in (0, 0.5].
 
-    :param data: PointCloud to transform.
+    :param data: PointCloud or CompactCloud to transform.
     :param ul: boolean flag for cutting the upper-left corner.
     :param ur: boolean flag for cutting the upper-right corner.
     :param ll: boolean flag for cutting the lower-left corner.
     :param lr: boolean flag for cutting the lower-right corner.
-    :return: PointCloud
+    :param size: size of a corner, as a fraction of the bounding box along each axis (0.5 cuts whole quadrants).
+    :return: cloud of the same type
     """
 
-    return data
+    if not 0 < size <= 0.5:
+        raise ValueError(f"Corner size must be in (0, 0.5], got {size}!")
+
+    selected = {"ul": ul, "ur": ur, "ll": ll, "lr": lr}
+    corners = [CORNER_CELLS[name] for name, flag in selected.items() if flag]
+
+    if not corners or not data.has_points():
+        return data
+
+    columns = [column_func(data, 0), column_func(data, 1)]
+    cells = np.zeros(len(columns[0]), dtype=np.int8)
+
+    # columns are reduced separately: it is several times faster than reducing the strided XY view.
+    for column, weight in zip(columns, (1, 3)):
+        start, stop = column.min(), column.max()
+        low, high = start + size * (stop - start), stop - size * (stop - start)
+
+        # band along the axis: 0 - lower/left, 1 - middle, 2 - upper/right.
+        cells += np.multiply(column >= low, weight, dtype=np.int8)
+        cells += np.multiply(column > high, weight, dtype=np.int8)
+
+    dropped = np.zeros(9, dtype=bool)
+    dropped[corners] = True
+
+    return select_func(data, np.flatnonzero(~dropped[cells]))
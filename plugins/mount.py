@@ -1,13 +1,107 @@
-import open3d as o3d  # type: ignore
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from framework import lazy_import
+from managers import FileManager, TiffImage
+
+if TYPE_CHECKING:
+    import numpy as np
+    import open3d as o3d  # type: ignore
+    from numpy import ndarray, dtype
+else:
+    np = lazy_import("numpy")
+    o3d = lazy_import("open3d")
+
+
+TAGS = ["pointwise", "preserving"]
+
+
+def bilinear_sample_func(
+    image: ndarray[Any, dtype[Any]],
+    columns: ndarray[Any, dtype[Any]],
+    rows: ndarray[Any, dtype[Any]],
+) -> ndarray[Any, dtype[Any]]:
+
+    """
+    Bilinearly interpolates the image at the given continuous raster coordinates (pixel centres at halves).
+    Coordinates beyond the outer pixel centres take the values of the border pixels.
+
+    :param image: array of (rows, columns, samples) shape.
+    :param columns: column coordinates.
+    :param rows: row coordinates.
+    :return: array of (points, samples) shape.
+    """
+
+    height, width = image.shape[:2]
+    u = np.clip(columns - 0.5, 0, width - 1)
+    v = np.clip(rows - 0.5, 0, height - 1)
+
+    left = np.minimum(u.astype(np.int64), max(width - 2, 0))
+    top = np.minimum(v.astype(np.int64), max(height - 2, 0))
+    right = np.minimum(left + 1, width - 1)
+    bottom = np.minimum(top + 1, height - 1)
+
+    du = (u - left)[:, None]
+    dv = (v - top)[:, None]
+    upper = image[top, left] * (1 - du) + image[top, right] * du
+    lower = image[bottom, left] * (1 - du) + image[bottom, right] * du
+
+    result: ndarray[Any, dtype[Any]] = upper * (1 - dv) + lower * dv
+
+    return result
 
 
 def mount(data: o3d.geometry.PointCloud, picture_path: str) -> o3d.geometry.PointCloud:
     """
-     Dummy function for picture embedding of PointCloud.
+    Picture embedding plugin. Colours the points from a georeferenced (GeoTIFF) image, such as an orthophoto.
+
+    Only the window of the image under the cloud is read (see TiffImage.window), so the cost depends on
+    the overlap rather than on the size of the image. Points outside the image keep their colours.
+
+    :raises: ValueError: if the picture is not a supported georeferenced TIFF image.
 
     :param data: PointCloud to transform.
     :param picture_path: path to the .tiff picture to embed.
     :return: PointCloud
     """
 
+    image = FileManager().read(picture_path)
+
+    if not isinstance(image, TiffImage):
+        raise ValueError(f"{picture_path} is not a TIFF image!")
+
+    points = np.asarray(data.points)
+    columns, rows = image.raster_coordinates(points[:, 0], points[:, 1])
+    inside = (columns >= 0) & (columns <= image.width)
+    inside &= (rows >= 0) & (rows <= image.height)
+
+    if not inside.any():
+        return data
+
+    columns, rows = columns[inside], rows[inside]
+
+    # the window covers the pixels around the extreme points, needed for the interpolation.
+    left = int(np.floor(columns.min() - 0.5))
+    top = int(np.floor(rows.min() - 0.5))
+    right = int(np.floor(columns.max() - 0.5)) + 2
+    bottom = int(np.floor(rows.max() - 0.5)) + 2
+    window = image.window(left, top, right, bottom)
+    left, top = max(left, 0), max(top, 0)
+
+    samples = bilinear_sample_func(
+        window.astype(np.float64), columns - left, rows - top
+    )
+
+    if np.issubdtype(image.dtype, np.integer):
+        samples /= np.iinfo(image.dtype).max
+
+    # grayscale images colour the points gray, extra samples (e.g. alpha) are ignored.
+    samples = samples[:, [0, 0, 0]] if image.samples < 3 else samples[:, :3]
+
+    colors = np.asarray(data.colors) if data.has_colors() else np.zeros(points.shape)
+    colors = colors.copy()
+    colors[inside] = np.clip(samples, 0, 1)
+    data.colors = o3d.utility.Vector3dVector(colors)
+
     return data
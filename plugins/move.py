@@ -1,17 +1,61 @@
-import open3d as o3d  # type: ignore
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+from framework import lazy_import
+from managers import CompactCloud
+
+if TYPE_CHECKING:
+    import numpy as np
+    import open3d as o3d  # type: ignore
+    from numpy import ndarray, dtype
+else:
+    np = lazy_import("numpy")
+    o3d = lazy_import("open3d")
+
+
+TAGS = ["affine", "pointwise", "compact"]
+
+
+def translation_affine_func(x: float, y: float, z: float) -> ndarray[Any, dtype[Any]]:
+
+    """
+    Builds a homogeneous (4x4) matrix of the shift transformation.
+
+    :param x: x-axis shift value.
+    :param y: y-axis shift value.
+    :param z: z-axis shift value.
+    :return: 4x4 affine matrix.
+    """
+
+    matrix = np.identity(4)
+    matrix[:3, 3] = (x, y, z)
+
+    return matrix
+
+
+# functions provided to the pipeline planner (see IPlugin.get_hooks): the matrix of the operation.
+HOOKS: Dict[str, Callable[..., ndarray[Any, dtype[Any]]]] = {
+    "matrix": translation_affine_func,
+}
 
 
 def move(
-    data: o3d.geometry.PointCloud, x: float, y: float, z: float
+    data: o3d.geometry.PointCloud | CompactCloud, x: float, y: float, z: float
 ) -> o3d.geometry.PointCloud:
     """
-    Dummy function for shift transformation of PointCloud.
+    Shift transformation plugin. Shifting a CompactCloud changes only its origin.
 
-    :param data: PointCloud to transform.
+    :param data: PointCloud or CompactCloud to transform.
     :param x: x-axis shift value.
     :param y: y-axis shift value.
     :param z: z-axis shift value.
-    :return: PointCloud
+    :return: cloud of the same type
     """
 
+    if isinstance(data, CompactCloud):
+        data.translate((x, y, z))
+    else:
+        data.translate((x, y, z), relative=True)
+
     return data
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from framework import lazy_import
+from managers.index_manager import QUERY_BATCH, NeighbourIndex
+
+if TYPE_CHECKING:
+    import numpy as np
+    import open3d as o3d  # type: ignore
+else:
+    np = lazy_import("numpy")
+    o3d = lazy_import("open3d")
+
+
+TAGS = ["neighbours", "preserving"]
+
+
+def normals(
+    data: o3d.geometry.PointCloud,
+    neighbours: int = 16,
+    index: Optional[NeighbourIndex] = None,
+) -> o3d.geometry.PointCloud:
+    """
+    Normal estimation plugin. The normal of every point is the direction of the least variance of the point
+    and its nearest neighbours (the eigenvector of their covariance with the smallest eigenvalue),
+    oriented upwards, as aerial clouds are scanned from above. The points are left intact.
+
+    :raises: ValueError: if the number of neighbours is less than 2 or the index was built for a cloud
+    of a different size.
+
+    :param data: PointCloud to estimate the normals of.
+    :param neighbours: number of the nearest neighbours to fit a plane to.
+    :param index: precomputed NeighbourIndex of the cloud (see managers.NeighbourIndex).
+    :return: PointCloud
+    """
+
+    if neighbours < 2:
+        raise ValueError(f"Normals need at least 2 neighbours, got {neighbours}!")
+
+    if index is None:
+        index = NeighbourIndex(data.points)
+
+    if len(index) != len(data.points):
+        raise ValueError("Neighbour index does not match the point cloud!")
+
+    points = index.points
+    indices, _ = index.knn(neighbours)
+    estimated = np.tile([0.0, 0.0, 1.0], (len(points), 1))
+
+    if indices.shape[1] < 2:
+        data.normals = o3d.utility.Vector3dVector(estimated)
+
+        return data
+
+    # the neighbourhoods are processed in batches, so the (batch, k, 3) temporaries stay small.
+    for start in range(0, len(points), QUERY_BATCH):
+        batch = slice(start, start + QUERY_BATCH)
+        around = np.concatenate((points[batch, None], points[indices[batch]]), axis=1)
+        around -= around.mean(axis=1, keepdims=True)
+        covariances = np.einsum("nki,nkj->nij", around, around)
+        estimated[batch] = np.linalg.eigh(covariances)[1][:, :, 0]
+
+    estimated[estimated[:, 2] < 0] *= -1
+    data.normals = o3d.utility.Vector3dVector(estimated)
+
+    return data
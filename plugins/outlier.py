@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from framework import lazy_import
+from managers import CompactCloud, NeighbourIndex
+from .clear import select_func
+
+if TYPE_CHECKING:
+    import numpy as np
+    import open3d as o3d  # type: ignore
+else:
+    np = lazy_import("numpy")
+    o3d = lazy_import("open3d")
+
+
+TAGS = ["neighbours", "compact"]
+
+OUTLIER_MODES = ("statistical", "radius")
+
+
+def outlier(
+    data: o3d.geometry.PointCloud | CompactCloud,
+    mode: str = "statistical",
+    neighbours: int = 20,
+    ratio: float = 2.0,
+    radius: float = 1.0,
+    index: Optional[NeighbourIndex] = None,
+) -> o3d.geometry.PointCloud:
+    """
+    Outlier removal plugin.
+
+    "statistical" mode removes the points, whose mean distance to their nearest neighbours exceeds the average
+    of these distances over the cloud by more than ratio standard deviations.
+    "radius" mode removes the points with less than the given number of neighbours within the radius.
+
+    Both modes query the k nearest neighbours, so they share the index (and its cached neighbours)
+    of the cloud, if it is given.
+
+    :raises: ValueError: if the mode is not supported, the parameters are out of range or the index
+    was built for a cloud of a different size.
+
+    :param data: PointCloud or CompactCloud to filter.
+    :param mode: "statistical" or "radius".
+    :param neighbours: number of the nearest neighbours to consider (the minimal one in "radius" mode).
+    :param ratio: number of standard deviations above the average distance to keep ("statistical" mode).
+    :param radius: radius of the neighbourhood ("radius" mode).
+    :param index: precomputed NeighbourIndex of the cloud.
+    :return: cloud of the same type
+    """
+
+    if mode not in OUTLIER_MODES:
+        raise ValueError(f"Outlier mode must be one of {OUTLIER_MODES}, got {mode}!")
+
+    if neighbours < 1 or ratio < 0 or radius <= 0:
+        raise ValueError(
+            "Outlier removal needs at least 1 neighbour, non-negative ratio and positive radius!"
+        )
+
+    if index is None:
+        index = NeighbourIndex(
+            data.coordinates() if isinstance(data, CompactCloud) else data.points
+        )
+
+    if len(index) != (
+        len(data) if isinstance(data, CompactCloud) else len(data.points)
+    ):
+        raise ValueError("Neighbour index does not match the point cloud!")
+
+    _, distances = index.knn(neighbours)
+
+    if mode == "radius":
+        if distances.shape[1] < neighbours:
+            keep = np.zeros(len(index), dtype=bool)
+        else:
+            keep = distances[:, neighbours - 1] <= radius
+    else:
+        if not distances.shape[1]:
+            return data
+
+        means = distances.mean(axis=1)
+        keep = means <= means.mean() + ratio * means.std()
+
+    if keep.all():
+        return data
+
+    return select_func(data, np.flatnonzero(keep))
@@ -1,13 +1,310 @@
-import open3d as o3d  # type: ignore
+from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
-def patch(data: o3d.geometry.PointCloud, degree: int) -> o3d.geometry.PointCloud:
+from framework import lazy_import
+from managers import NeighbourIndex
+
+if TYPE_CHECKING:
+    import numpy as np
+    import open3d as o3d  # type: ignore
+    from numpy import ndarray, dtype
+else:
+    np = lazy_import("numpy")
+    o3d = lazy_import("open3d")
+
+
+# side of a tile in grid cells. Holes of a tile are filled from the points of the tile and its 8 neighbours.
+TILE_CELLS = 64
+
+# only the points closer than this number of cells to an empty cell are searched for neighbours.
+MARGIN_CELLS = 2
+
+# average number of points per grid cell, when the cell size is chosen automatically.
+# Dense enough cells are almost never empty by chance (a Poisson cell with mean 9 is empty with p ~ 1e-4).
+POINTS_PER_CELL = 9
+
+
+def polynomial_terms_func(degree: int) -> List[Tuple[int, int]]:
+
+    """
+    Lists the exponents of the monomials u^i * v^j of a bivariate polynomial of the given degree.
+
+    :param degree: total degree of the polynomial.
+    :return: List[Tuple[int, int]]
+    """
+
+    return [(i, total - i) for total in range(degree + 1) for i in range(total, -1, -1)]
+
+
+def dilate_func(
+    mask: ndarray[Any, dtype[Any]], radius: int
+) -> ndarray[Any, dtype[Any]]:
+
+    """
+    Grows the set cells of a boolean grid by the given number of cells (in the Chebyshev metric).
+
+    :param mask: boolean 2D grid.
+    :param radius: number of cells to grow by.
+    :return: dilated grid.
+    """
+
+    result = mask.copy()
+
+    # a square dilation is separable: the rows are grown first, then the columns.
+    for axis in (0, 1):
+        grown = result.copy()
+
+        for shift in range(1, radius + 1):
+            head = [slice(None)] * 2
+            tail = [slice(None)] * 2
+            head[axis], tail[axis] = slice(shift, None), slice(None, -shift)
+            grown[tuple(head)] |= result[tuple(tail)]
+            grown[tuple(tail)] |= result[tuple(head)]
+
+        result = grown
+
+    return result
+
+
+def enclosed_func(empty: ndarray[Any, dtype[Any]]) -> ndarray[Any, dtype[Any]]:
+
+    """
+    Finds the holes of a boolean grid: the set cells, which are not connected to the border of the grid
+    by set cells (4-connectivity). The cells are labelled by the runs of set cells along the rows,
+    the runs of adjacent rows overlapping each other are merged by minimum label propagation.
+
+    :param empty: boolean 2D grid.
+    :return: boolean grid of the holes.
     """
-     Dummy function for hole interpolation of PointCloud.
+
+    height, width = empty.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = empty
+    steps = np.diff(padded, axis=1)
+
+    # runs in row-major order: the starts and the ends (exclusive) pair up.
+    rows, starts = np.nonzero(steps == 1)
+    ends = np.nonzero(steps == -1)[1]
+
+    if not len(rows):
+        return empty.copy()
+
+    # the keys of the runs never mix the rows, so a run of the next row finds the overlapping runs of its row
+    # as a contiguous range: the runs ending after its start and starting before its end.
+    stride = width + 2
+    lows = np.searchsorted(rows * stride + ends, (rows - 1) * stride + starts, "right")
+    highs = np.searchsorted(rows * stride + starts, (rows - 1) * stride + ends, "left")
+    counts = np.maximum(highs - lows, 0)
+    lower = np.repeat(np.arange(len(rows)), counts)
+    upper = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    upper += np.repeat(lows, counts)
+
+    labels = np.arange(len(rows))
+
+    while True:
+        merged = labels.copy()
+        smallest = np.minimum(labels[lower], labels[upper])
+        np.minimum.at(merged, labels[lower], smallest)
+        np.minimum.at(merged, labels[upper], smallest)
+
+        # every run points to the smallest label of its component found so far.
+        while not np.array_equal(merged, merged[merged]):
+            merged = merged[merged]
+
+        if np.array_equal(merged, labels):
+            break
+
+        labels = merged
+
+    border = (rows == 0) | (rows == height - 1) | (starts == 0) | (ends == width)
+    inner = ~np.isin(labels, labels[border])
+
+    holes = np.zeros((height, width + 1), dtype=np.int8)
+    np.add.at(holes, (rows[inner], starts[inner]), 1)
+    np.add.at(holes, (rows[inner], ends[inner]), -1)
+
+    enclosed: ndarray[Any, dtype[Any]] = np.cumsum(holes, axis=1)[:, :-1] > 0
+
+    return enclosed
+
+
+def patch_tile_func(
+    centres: ndarray[Any, dtype[Any]],
+    points: ndarray[Any, dtype[Any]],
+    colors: Optional[ndarray[Any, dtype[Any]]],
+    degree: int,
+    cell_size: float,
+) -> Tuple[
+    ndarray[Any, dtype[Any]],
+    ndarray[Any, dtype[Any]],
+    Optional[ndarray[Any, dtype[Any]]],
+]:
+
+    """
+    Fills the empty cells of a single tile. For every cell a polynomial z(x, y) of the given degree
+    is fitted by least squares to the nearest points (in the XY plane) and evaluated at the cell centre.
+
+    :param centres: XY coordinates of the centres of the empty cells.
+    :param points: points around the tile.
+    :param colors: colours of the points, if the cloud has them.
+    :param degree: degree of interpolation.
+    :param cell_size: side of a grid cell, used to scale the coordinates of the fit.
+    :return: points, normals and colours (or None) of the new points.
+    """
+
+    if not len(points):
+        return (
+            np.empty((0, 3)),
+            np.empty((0, 3)),
+            None if colors is None else np.empty((0, 3)),
+        )
+
+    terms = polynomial_terms_func(degree)
+    count = min(len(points), max(2 * len(terms), 8))
+
+    # the search runs in the XY plane: heights are zeroed in the indexed copy.
+    plane = np.zeros((len(points), 3))
+    plane[:, :2] = points[:, :2]
+    queries = np.zeros((len(centres), 3))
+    queries[:, :2] = centres
+
+    # patches already run in parallel processes, so the queries are made in a single thread.
+    indices, _ = NeighbourIndex(plane, workers=1).query(queries, count)
+
+    neighbours = points[indices]
+    offsets = (neighbours[..., :2] - centres[:, None, :]) / cell_size
+    design = np.stack(
+        [offsets[..., 0] ** i * offsets[..., 1] ** j for i, j in terms], axis=-1
+    )
+    coefficients = np.linalg.pinv(design) @ neighbours[..., 2:]
+
+    # the constant term is the height at the centre, the linear terms are the slopes there.
+    heights = coefficients[:, 0, 0]
+    slopes = (
+        coefficients[:, 1:3, 0] / cell_size if degree else np.zeros((len(centres), 2))
+    )
+    normals = np.column_stack((-slopes[:, 0], -slopes[:, 1], np.ones(len(centres))))
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+
+    filled = np.column_stack((centres, heights))
+
+    return filled, normals, None if colors is None else colors[indices].mean(axis=1)
+
+
+def patch(
+    data: o3d.geometry.PointCloud,
+    degree: int,
+    cell_size: Optional[float] = None,
+    workers: int = 1,
+) -> o3d.geometry.PointCloud:
+    """
+    Hole interpolation plugin. Rasterizes the cloud onto an XY occupancy grid and adds a point
+    to the centre of every empty cell of the holes, interpolated from the nearest points (see patch_tile_func).
+    Holes are the empty cells surrounded by the occupied ones: the empty space connected to the border
+    of the grid (e.g. cut corners, the area around a rotated or non-rectangular footprint) is left empty.
+
+    The grid is split into tiles of TILE_CELLS x TILE_CELLS cells, and the tiles with holes are patched
+    in parallel worker processes. Neighbours are searched among the points within MARGIN_CELLS cells
+    of a hole, in the tile and the neighbouring ones, so the cells deep inside holes larger than a tile
+    are interpolated from the nearby part of the hole boundary only.
+
+    :raises: ValueError: if the degree is negative.
 
     :param data: PointCloud to transform.
     :param degree: degree of interpolation.
+    :param cell_size: side of a grid cell. By default it is chosen to hold POINTS_PER_CELL points on average.
+    :param workers: number of worker processes. 1 (the default) patches the tiles in this process.
     :return: PointCloud
     """
 
-    return data
+    if degree < 0:
+        raise ValueError(f"Degree of interpolation must be non-negative, got {degree}!")
+
+    points = np.asarray(data.points)
+    colors = np.asarray(data.colors) if data.has_colors() else None
+
+    if not len(points):
+        return data
+
+    start = np.array([points[:, 0].min(), points[:, 1].min()])
+    extent = np.array([points[:, 0].max(), points[:, 1].max()]) - start
+
+    if cell_size is None:
+        cell_size = float(np.sqrt(extent.prod() * POINTS_PER_CELL / len(points)))
+
+    if cell_size <= 0:
+        return data
+
+    shape = np.maximum(np.ceil(extent / cell_size).astype(np.int64), 1)
+    cells = np.minimum(
+        ((points[:, :2] - start) / cell_size).astype(np.int64), shape - 1
+    )
+
+    occupied = np.zeros(shape[::-1], dtype=bool)
+    occupied[cells[:, 1], cells[:, 0]] = True
+    holes = enclosed_func(~occupied)
+    empty = np.argwhere(holes)[:, ::-1]
+
+    if not len(empty):
+        return data
+
+    near = dilate_func(holes, MARGIN_CELLS)
+    candidates = np.flatnonzero(near[cells[:, 1], cells[:, 0]])
+    cells = cells[candidates]
+
+    # points are sorted by tile, so that the points of any tile are a contiguous slice.
+    tiles = -(-shape // TILE_CELLS)
+    point_tiles = (cells[:, 1] // TILE_CELLS) * tiles[0] + cells[:, 0] // TILE_CELLS
+    order = candidates[np.argsort(point_tiles, kind="stable")]
+    bounds = np.searchsorted(np.sort(point_tiles), np.arange(tiles.prod() + 1))
+
+    empty_tiles = (empty[:, 1] // TILE_CELLS) * tiles[0] + empty[:, 0] // TILE_CELLS
+    empty = empty[np.argsort(empty_tiles, kind="stable")]
+    holed, firsts = np.unique(np.sort(empty_tiles), return_index=True)
+    tasks = []
+
+    for tile, cells_of_tile in zip(holed, np.split(empty, firsts[1:])):
+        row, column = divmod(int(tile), int(tiles[0]))
+        around = [
+            order[bounds[y * tiles[0] + x] : bounds[y * tiles[0] + x + 1]]
+            for y in range(max(row - 1, 0), min(row + 2, tiles[1]))
+            for x in range(max(column - 1, 0), min(column + 2, tiles[0]))
+        ]
+        selected = np.concatenate(around)
+        centres = start + (cells_of_tile + 0.5) * cell_size
+
+        tasks.append(
+            (
+                centres,
+                points[selected],
+                None if colors is None else colors[selected],
+                degree,
+                cell_size,
+            )
+        )
+
+    if len(tasks) == 1 or workers == 1:
+        results = [patch_tile_func(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as executor:
+            results = list(executor.map(patch_tile_func, *zip(*tasks)))
+
+    patched = o3d.geometry.PointCloud()
+    patched.points = o3d.utility.Vector3dVector(
+        np.concatenate([result[0] for result in results])
+    )
+
+    if data.has_normals():
+        patched.normals = o3d.utility.Vector3dVector(
+            np.concatenate([result[1] for result in results])
+        )
+
+    if colors is not None:
+        patched.colors = o3d.utility.Vector3dVector(
+            np.concatenate([result[2] for result in results])
+        )
+
+    return data + patched
@@ -1,51 +1,138 @@
-import numpy as np
-import open3d as o3d  # type: ignore
-from numpy import ndarray, dtype, float_
-from numpy.typing import NDArray
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+
+from framework import lazy_import
+from managers import CompactCloud
+
+if TYPE_CHECKING:
+    import numpy as np
+    import open3d as o3d  # type: ignore
+    from numpy import ndarray, dtype, float_
+    from numpy.typing import ArrayLike, NDArray
+else:
+    np = lazy_import("numpy")
+    o3d = lazy_import("open3d")
+
+
+TAGS = ["affine", "pointwise", "compact"]
+
+
+def rotation_matrices_func(mode: str, angles: ArrayLike) -> ndarray[Any, dtype[Any]]:
+
+    """
+    Builds the rotation matrices for many (x, y, z) angle triples at once.
+
+    :param mode: angle units (Degree/Radian).
+    :param angles: (x, y, z) triples.
+    :return: array of (triples, 3, 3) shape.
+    """
+
+    radians: NDArray[float_] = np.asarray(angles, dtype=np.float64).reshape(-1, 3)
+
+    if mode == "Degree":
+        radians = np.radians(radians)
+
+    cos, sin = np.cos(radians), np.sin(radians)
+    matr_x, matr_y, matr_z = np.zeros((3, len(radians), 3, 3))
+
+    matr_x[:, 0, 0] = 1
+    matr_x[:, 1, 1], matr_x[:, 1, 2] = cos[:, 0], -sin[:, 0]
+    matr_x[:, 2, 1], matr_x[:, 2, 2] = sin[:, 0], cos[:, 0]
+
+    matr_y[:, 1, 1] = 1
+    matr_y[:, 0, 0], matr_y[:, 0, 2] = cos[:, 1], sin[:, 1]
+    matr_y[:, 2, 0], matr_y[:, 2, 2] = -sin[:, 1], cos[:, 1]
+
+    matr_z[:, 2, 2] = 1
+    matr_z[:, 0, 0], matr_z[:, 0, 1] = cos[:, 2], -sin[:, 2]
+    matr_z[:, 1, 0], matr_z[:, 1, 1] = sin[:, 2], cos[:, 2]
+
+    # https://en.wikipedia.org/wiki/Rotation_matrix - General rotations
+    matrices: NDArray[float_] = matr_z @ matr_y @ matr_x
+
+    return matrices
 
 
 def rotation_matrix_func(
     mode: str, rotate_x: float, rotate_y: float, rotate_z: float
 ) -> ndarray[Any, dtype[Any]]:
+    matrix: NDArray[float_] = rotation_matrices_func(
+        mode, [(rotate_x, rotate_y, rotate_z)]
+    )[0]
 
-    radians: dict[str, float] = {"x": rotate_x, "y": rotate_y, "z": rotate_z}
+    return matrix
 
-    if mode == "Degree":
-        radians["x"] = np.radians(rotate_x)
-        radians["y"] = np.radians(rotate_y)
-        radians["z"] = np.radians(rotate_z)
-
-    matr_x: NDArray[float_] = np.array(
-        [
-            [1, 0, 0],
-            [0, np.cos(radians["x"]), -np.sin(radians["x"])],
-            [0, np.sin(radians["x"]), np.cos(radians["x"])],
-        ]
-    )
 
-    matr_y: NDArray[float_] = np.array(
-        [
-            [np.cos(radians["y"]), 0, np.sin(radians["y"])],
-            [0, 1, 0],
-            [-np.sin(radians["y"]), 0, np.cos(radians["y"])],
-        ]
-    )
+def rotation_affine_func(
+    mode: str, x: float, y: float, z: float
+) -> ndarray[Any, dtype[Any]]:
+
+    """
+    Builds a homogeneous (4x4) matrix of the rotation around the origin.
+
+    :param mode: angle units (Degree/Radian).
+    :param x: rotation angle along the X-axis.
+    :param y: rotation angle along the Y-axis.
+    :param z: rotation angle along the Z-axis.
+    :return: 4x4 affine matrix.
+    """
+
+    matrix = np.identity(4)
+    matrix[:3, :3] = rotation_matrix_func(mode, x, y, z)
+
+    return matrix
+
+
+# functions provided to the pipeline planner (see IPlugin.get_hooks): the matrix of the operation.
+HOOKS: Dict[str, Callable[..., ndarray[Any, dtype[Any]]]] = {
+    "matrix": rotation_affine_func,
+}
+
 
-    matr_z: NDArray[float_] = np.array(
-        [
-            [np.cos(radians["z"]), -np.sin(radians["z"]), 0],
-            [np.sin(radians["z"]), np.cos(radians["z"]), 0],
-            [0, 0, 1],
-        ]
+def rotate_poses(
+    point_cloud: o3d.geometry.PointCloud, mode: str, angles: ArrayLike
+) -> List[o3d.geometry.PointCloud]:
+
+    """
+    Rotates the point cloud to many orientations in one pass: the points (and normals) are multiplied
+    by the stacked rotation matrices at once, instead of rotating a copy of the cloud per orientation.
+    Colours are shared by all the results. The source cloud is not changed.
+
+    :param point_cloud: PointCloud to rotate.
+    :param mode: angle units (Degree/Radian).
+    :param angles: (x, y, z) triples, one per orientation.
+    :return: rotated PointClouds in order of the triples.
+    """
+
+    # row vectors are rotated by the transposed matrices: (K, N, 3) = (N, 3) @ (K, 3, 3).
+    transposed = rotation_matrices_func(mode, angles).transpose(0, 2, 1)
+    points = np.asarray(point_cloud.points) @ transposed
+    normals = (
+        np.asarray(point_cloud.normals) @ transposed
+        if point_cloud.has_normals()
+        else None
     )
 
-    # https://en.wikipedia.org/wiki/Rotation_matrix - General rotations
-    return matr_z @ matr_y @ matr_x
+    results = []
+
+    for index, rotated in enumerate(points):
+        cloud = o3d.geometry.PointCloud()
+        cloud.points = o3d.utility.Vector3dVector(rotated)
+
+        if normals is not None:
+            cloud.normals = o3d.utility.Vector3dVector(normals[index])
+
+        if point_cloud.has_colors():
+            cloud.colors = point_cloud.colors
+
+        results.append(cloud)
+
+    return results
 
 
 def rotate(
-    point_cloud: o3d.geometry.PointCloud,
+    point_cloud: o3d.geometry.PointCloud | CompactCloud,
     mode: str,
     x: float,
     y: float,
@@ -65,6 +152,11 @@ def rotate(
 
     rotation_matrix = rotation_matrix_func(mode, x, y, z)
 
-    point_cloud.rotate(rotation_matrix, center=np.asarray([0, 0, 0]))
+    if isinstance(point_cloud, CompactCloud):
+        matrix = np.identity(4)
+        matrix[:3, :3] = rotation_matrix
+        point_cloud.transform(matrix)
+    else:
+        point_cloud.rotate(rotation_matrix, center=np.asarray([0, 0, 0]))
 
     return point_cloud
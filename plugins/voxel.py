@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from framework import lazy_import
+from managers import CompactCloud
+
+if TYPE_CHECKING:
+    import numpy as np
+    import open3d as o3d  # type: ignore
+    from numpy import ndarray, dtype
+else:
+    np = lazy_import("numpy")
+    o3d = lazy_import("open3d")
+
+
+TAGS = ["compact", "reducing"]
+
+VOXEL_MODES = ("centroid", "first")
+
+# voxel indices along every axis are packed into 21 bits of a single int64 key, biased so that
+# the grid spans 2^20 voxels to either side of its origin.
+VOXEL_BITS = 21
+VOXEL_BIAS = 1 << (VOXEL_BITS - 1)
+
+
+def voxel_keys_func(
+    points: ndarray[Any, dtype[Any]], origin: ndarray[Any, dtype[Any]], size: float
+) -> ndarray[Any, dtype[Any]]:
+
+    """
+    Quantizes the coordinates to voxel indices and packs the indices of every point into a single int64 key.
+
+    :raises: ValueError: if the points lie too far from the origin of the grid.
+
+    :param points: (N, 3) float64 coordinates.
+    :param origin: origin of the grid.
+    :param size: edge length of the voxels.
+    :return: (N,) int64 keys, equal for the points of the same voxel.
+    """
+
+    cells = np.floor((points - origin) / size).astype(np.int64) + VOXEL_BIAS
+
+    if len(cells) and (cells.min() < 0 or cells.max() >= 1 << VOXEL_BITS):
+        raise ValueError(f"The cloud spans too many voxels of size {size}!")
+
+    keys: ndarray[Any, dtype[Any]] = (
+        (cells[:, 0] << 2 * VOXEL_BITS) | (cells[:, 1] << VOXEL_BITS) | cells[:, 2]
+    )
+
+    return keys
+
+
+class VoxelGrid:
+
+    """
+    Voxel-grid downsampling of a point cloud, which may be added chunk by chunk.
+
+    Every voxel is reduced to a single point: either to the centroid of its points (normals and colours are
+    averaged too) or to its first point. Every added chunk is reduced to its voxels first, which are then merged
+    into the accumulated ones, so the voxels split between chunks are reduced as a whole. Voxels are aligned to the multiples of their size,
+    and the memory of the grid depends on the number of voxels, not points.
+
+    Points of the result are ordered by their voxel keys.
+    """
+
+    def __init__(self, size: float, mode: str = "centroid") -> None:
+
+        """
+        Constructor method for VoxelGrid class.
+
+        :raises: ValueError: if the size is not positive or the mode is not supported.
+
+        :param size: edge length of the voxels.
+        :param mode: reduction of the points of a voxel ("centroid" or "first").
+        """
+
+        if size <= 0:
+            raise ValueError(f"Voxel size must be positive, got {size}!")
+
+        if mode not in VOXEL_MODES:
+            raise ValueError(f"Voxel mode must be one of {VOXEL_MODES}, got {mode}!")
+
+        self.__size = size
+        self.__mode = mode
+
+        self.__origin: Optional[ndarray[Any, dtype[Any]]] = None
+        self.__scale: Optional[float] = None
+        self.__compact = False
+
+        # keys of the voxels, their point counts and the sums (or the first values) of the point attributes.
+        self.__keys = np.empty(0, dtype=np.int64)
+        self.__counts = np.empty(0, dtype=np.int64)
+        self.__values: Dict[str, ndarray[Any, dtype[Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def add(self, data: o3d.geometry.PointCloud | CompactCloud) -> None:
+
+        """
+        Adds the points of the cloud to the grid.
+
+        :raises: ValueError: if the cloud has other attributes (normals, colours) than the previous ones,
+        or lies too far from the first one.
+
+        :param data: PointCloud or CompactCloud.
+        :return: None
+        """
+
+        attributes = VoxelGrid.__attributes(data)
+
+        if self.__origin is None:
+            self.__compact = isinstance(data, CompactCloud)
+            self.__scale = data.scale if isinstance(data, CompactCloud) else None
+            self.__values = {
+                name: np.empty((0, 3)) for name, values in attributes.items()
+            }
+
+            if not len(attributes["points"]):
+                return
+
+            # the origin is snapped to the grid, so the voxels don't depend on how the cloud is split into chunks.
+            points = attributes["points"]
+            centre = (points.min(axis=0) + points.max(axis=0)) / 2
+            self.__origin = np.floor(centre / self.__size) * self.__size
+
+        if attributes.keys() != self.__values.keys():
+            raise ValueError("Chunks of the cloud must have the same attributes!")
+
+        keys = voxel_keys_func(attributes["points"], self.__origin, self.__size)
+        keys, first, inverse, counts = np.unique(
+            keys, return_index=True, return_inverse=True, return_counts=True
+        )
+
+        # the chunk is reduced to its voxels: their first values or the sums of their points.
+        if self.__mode == "first":
+            reduced = {name: values[first] for name, values in attributes.items()}
+        else:
+            reduced = {
+                name: np.column_stack(
+                    [
+                        np.bincount(inverse, weights=column, minlength=len(keys))
+                        for column in values.T
+                    ]
+                )
+                for name, values in attributes.items()
+            }
+
+        # the voxels of the chunk are merged into the sorted accumulated ones.
+        positions = np.searchsorted(self.__keys, keys)
+        found = positions < len(self.__keys)
+        found[found] = self.__keys[positions[found]] == keys[found]
+
+        self.__counts[positions[found]] += counts[found]
+
+        if self.__mode == "centroid":
+            for name, values in reduced.items():
+                self.__values[name][positions[found]] += values[found]
+
+        added, positions = ~found, positions[~found]
+        self.__keys = np.insert(self.__keys, positions, keys[added])
+        self.__counts = np.insert(self.__counts, positions, counts[added])
+
+        for name, values in reduced.items():
+            self.__values[name] = np.insert(
+                self.__values[name], positions, values[added], axis=0
+            )
+
+    def result(self) -> o3d.geometry.PointCloud:
+
+        """
+        Reduces every voxel to a single point.
+
+        :return: cloud of the type added to the grid (PointCloud if nothing was added).
+        """
+
+        values = dict(self.__values)
+
+        if self.__mode == "centroid" and len(self):
+            values = {
+                name: sums / self.__counts[:, None] for name, sums in values.items()
+            }
+
+        if "normals" in values:
+            lengths = np.linalg.norm(values["normals"], axis=1, keepdims=True)
+            values["normals"] = values["normals"] / np.where(lengths > 0, lengths, 1)
+
+        points = values.get("points", np.empty((0, 3)))
+
+        if self.__compact:
+            return CompactCloud.pack(
+                points, self.__scale, values.get("normals"), values.get("colors")
+            )
+
+        cloud = o3d.geometry.PointCloud()
+        cloud.points = o3d.utility.Vector3dVector(points)
+
+        if "normals" in values:
+            cloud.normals = o3d.utility.Vector3dVector(values["normals"])
+
+        if "colors" in values:
+            cloud.colors = o3d.utility.Vector3dVector(values["colors"])
+
+        return cloud
+
+    @staticmethod
+    def __attributes(
+        data: o3d.geometry.PointCloud | CompactCloud,
+    ) -> Dict[str, ndarray[Any, dtype[Any]]]:
+
+        """
+        Returns the float64 points, normals and colours (in [0, 1]) of the cloud, which it has.
+        """
+
+        if isinstance(data, CompactCloud):
+            attributes = {"points": data.coordinates()}
+
+            if data.normals is not None:
+                attributes["normals"] = data.normals.astype(np.float64)
+
+            if data.colors is not None:
+                attributes["colors"] = data.colors / 255
+
+            return attributes
+
+        attributes = {"points": np.asarray(data.points)}
+
+        if data.has_normals():
+            attributes["normals"] = np.asarray(data.normals)
+
+        if data.has_colors():
+            attributes["colors"] = np.asarray(data.colors)
+
+        return attributes
+
+
+HOOKS: Dict[str, Callable[..., VoxelGrid]] = {"accumulator": VoxelGrid}
+
+
+def voxel(
+    data: o3d.geometry.PointCloud | CompactCloud, size: float, mode: str = "centroid"
+) -> o3d.geometry.PointCloud:
+    """
+    Voxel-grid downsampling plugin. Reduces the points of every voxel of the given size to their centroid
+    (averaging normals and colours too) or to the first of them. Coordinates are quantized to int64 voxel keys,
+    and the voxels are reduced with a single sort and bincount, without Python-level loops.
+
+    :raises: ValueError: if the size is not positive or the mode is not supported.
+
+    :param data: PointCloud or CompactCloud to downsample.
+    :param size: edge length of the voxels.
+    :param mode: reduction of the points of a voxel ("centroid" or "first").
+    :return: cloud of the same type
+    """
+
+    grid = VoxelGrid(size, mode)
+    grid.add(data)
+
+    return grid.result()
@@ -0,0 +1,55 @@
+from typing import Any, Callable
+
+import numpy as np
+from numpy.typing import ArrayLike
+import open3d as o3d  # type: ignore
+import pytest
+
+
+def random_cloud_func(
+    points: int | ArrayLike = 1000,
+    low: float = -10.0,
+    high: float = 10.0,
+    normals: bool = False,
+    colors: bool = False,
+    seed: int = 0,
+) -> o3d.geometry.PointCloud:
+
+    """
+    Builds a reproducible PointCloud: the same arguments always give the same cloud.
+
+    :param points: number of points, uniformly distributed in the [low, high) cube, or their (N, 3) coordinates.
+    :param low: lower bound of the coordinates.
+    :param high: upper bound of the coordinates.
+    :param normals: boolean flag to add random unit normals.
+    :param colors: boolean flag to add random 8-bit colours (scaled to [0, 1]).
+    :param seed: seed of the random generator.
+    :return: PointCloud
+    """
+
+    generator = np.random.default_rng(seed)
+
+    if isinstance(points, int):
+        coordinates = generator.uniform(low, high, (points, 3))
+    else:
+        coordinates = np.asarray(points, dtype=np.float64)
+
+    cloud = o3d.geometry.PointCloud()
+    cloud.points = o3d.utility.Vector3dVector(coordinates)
+
+    if normals:
+        directions = generator.normal(0, 1, coordinates.shape)
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        cloud.normals = o3d.utility.Vector3dVector(directions)
+
+    if colors:
+        cloud.colors = o3d.utility.Vector3dVector(
+            generator.integers(0, 256, coordinates.shape) / 255
+        )
+
+    return cloud
+
+
+@pytest.fixture
+def make_cloud() -> Callable[..., Any]:
+    return random_cloud_func
@@ -0,0 +1,39 @@
+from typing import Any, Callable
+
+import numpy as np
+from numpy.typing import NDArray
+from plugins.affine import affine
+from plugins.move import move
+from plugins.rotate import rotate
+from mvp import Model, Planner, Step
+
+
+STEPS = [
+    Step("rotate", {"mode": "Degree", "x": 30.0, "y": 0.0, "z": 90.0}),
+    Step("move", {"x": 1.0, "y": -2.0, "z": 3.0}),
+    Step("rotate", {"mode": "Radian", "x": 0.0, "y": 0.5, "z": 0.0}),
+]
+
+
+# checking that a run of rigid transformations is fused into a single step
+def test_fuse_affine_run() -> None:
+    fused = Planner(Model().operation_info).optimize(
+        STEPS + [Step("patch", {"degree": 1})] + STEPS[:1]
+    )
+
+    assert [step.operation for step in fused] == ["affine", "patch", "rotate"]
+
+
+# checking that the fused transformation matches sequential rotate/move calls
+def test_fused_matches_sequential(make_cloud: Callable[..., Any]) -> None:
+    sequential = rotate(make_cloud(normals=True), "Degree", 30.0, 0.0, 90.0)
+    sequential = move(sequential, 1.0, -2.0, 3.0)
+    sequential = rotate(sequential, "Radian", 0.0, 0.5, 0.0)
+
+    (step,) = Planner(Model().operation_info).optimize(STEPS)
+    fused = affine(make_cloud(normals=True), **step.parameters)
+
+    expected: NDArray[np.float_] = np.asarray(sequential.points)
+    result: NDArray[np.float_] = np.asarray(fused.points)
+    assert np.allclose(result, expected)
+    assert np.allclose(np.asarray(fused.normals), np.asarray(sequential.normals))
@@ -0,0 +1,75 @@
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import open3d as o3d  # type: ignore
+import pytest
+from managers import FileManager
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+CONFIG = {
+    "src": "",
+    "dest": "",
+    "operations": [1],
+    1: {"type": "move", "x": 1.0, "y": 0.0, "z": 0.0},
+}
+
+
+# checking that corrupt or unreadable files are reported as errors instead of empty clouds
+@pytest.mark.parametrize("content", [b"not a cloud", b"truncated"])
+def test_corrupt_ply_raises(
+    make_cloud: Callable[..., Any], tmp_path: Path, content: bytes
+) -> None:
+    path = tmp_path / "broken.ply"
+
+    if content == b"truncated":
+        o3d.io.write_point_cloud(str(path), make_cloud(100))
+        content = path.read_bytes()[:-1000]
+
+    path.write_bytes(content)
+
+    with pytest.raises(ValueError):
+        FileManager().read(str(path))
+
+
+# checking that every file gets its own result and manifest entry, with the failed ones reported per file
+def test_batch_files(make_cloud: Callable[..., Any], tmp_path: Path) -> None:
+    for directory, points in (("a", 100), ("b", 200)):
+        (tmp_path / directory).mkdir()
+        o3d.io.write_point_cloud(
+            str(tmp_path / directory / "tile.ply"), make_cloud(points)
+        )
+
+    (tmp_path / "a" / "broken.ply").write_bytes(b"not a cloud")
+    FileManager().write(str(tmp_path / "config.yml"), CONFIG)
+
+    command = "batch config.yml */*.ply --output out --workers 1"
+    run = subprocess.run(
+        [sys.executable, str(ROOT), *command.split()],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+
+    manifest = FileManager().read(str(tmp_path / "out" / "manifest.yml"))["files"]
+    entries = {Path(entry["dest"]).name: entry for entry in manifest}
+
+    assert run.returncode != 0 and "1 of 3 files failed" in run.stderr
+    assert sorted(path.name for path in (tmp_path / "out").iterdir()) == [
+        "manifest.yml",
+        "tile.ply",
+        "tile_1.ply",
+    ]
+    assert "error" in entries["broken.ply"] and "points" not in entries["broken.ply"]
+
+    for name, source, points in (("tile.ply", "a", 100), ("tile_1.ply", "b", 200)):
+        result = o3d.io.read_point_cloud(str(tmp_path / "out" / name))
+        expected = np.asarray(make_cloud(points).points) + [1.0, 0.0, 0.0]
+
+        assert entries[name]["src"] == str(Path(source) / "tile.ply")
+        assert entries[name]["points"] == points
+        assert np.allclose(np.asarray(result.points), expected)
@@ -0,0 +1,124 @@
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+import open3d as o3d  # type: ignore
+import pytest
+from managers import FileManager, Profiler, StepCache
+from mvp import Model, Step
+from plugins.voxel import voxel
+
+
+def make_steps(size: float) -> list[Step]:
+    return [
+        Step("move", {"x": 1.0, "y": 0.0, "z": 0.0}),
+        Step("clear", {"height": 100.0, "above": True, "below": False}),
+        Step("voxel", {"size": size, "mode": "centroid"}),
+    ]
+
+
+# checking that a rerun with only the last step edited resumes from the cached result of the steps before it
+def test_cached_prefix_is_reused(
+    make_cloud: Callable[..., Any], tmp_path: Path
+) -> None:
+    cloud = make_cloud(100)
+
+    source = str(tmp_path / "cloud.ply")
+    o3d.io.write_point_cloud(source, cloud)
+
+    Model().set_cache(StepCache(str(tmp_path / "cache")))
+    profiler = Profiler()
+    invoked = []
+
+    try:
+        for size in (2.0, 4.0):
+            profiler.reset()
+            profiler.enable()
+            Model().load_data(source)
+            Model().execute_tasks(make_steps(size))
+            profiler.disable()
+
+            invoked.append(
+                [
+                    record.name
+                    for record in profiler.records()
+                    if record.category == "plugin"
+                ]
+            )
+
+            result = Model().data
+            expected = voxel(o3d.geometry.PointCloud(cloud).translate((1, 0, 0)), size)
+            assert result is not None
+            assert np.allclose(np.asarray(result.points), np.asarray(expected.points))
+    finally:
+        profiler.disable()
+        profiler.reset()
+        Model().set_cache(None)
+
+    # the filter is moved ahead of the shift, so the first run stores the result after both of them and at the end.
+    assert invoked == [["clear", "move", "voxel"], ["voxel"]]
+    assert len(list((tmp_path / "cache").glob("*.ply"))) == 3
+
+
+# checking that the least recently used results are evicted first
+def test_cache_eviction(make_cloud: Callable[..., Any], tmp_path: Path) -> None:
+    cloud = make_cloud(np.zeros((100, 3)))
+
+    cache = StepCache(str(tmp_path), capacity=5000)
+
+    for key in ("first", "second", "third"):
+        cache.store(key, cloud)
+
+    assert not cache.contains("first")
+    assert cache.contains("third")
+
+
+# checking that a run resumed from the cache gives the same colours as a fresh one, not rounded to 8 bits
+def test_cached_colours_are_exact(
+    make_cloud: Callable[..., Any], tmp_path: Path
+) -> None:
+    source = str(tmp_path / "cloud.ply")
+    o3d.io.write_point_cloud(source, make_cloud(1000, colors=True))
+    steps = make_steps(4.0)
+
+    Model().load_data(source)
+    Model().execute_tasks(steps)
+    fresh = Model().data
+    assert fresh is not None
+
+    # the first cached run stores the result, the second one resumes from it.
+    Model().set_cache(StepCache(str(tmp_path / "cache")))
+
+    try:
+        for _ in range(2):
+            Model().load_data(source)
+            Model().execute_tasks(steps)
+    finally:
+        Model().set_cache(None)
+
+    resumed = Model().data
+    assert resumed is not None
+    # voxel averages the colours, so they are not multiples of 1/255 any more.
+    colors = np.asarray(fresh.colors)
+    assert not np.allclose(colors * 255, np.rint(colors * 255))
+    assert np.array_equal(np.asarray(resumed.colors), colors)
+
+
+# checking that an interrupted write leaves no result behind
+def test_interrupted_store(
+    make_cloud: Callable[..., Any], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def interrupted(
+        file: FileManager, path: str, data: Any, mode: Optional[str] = None
+    ) -> None:
+        Path(path).write_bytes(b"ply\n")
+        raise KeyboardInterrupt
+
+    cache = StepCache(str(tmp_path))
+    monkeypatch.setattr(FileManager, "write", interrupted)
+
+    with pytest.raises(KeyboardInterrupt):
+        cache.store("key", make_cloud(100))
+
+    assert not cache.contains("key")
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,34 @@
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import open3d as o3d  # type: ignore
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+# checking that chained commands are performed in order on a single load and saved once,
+# with the options given before or after the arguments
+@pytest.mark.parametrize("clear", ["clear --above 1.5", "clear 1.5 --above"])
+def test_chained_commands(
+    make_cloud: Callable[..., Any], tmp_path: Path, clear: str
+) -> None:
+    cloud = make_cloud(500, 0, 1)
+    points = np.asarray(cloud.points)
+    o3d.io.write_point_cloud(str(tmp_path / "model.ply"), cloud)
+
+    command = f"load model.ply rotate Degree 0 0 90 move 0 0 1 {clear}"
+    subprocess.run(
+        [sys.executable, str(ROOT), *command.split()], cwd=tmp_path, check=True
+    )
+
+    expected = points @ np.array([[0, 1, 0], [-1, 0, 0], [0, 0, 1]]) + [0, 0, 1]
+    expected = expected[expected[:, 2] <= 1.5]
+    result = np.asarray(o3d.io.read_point_cloud(str(tmp_path / "output.ply")).points)
+
+    assert len(result) == len(expected) < len(points)
+    assert np.allclose(np.sort(result, axis=0), np.sort(expected, axis=0))
@@ -0,0 +1,45 @@
+from typing import Any, Callable
+
+import numpy as np
+import pytest
+from plugins.clear import clear
+from plugins.clear import height_index_func
+
+
+# checking that the height filter keeps exactly the points on the kept side, with their colours
+@pytest.mark.parametrize("above, below", [(True, False), (False, True), (True, True)])
+def test_clear_matches_mask(
+    make_cloud: Callable[..., Any], above: bool, below: bool
+) -> None:
+    cloud = make_cloud(5000, colors=True)
+    points = np.asarray(cloud.points)
+    keep = np.ones(len(points), dtype=bool)
+
+    if above:
+        keep &= points[:, 2] <= 1.5
+
+    if below:
+        keep &= points[:, 2] >= 1.5
+
+    result = clear(make_cloud(5000, colors=True), 1.5, above, below)
+
+    assert np.array_equal(np.asarray(result.points), points[keep])
+    assert np.array_equal(np.asarray(result.colors), np.asarray(cloud.colors)[keep])
+
+
+# checking that queries through the sorted height index return the same cloud as the full scan
+def test_clear_with_index(make_cloud: Callable[..., Any]) -> None:
+    cloud = make_cloud(5000, colors=True)
+    index = height_index_func(cloud)
+
+    for height in (-20.0, -3.0, 0.0, 4.5, 20.0):
+        for above, below in ((True, False), (False, True)):
+            expected = clear(cloud, height, above, below)
+            result = clear(cloud, height, above, below, index=index)
+
+            assert np.array_equal(
+                np.asarray(result.points), np.asarray(expected.points)
+            )
+            assert np.array_equal(
+                np.asarray(result.colors), np.asarray(expected.colors)
+            )
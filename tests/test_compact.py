@@ -0,0 +1,72 @@
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+import open3d as o3d  # type: ignore
+import pytest
+from managers import CompactCloud, PlyVertices
+from mvp import Model, Step
+
+
+def aerial_cloud(make_cloud: Callable[..., Any]) -> o3d.geometry.PointCloud:
+    # aerial data: local extent of a few hundred metres at large (projected) coordinates.
+    cloud = make_cloud(2000, 0, 500, normals=True, colors=True)
+
+    return cloud.translate((512_000.0, 6_210_000.0, 100.0))
+
+
+# checking that packing keeps millimetre precision, exact colours and takes less than half of the memory
+@pytest.mark.parametrize("scale", [None, 0.001])
+def test_compact_round_trip(
+    make_cloud: Callable[..., Any], scale: Optional[float]
+) -> None:
+    cloud = aerial_cloud(make_cloud)
+    compact = CompactCloud.from_point_cloud(cloud, scale)
+    result = compact.to_point_cloud()
+    vertices = compact.to_vertices()
+
+    assert compact.offsets.dtype == (np.float32 if scale is None else np.int32)
+    assert compact.nbytes < 0.4 * len(compact) * 72
+    assert np.abs(np.asarray(result.points) - np.asarray(cloud.points)).max() < 5e-4
+    assert np.allclose(np.asarray(result.normals), np.asarray(cloud.normals), atol=1e-6)
+    assert np.array_equal(np.asarray(result.colors), np.asarray(cloud.colors))
+    assert np.array_equal(vertices.points, np.asarray(result.points))
+    colors = CompactCloud.from_vertices(PlyVertices.from_point_cloud(cloud)).colors
+    assert colors is not None and compact.colors is not None
+    assert np.array_equal(colors, compact.colors)
+
+
+STEPS = [
+    Step("rotate", {"mode": "Degree", "x": 0.0, "y": 0.0, "z": 30.0}),
+    Step("move", {"x": -512_000.0, "y": -6_210_000.0, "z": 5.0}),
+    Step("clear", {"height": 400.0, "above": True, "below": False}),
+    Step("cut", {"ul": True, "ur": False, "ll": False, "lr": True, "size": 0.25}),
+    # patch doesn't handle CompactCloud, so it gets an Open3D copy.
+    Step("patch", {"degree": 1, "cell_size": 1000.0}),
+]
+
+
+# checking that the compact store gives the same results as Open3D clouds, with and without quantization
+@pytest.mark.parametrize("scale", [None, 0.001])
+def test_compact_tasks_match(
+    make_cloud: Callable[..., Any], tmp_path: Path, scale: Optional[float]
+) -> None:
+    path = str(tmp_path / "cloud.ply")
+    o3d.io.write_point_cloud(path, aerial_cloud(make_cloud))
+    results = []
+
+    for compact in (False, True):
+        Model().set_compact(compact, scale)
+
+        try:
+            Model().load_data(path)
+            Model().execute_tasks(STEPS)
+            results.append(Model().data)
+        finally:
+            Model().set_compact(False)
+
+    plain, packed = results
+    assert plain is not None and packed is not None
+    assert len(plain.points) == len(packed.points) > 0
+    assert np.abs(np.asarray(plain.points) - np.asarray(packed.points)).max() < 2e-3
+    assert np.allclose(np.asarray(plain.normals), np.asarray(packed.normals), atol=1e-5)
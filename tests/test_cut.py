@@ -0,0 +1,24 @@
+from typing import Any, Callable
+
+import numpy as np
+import pytest
+from plugins.cut import cut
+
+
+# checking that exactly the points inside the selected corners are removed
+@pytest.mark.parametrize("size", [0.5, 0.2])
+def test_cut_corners(make_cloud: Callable[..., Any], size: float) -> None:
+    cloud = make_cloud(5000, 0, 10)
+    points = np.asarray(cloud.points)
+    low, high = points[:, :2].min(axis=0), points[:, :2].max(axis=0)
+    left = points[:, 0] < low[0] + size * (high[0] - low[0])
+    right = points[:, 0] > high[0] - size * (high[0] - low[0])
+    lower = points[:, 1] < low[1] + size * (high[1] - low[1])
+    upper = points[:, 1] > high[1] - size * (high[1] - low[1])
+
+    result = cut(
+        make_cloud(5000, 0, 10), ul=True, ur=False, ll=False, lr=True, size=size
+    )
+
+    expected = points[~(upper & left) & ~(lower & right)]
+    assert np.array_equal(np.asarray(result.points), expected)
@@ -0,0 +1,106 @@
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import open3d as o3d  # type: ignore
+from managers import CompactCloud, FileManager, LasPoints, LasWriter
+from managers.file_manager.parsers.las import point_dtype
+from mvp import Model, Step
+
+
+def aerial_cloud(make_cloud: Callable[..., Any]) -> o3d.geometry.PointCloud:
+    cloud = make_cloud(1000, 0, 300, colors=True, seed=1)
+
+    return cloud.translate((512_000.0, 6_210_000.0, 100.0))
+
+
+# checking that PointCloud and CompactCloud data survive writing to and reading from .las files
+def test_las_round_trip(make_cloud: Callable[..., Any], tmp_path: Path) -> None:
+    cloud = aerial_cloud(make_cloud)
+    files = FileManager()
+
+    for name, data in (
+        ("cloud.las", cloud),
+        ("compact.las", CompactCloud.from_point_cloud(cloud, 0.001)),
+    ):
+        path = str(tmp_path / name)
+        files.write(path, data)
+        result = files.read(path)
+        records: LasPoints = files.read(path, "las_memmap")
+
+        assert isinstance(records.array, np.memmap)
+        assert len(records) == len(result.points) == len(cloud.points)
+        assert np.abs(np.asarray(result.points) - np.asarray(cloud.points)).max() < 1e-3
+        assert np.allclose(np.asarray(result.colors), np.asarray(cloud.colors))
+        assert np.allclose(
+            records[10:20].coordinates(), np.asarray(cloud.points)[10:20], atol=1e-3
+        )
+
+
+# checking that records with extra bytes are read by their declared length
+def test_las_extra_bytes() -> None:
+    padded = point_dtype(2, 30)
+
+    assert padded.itemsize == 30
+    assert padded.names == point_dtype(2).names
+
+
+# checking that the compact Model loads and saves .las files without Open3D copies
+def test_model_las(make_cloud: Callable[..., Any], tmp_path: Path) -> None:
+    source = str(tmp_path / "cloud.las")
+    destination = str(tmp_path / "saved.las")
+    FileManager().write(source, aerial_cloud(make_cloud))
+    Model().set_compact(True, 0.001)
+
+    try:
+        Model().load_data(source)
+        Model().save_data(destination)
+        Model().flush()
+    finally:
+        Model().set_compact(False)
+
+    saved = FileManager().read(destination)
+    original = FileManager().read(source)
+    assert np.abs(np.asarray(saved.points) - np.asarray(original.points)).max() < 1e-3
+
+
+# checking that chunks with other offsets or scales are re-based onto the first chunk
+def test_las_writer_rebases_chunks(
+    make_cloud: Callable[..., Any], tmp_path: Path
+) -> None:
+    path = str(tmp_path / "chunks.las")
+    points = np.asarray(aerial_cloud(make_cloud).points)
+    points[400:] += [1000.0, 0.0, 0.0]
+    chunks = [
+        LasPoints.pack(points[:400]),
+        LasPoints.pack(points[400:700]),
+        LasPoints.pack(points[700:], scale=0.01),
+    ]
+    assert not np.array_equal(chunks[0].offset, chunks[1].offset)
+
+    with LasWriter(path) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+
+    records: LasPoints = FileManager().read(path, "las_memmap")
+    expected = np.concatenate([chunk.coordinates() for chunk in chunks])
+
+    assert np.array_equal(records.scale, chunks[0].scale)
+    assert np.array_equal(records.offset, chunks[0].offset)
+    assert np.allclose(records.coordinates()[:700], expected[:700], rtol=0, atol=1e-9)
+    assert np.abs(records.coordinates()[700:] - expected[700:]).max() <= 5e-4 + 1e-9
+
+
+# checking that a writer without any points, e.g. of a stream with every point filtered out, writes an empty file
+def test_las_writer_empty(make_cloud: Callable[..., Any], tmp_path: Path) -> None:
+    LasWriter(str(tmp_path / "empty.las")).close()
+
+    source = str(tmp_path / "cloud.ply")
+    destination = str(tmp_path / "cleared.las")
+    o3d.io.write_point_cloud(source, make_cloud(100))
+    steps = [Step("clear", {"height": -100.0, "above": True, "below": False})]
+    Model().stream_tasks(source, destination, steps, chunk_size=30)
+
+    for name in ("empty.las", "cleared.las"):
+        records: LasPoints = FileManager().read(str(tmp_path / name), "las_memmap")
+        assert len(records) == 0
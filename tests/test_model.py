@@ -0,0 +1,61 @@
+from pathlib import Path
+import os
+from typing import Any, Callable, Dict
+
+import numpy as np
+import open3d as o3d  # type: ignore
+from mvp import Model
+
+
+SHIFT: Dict[str, Any] = {"x": 1.0, "y": 0.0, "z": 0.0}
+TURN: Dict[str, Any] = {"mode": "Degree", "x": 0.0, "y": 0.0, "z": 90.0}
+
+
+# checking that every load (the first one and the reloads) starts from the file contents, also for the compact store,
+# and a changed file is read again
+def test_load_data_starts_from_file(
+    make_cloud: Callable[..., Any], tmp_path: Path
+) -> None:
+    path = str(tmp_path / "cloud.ply")
+    cloud = make_cloud(100)
+    o3d.io.write_point_cloud(path, cloud)
+
+    for compact in (False, True):
+        Model().set_compact(compact)
+
+        try:
+            for _ in range(3):
+                Model().load_data(path)
+                result = Model().data
+                assert result is not None
+                assert np.allclose(np.asarray(result.points), np.asarray(cloud.points))
+
+                Model().task("rotate", **TURN)
+                Model().task("move", **SHIFT)
+        finally:
+            Model().set_compact(False)
+
+    o3d.io.write_point_cloud(path, make_cloud(50))
+    Model().load_data(path)
+    result = Model().data
+    assert result is not None
+    assert len(result.points) == 50
+
+
+# checking that saving writes the given path in the background and ignores the later tasks
+def test_save_data_writes_path_after_flush(
+    make_cloud: Callable[..., Any], tmp_path: Path
+) -> None:
+    source = str(tmp_path / "cloud.ply")
+    destination = str(tmp_path / "result" / "saved.ply")
+    cloud = make_cloud(100)
+    o3d.io.write_point_cloud(source, cloud)
+
+    Model().load_data(source)
+    Model().save_data(destination)
+    Model().task("move", **SHIFT)
+    Model().flush()
+
+    saved = o3d.io.read_point_cloud(destination)
+    assert np.allclose(np.asarray(saved.points), np.asarray(cloud.points))
+    assert os.listdir(tmp_path / "result") == ["saved.ply"]
@@ -0,0 +1,85 @@
+from pathlib import Path
+from typing import Any, Callable
+from unittest.mock import patch
+
+import numpy as np
+import open3d as o3d  # type: ignore
+import pytest
+from managers import CompactCloud, NeighbourIndex
+from mvp import Model, Step
+from plugins.normals import normals
+from plugins.outlier import outlier
+
+
+def noisy_ground(make_cloud: Callable[..., Any]) -> o3d.geometry.PointCloud:
+    # a noisy ground plane with points floating above it.
+    generator = np.random.default_rng(0)
+    ground = np.column_stack(
+        (generator.uniform(0, 50, (20000, 2)), generator.normal(0, 0.02, 20000))
+    )
+    noise = generator.uniform(0, 50, (200, 3)) + [0, 0, 5]
+
+    return make_cloud(np.vstack((ground, noise)))
+
+
+# checking that both modes remove the same points as Open3D, also for a compact cloud and in batched threads
+@pytest.mark.parametrize("mode", ["statistical", "radius"])
+def test_outlier_matches_open3d(make_cloud: Callable[..., Any], mode: str) -> None:
+    cloud = noisy_ground(make_cloud)
+
+    if mode == "statistical":
+        expected, _ = cloud.remove_statistical_outlier(20, 2.0)
+    else:
+        expected, _ = cloud.remove_radius_outlier(8, 1.0)
+
+    neighbours = 20 if mode == "statistical" else 8
+    index = NeighbourIndex(np.asarray(cloud.points), workers=4)
+
+    with patch("managers.index_manager.neighbour_index.QUERY_BATCH", 1000):
+        result = outlier(cloud, mode, neighbours, 2.0, 1.0, index)
+
+    compact = outlier(CompactCloud.from_point_cloud(cloud), mode, neighbours, 2.0, 1.0)
+
+    assert len(result.points) == len(expected.points) < len(cloud.points)
+    assert np.array_equal(np.asarray(result.points), np.asarray(expected.points))
+    assert isinstance(compact, CompactCloud)
+    assert abs(len(compact) - len(expected.points)) <= 2
+
+
+# checking that Model builds the index once and shares it between the operations keeping the points
+def test_model_reuses_index(make_cloud: Callable[..., Any], tmp_path: Path) -> None:
+    path = str(tmp_path / "cloud.ply")
+    o3d.io.write_point_cloud(path, noisy_ground(make_cloud))
+    built = []
+
+    class CountingIndex(NeighbourIndex):
+        def __init__(self, points: Any) -> None:
+            built.append(1)
+            super().__init__(points)
+
+    Model().load_data(path)
+
+    with patch("mvp.model.model.NeighbourIndex", CountingIndex):
+        Model().execute_tasks(
+            [
+                Step("normals", {"neighbours": 12}),
+                Step("outlier", {"mode": "radius", "neighbours": 8, "radius": 1.0}),
+                Step("outlier", {"mode": "statistical", "neighbours": 20}),
+            ]
+        )
+
+    result = Model().data
+    assert result is not None
+    assert len(built) == 2
+    assert len(result.points) < 20200
+    assert np.abs(np.asarray(result.normals)[:, 2]).mean() > 0.95
+
+
+# checking that the normals of a plane point upwards
+def test_normals_of_plane(make_cloud: Callable[..., Any]) -> None:
+    cloud = noisy_ground(make_cloud)
+    result = normals(cloud, 12)
+    estimated = np.asarray(result.normals)[:20000]
+
+    assert (estimated[:, 2] >= 0).all()
+    assert np.median(estimated[:, 2]) > 0.99
@@ -0,0 +1,55 @@
+from typing import Any, Callable
+
+import numpy as np
+from numpy.typing import NDArray
+import open3d as o3d  # type: ignore
+from plugins.patch import patch
+
+
+def surface(x: NDArray[np.float_], y: NDArray[np.float_]) -> NDArray[np.float_]:
+    result: NDArray[np.float_] = 0.01 * x**2 - 0.02 * x * y + 0.5 * y
+
+    return result
+
+
+def holed_surface(make_cloud: Callable[..., Any]) -> o3d.geometry.PointCloud:
+    generator = np.random.default_rng(0)
+
+    grid = np.stack(np.meshgrid(np.arange(200), np.arange(200)), axis=-1).reshape(-1, 2)
+    plane = grid + 0.5 + generator.uniform(-0.2, 0.2, grid.shape)
+    plane = plane[np.linalg.norm(plane - 128, axis=1) > 10]
+    # the origin aligns the grid of patch with the lattice, so only the hole is empty.
+    plane = np.vstack(([0.0, 0.0], plane))
+
+    return make_cloud(np.column_stack((plane, surface(plane[:, 0], plane[:, 1]))))
+
+
+# checking that a hole spanning several tiles is filled with points on the surface, alike in parallel
+def test_patch_fills_hole(make_cloud: Callable[..., Any]) -> None:
+    cloud = holed_surface(make_cloud)
+
+    result = patch(holed_surface(make_cloud), degree=2, cell_size=1.0, workers=1)
+    parallel = patch(holed_surface(make_cloud), degree=2, cell_size=1.0, workers=2)
+
+    added = np.asarray(result.points)[len(cloud.points) :]
+    assert len(added) > 250
+    assert np.all(np.linalg.norm(added[:, :2] - 128, axis=1) < 11)
+    assert np.allclose(added[:, 2], surface(added[:, 0], added[:, 1]), atol=1e-6)
+    assert np.allclose(np.asarray(parallel.points), np.asarray(result.points))
+
+
+# checking that the empty space connected to the border (a cut corner, a rotated footprint) is not filled
+def test_patch_keeps_border_empty(make_cloud: Callable[..., Any]) -> None:
+    points = np.asarray(holed_surface(make_cloud).points)
+    points = points[(points[:, 0] > 40) | (points[:, 1] > 40)]
+
+    # the footprint is turned by 30 degrees around the centre of the hole.
+    turn = np.array([[np.sqrt(3), -1.0], [1.0, np.sqrt(3)]]) / 2
+    points[:, :2] = (points[:, :2] - 128) @ turn.T + 128
+    cloud = make_cloud(points)
+
+    result = patch(make_cloud(points), degree=2, cell_size=2.0)
+
+    added = np.asarray(result.points)[len(cloud.points) :]
+    assert len(added) > 50
+    assert np.all(np.linalg.norm(added[:, :2] - 128, axis=1) < 12)
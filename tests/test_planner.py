@@ -0,0 +1,108 @@
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import open3d as o3d  # type: ignore
+import pytest
+from mvp import Model, Planner, Step
+from plugins.affine import affine
+from plugins.clear import clear
+from plugins.cut import cut
+from plugins.move import move
+from plugins.rotate import rotate
+
+
+PLUGINS: Dict[str, Callable[..., Any]] = {
+    "affine": affine,
+    "clear": clear,
+    "cut": cut,
+    "move": move,
+    "rotate": rotate,
+}
+
+
+# checking that valid configuration passes the validation
+def test_validate_accepts_valid_steps() -> None:
+    planner = Planner(Model().operation_info)
+
+    steps = planner.plan(
+        {
+            "src": "missing.ply",
+            "dest": "",
+            "operations": [1, 2],
+            1: {"type": "rotate", "mode": "Degree", "x": 0, "y": 0.0, "z": 90.0},
+            2: {"type": "move", "x": 1.0, "y": 0.0, "z": 0.0},
+        }
+    )
+
+    planner.validate(steps)
+
+
+# checking that unknown operations, parameters and wrong types are rejected before execution
+@pytest.mark.parametrize(
+    "step",
+    [
+        Step("unknown", {}),
+        Step("move", {"x": 1.0, "y": 0.0}),
+        Step("move", {"x": 1.0, "y": 0.0, "z": 0.0, "w": 0.0}),
+        Step("move", {"x": True, "y": 0.0, "z": 0.0}),
+        Step("rotate", {"mode": 1, "x": 0.0, "y": 0.0, "z": 0.0}),
+    ],
+)
+def test_validate_rejects_invalid_steps(step: Step) -> None:
+    with pytest.raises(ValueError):
+        Planner(Model().operation_info).validate([step])
+
+
+def clear_step(above: bool, below: bool) -> Step:
+    return Step("clear", {"height": 1.5, "above": above, "below": below})
+
+
+ROTATE = Step("rotate", {"mode": "Degree", "x": 30.0, "y": 45.0, "z": 90.0})
+MOVE = Step("move", {"x": 1.0, "y": -2.0, "z": 0.7})
+CUT = Step("cut", {"ul": True, "ur": False, "ll": False, "lr": True, "size": 0.25})
+
+
+# checking that filters are moved ahead of translations only when the result stays exactly the same
+@pytest.mark.parametrize(
+    "steps, order",
+    [
+        ([ROTATE, MOVE, clear_step(True, False)], ["rotate", "clear", "move"]),
+        ([MOVE, clear_step(False, True)], ["clear", "move"]),
+        ([MOVE, clear_step(True, True)], ["move", "clear"]),
+        ([ROTATE, clear_step(False, True)], ["rotate", "clear"]),
+        ([MOVE, CUT], ["move", "cut"]),
+        ([Step("move", {"x": 0.0, "y": 0.0, "z": 0.7}), CUT], ["cut", "move"]),
+    ],
+)
+def test_pushdown_is_exact(
+    make_cloud: Callable[..., Any], steps: List[Step], order: List[str]
+) -> None:
+    # heights within a few ulps of the height the clear threshold maps to.
+    points = np.asarray(make_cloud().points)
+    points[:100, 2] = 0.8 + np.arange(-50, 50) * np.spacing(0.8)
+    points[100:200, 2] = 1.5
+
+    optimized = Planner(Model().operation_info).optimize(steps)
+    assert [step.operation for step in optimized] == order
+
+    expected = make_cloud(points)
+    for step in steps:
+        expected = PLUGINS[step.operation](expected, **step.parameters)
+
+    result = make_cloud(points)
+    for step in optimized:
+        result = PLUGINS[step.operation](result, **step.parameters)
+
+    assert 0 < len(result.points)
+    assert np.array_equal(np.asarray(result.points), np.asarray(expected.points))
+
+
+# checking that a height index of the shifted points is not passed ahead of the shift
+def test_pull_back_drops_index() -> None:
+    step = Step("clear", {**clear_step(True, False).parameters, "index": object()})
+    matrix = np.identity(4)
+    matrix[2, 3] = 0.7
+
+    moved = Planner.pull_back(step, matrix)
+
+    assert moved is not None and "index" not in moved.parameters
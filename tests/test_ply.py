@@ -0,0 +1,62 @@
+from pathlib import Path
+from typing import Any, Callable
+
+import os
+
+import numpy as np
+import open3d as o3d  # type: ignore
+import pytest
+from managers import AsyncWriter, FileManager, PlyVertices
+
+
+# checking that the memory-mapped reader exposes the same data as Open3D without copying it
+def test_memmap_matches_open3d(make_cloud: Callable[..., Any], tmp_path: Path) -> None:
+    path = str(tmp_path / "cloud.ply")
+    o3d.io.write_point_cloud(path, make_cloud(normals=True, colors=True))
+
+    expected = o3d.io.read_point_cloud(path)
+    vertices: PlyVertices = FileManager().read(path, "ply_memmap")
+
+    assert len(vertices) == 1000
+    assert np.shares_memory(vertices.points, vertices.array)
+    assert np.array_equal(vertices.points, np.asarray(expected.points))
+    assert vertices.normals is not None
+    assert np.array_equal(vertices.normals, np.asarray(expected.normals))
+    assert vertices.colors is not None and vertices.colors.dtype == np.uint8
+    assert np.allclose(
+        np.asarray(vertices.to_point_cloud().colors), np.asarray(expected.colors)
+    )
+
+
+# checking that the native writer produces files readable by Open3D
+def test_binary_writer_round_trip(
+    make_cloud: Callable[..., Any], tmp_path: Path
+) -> None:
+    path = str(tmp_path / "cloud.ply")
+    cloud = make_cloud(normals=True, colors=True)
+
+    FileManager().write(path, cloud, "ply_memmap")
+
+    result = o3d.io.read_point_cloud(path)
+    assert np.array_equal(np.asarray(result.points), np.asarray(cloud.points))
+    assert np.allclose(np.asarray(result.colors), np.asarray(cloud.colors), atol=0.01)
+
+
+# checking that a failed background write leaves neither the target nor a temporary file and raises on flush
+def test_async_writer_is_atomic(make_cloud: Callable[..., Any], tmp_path: Path) -> None:
+    target = tmp_path / "cloud.ply"
+    target.write_bytes(b"previous")
+
+    with AsyncWriter() as writer:
+        written = writer.submit(
+            str(tmp_path / "other.ply"), make_cloud(colors=True), "ply_memmap"
+        )
+        failed = writer.submit(str(target), "not a cloud", "ply_memmap")
+
+        with pytest.raises(AttributeError):
+            writer.flush()
+
+    assert written.exception() is None
+    assert failed.exception() is not None
+    assert target.read_bytes() == b"previous"
+    assert sorted(os.listdir(tmp_path)) == ["cloud.ply", "other.ply"]
@@ -0,0 +1,74 @@
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import open3d as o3d  # type: ignore
+from managers import Profiler
+from mvp import Model
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+SHIFT: Dict[str, Any] = {"x": 1.0, "y": 0.0, "z": 0.0}
+
+
+# checking that plugin invocations and file reads are recorded and exported only while profiling is enabled
+def test_profiler_records(make_cloud: Callable[..., Any], tmp_path: Path) -> None:
+    path = str(tmp_path / "cloud.ply")
+    o3d.io.write_point_cloud(path, make_cloud(100))
+
+    profiler = Profiler()
+    profiler.reset()
+
+    try:
+        Model().load_data(path)
+        assert profiler.records() == []
+
+        profiler.enable()
+        Model().task("move", **SHIFT)
+    finally:
+        profiler.disable()
+
+    Model().task("move", **SHIFT)
+
+    summary = {
+        (entry["category"], entry["name"]): entry
+        for entry in profiler.summary()["operations"]
+    }
+    assert set(summary) == {("plugin", "move")}
+    assert summary["plugin", "move"]["calls"] == 1
+    assert summary["plugin", "move"]["points_in"] == 100
+    assert summary["plugin", "move"]["points_out"] == 100
+
+    events = profiler.trace()["traceEvents"]
+    assert [event["cat"] for event in events] == ["plugin"]
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+
+    profiler.reset()
+
+
+# checking that the lazy import of the parser modules is recorded on its own, not as a part of the first read
+def test_profiler_records_imports(
+    make_cloud: Callable[..., Any], tmp_path: Path
+) -> None:
+    path = str(tmp_path / "cloud.ply")
+    o3d.io.write_point_cloud(path, make_cloud(100))
+
+    script = (
+        "from managers import FileManager, Profiler\n"
+        "Profiler().enable()\n"
+        f"FileManager().read({path!r})\n"
+        "print([(record.category, record.name) for record in Profiler().records()])\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert output.strip() == str(
+        [("import", "numpy"), ("import", "open3d"), ("io", "read ply")]
+    )
@@ -0,0 +1,82 @@
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from managers import FileManager, PluginRegistry
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class Target:
+    def __init__(self) -> None:
+        self.results: List[Any] = []
+
+    def receive(self, result: Any) -> None:
+        self.results.append(result)
+
+
+# checking that the manifest lists every plugin module shipped in the plugins package
+def test_manifest_lists_plugins() -> None:
+    directory = Path(__file__).resolve().parents[1] / "plugins"
+    manifest = FileManager().read(str(directory / "manifest.yml"))
+    modules = {path.stem for path in directory.glob("*.py")} - {"__init__"}
+
+    assert set(manifest["plugins"]) == modules
+
+
+# checking that discovered plugins are imported only on first use
+def test_discover_imports_on_first_use(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    package = tmp_path / "lazy_plugins"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "manifest.yml").write_text("plugins:\n  - double\n")
+    (package / "double.py").write_text(
+        'TAGS = ["pointwise"]\n\n\ndef double(value):\n    return value * 2\n'
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    registry = PluginRegistry()
+    registry.discover("lazy_plugins")
+    target = Target()
+    registry.set_target(target)  # type: ignore
+
+    assert registry.supported_plugins() == ["double"]
+    assert "lazy_plugins.double" not in sys.modules
+
+    registry.invoke("double", value=21)  # type: ignore
+
+    assert "lazy_plugins.double" in sys.modules
+    assert target.results == [42]
+    assert registry.get_info("double").tags == frozenset({"pointwise"})
+
+
+# checking that the CLI and the Model import no plugin module of the real package until its plugin is used
+def test_plugins_imported_on_first_use() -> None:
+    script = (
+        "import sys\n"
+        "from CLI import Cli\n"
+        "from mvp import Model\n"
+        "def loaded():\n"
+        "    return sorted(name for name in sys.modules if name.startswith('plugins.'))\n"
+        "Cli.create_cli()\n"
+        "Model().supported_operations()\n"
+        "print(loaded())\n"
+        "Model().operation_info('move')\n"
+        "print(loaded())\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    startup, used = result.stdout.splitlines()
+
+    assert startup == str([])
+    assert used == str(["plugins.move"])
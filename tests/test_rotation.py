@@ -2,7 +2,9 @@ import numpy as np
 from numpy.typing import NDArray
 import open3d as o3d  # type: ignore
 import math
-from plugins import rotate
+from typing import Any, Callable
+from plugins.rotate import rotate
+from plugins.rotate import rotate_poses
 
 # checking the rotation for an angle in radians
 def test_rotate_ply_file_rotates_radians() -> None:
@@ -87,3 +89,22 @@ def test_rotate_ply_file_rotates_y_270_5() -> None:
     )
     rotated_np: NDArray[np.float_] = np.asarray(rotated_cloud.points)
     assert np.array_equal(np.round(rotated_np), np.round(expected_result))
+
+
+# checking that batched rotation matches rotating a copy of the cloud per orientation
+def test_rotate_poses_matches_rotate(make_cloud: Callable[..., Any]) -> None:
+    cloud = make_cloud(100, normals=True, colors=True)
+    source = np.asarray(cloud.points).copy()
+    angles = [(0.0, 0.0, 90.0), (30.0, 45.0, 60.0), (270.5, -10.0, 0.0)]
+
+    results = rotate_poses(cloud, "Degree", angles)
+
+    assert len(results) == len(angles)
+    assert np.array_equal(np.asarray(cloud.points), source)
+
+    for result, (x, y, z) in zip(results, angles):
+        expected = rotate(o3d.geometry.PointCloud(cloud), "Degree", x, y, z)
+
+        assert np.allclose(np.asarray(result.points), np.asarray(expected.points))
+        assert np.allclose(np.asarray(result.normals), np.asarray(expected.normals))
+        assert np.array_equal(np.asarray(result.colors), np.asarray(cloud.colors))
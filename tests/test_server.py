@@ -0,0 +1,64 @@
+from pathlib import Path
+from threading import Thread
+from time import sleep
+from typing import Any, Callable
+
+import numpy as np
+from managers import CloudCache, FileManager
+from mvp import Server, send
+
+
+# checking that the least recently used clouds are evicted to keep the budget, and copies are handed out
+def test_cloud_cache_lru(make_cloud: Callable[..., Any], tmp_path: Path) -> None:
+    paths = [str(tmp_path / f"{name}.ply") for name in "abc"]
+
+    for path in paths:
+        FileManager().write(path, make_cloud(100, 0, 1))
+
+    cache = CloudCache(budget=2 * 100 * 24)
+    first = cache.load(paths[0])
+    first.translate((1.0, 0.0, 0.0))
+    cache.load(paths[1])
+    cache.load(paths[0])
+    cache.load(paths[2])
+
+    stats = cache.stats()
+    assert [Path(path).name for path in stats["clouds"]] == ["a.ply", "c.ply"]
+    assert stats["hits"] == 1 and stats["misses"] == 3
+    assert np.asarray(cache.load(paths[0]).points).max() < 1.0
+
+
+# checking that jobs sent to the socket are run on the resident cloud and their errors are reported
+def test_server_jobs(make_cloud: Callable[..., Any], tmp_path: Path) -> None:
+    source = str(tmp_path / "cloud.ply")
+    destination = str(tmp_path / "result.ply")
+    socket = str(tmp_path / "server.sock")
+    FileManager().write(source, make_cloud(100, 0, 1))
+
+    server = Thread(target=Server(socket, workers=2).serve)
+    server.start()
+
+    while not Path(socket).exists():
+        sleep(0.01)
+
+    job = {
+        "src": source,
+        "dest": destination,
+        "operations": [1],
+        "1": {"type": "clear", "height": 0.5, "above": True, "below": False},
+    }
+
+    try:
+        answers = [send(socket, job) for _ in range(2)]
+        failed = send(socket, {**job, "1": {"type": "clear", "height": "high"}})
+        stats = send(socket, {"command": "status"})
+    finally:
+        send(socket, {"command": "shutdown"})
+        server.join()
+
+    result = FileManager().read(destination)
+    assert answers[0]["points"] == answers[1]["points"] == len(result.points) < 100
+    assert np.asarray(result.points)[:, 2].max() <= 0.5
+    assert failed["status"] == "error"
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert not Path(socket).exists()
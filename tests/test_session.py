@@ -0,0 +1,92 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import active_count
+from time import sleep
+from typing import Any, Callable, List
+
+import numpy as np
+import open3d as o3d  # type: ignore
+from framework import EmbedSingleton, Session
+from mvp import Model, Step
+
+
+class Slow(metaclass=EmbedSingleton):
+    created: List[int] = []
+
+    def __init__(self) -> None:
+        sleep(0.05)
+        Slow.created.append(1)
+
+
+# checking that concurrent first calls of a singleton share a single instance
+def test_singleton_thread_safe() -> None:
+    with ThreadPoolExecutor(8) as pool:
+        instances = list(pool.map(lambda _: Slow(), range(8)))
+
+    assert len(Slow.created) == 1
+    assert all(instance is instances[0] for instance in instances)
+
+
+# checking that pipelines of different sessions run concurrently without affecting each other
+def test_sessions_isolate_models(
+    make_cloud: Callable[..., Any], tmp_path: Path
+) -> None:
+    paths = []
+
+    for number in range(4):
+        cloud = make_cloud(np.full((10 * (number + 1), 3), 1.0))
+        paths.append(str(tmp_path / f"cloud_{number}.ply"))
+        o3d.io.write_point_cloud(paths[-1], cloud)
+
+    def pipeline(path: str, shift: float) -> o3d.geometry.PointCloud:
+        Model().load_data(path)
+        Model().execute_tasks([Step("move", {"x": shift, "y": 0.0, "z": 0.0})])
+
+        return Model().data
+
+    global_model = Model()
+
+    with ThreadPoolExecutor(4) as pool:
+        futures = [
+            pool.submit(Session().run, pipeline, path, float(number))
+            for number, path in enumerate(paths)
+        ]
+        results = [future.result() for future in futures]
+
+    for number, result in enumerate(results):
+        assert len(result.points) == 10 * (number + 1)
+        assert np.allclose(np.asarray(result.points)[:, 0], 1.0 + number)
+
+    assert Model() is global_model
+
+    with Session() as session:
+        assert Model() is not global_model
+        assert session.instances[type(Model())] is Model()
+
+
+# checking that exiting a session closes its model, so no writer thread is left behind
+def test_session_exit_stops_writer(
+    make_cloud: Callable[..., Any], tmp_path: Path
+) -> None:
+    source = str(tmp_path / "cloud.ply")
+    o3d.io.write_point_cloud(source, make_cloud(100))
+    threads = active_count()
+
+    for number in range(4):
+        with Session():
+            Model().load_data(source)
+            Model().save_data(str(tmp_path / f"saved_{number}.ply"))
+
+        assert (tmp_path / f"saved_{number}.ply").exists()
+
+    assert active_count() == threads
+
+    session = Session()
+
+    with session:
+        with Session():
+            assert Session.current() is not session
+
+        assert Session.current() is session
+
+    assert Session.current() is None
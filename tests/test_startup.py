@@ -0,0 +1,62 @@
+import subprocess
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import List
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# the CLI may take this much longer to start than a bare interpreter.
+STARTUP_OVERHEAD = 0.2
+
+
+def best_time(arguments: List[str], directory: Path) -> float:
+
+    """
+    Runs the interpreter with the given arguments three times.
+
+    :return: best wall time in seconds.
+    """
+
+    timings = []
+
+    for _ in range(3):
+        start = perf_counter()
+        subprocess.run(
+            [sys.executable, *arguments], cwd=directory, capture_output=True, check=True
+        )
+        timings.append(perf_counter() - start)
+
+    return min(timings)
+
+
+# checking that a light command starts well under 200 ms above a bare interpreter, without Open3D, numpy or plugins
+def test_startup_defers_heavy_imports(tmp_path: Path) -> None:
+    command = [str(ROOT), "setup", "--path", "config.yml", "move"]
+
+    baseline = best_time(["-c", "pass"], tmp_path)
+    seconds = best_time(command, tmp_path)
+
+    # -X importtime reports every module imported on stderr as "import time: self | cumulative | name".
+    report = subprocess.run(
+        [sys.executable, "-X", "importtime", *command],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    modules = {
+        line.split("|")[-1].strip()
+        for line in report.splitlines()
+        if line.startswith("import time:")
+    }
+
+    assert (tmp_path / "config.yml").exists()
+    assert "mvp" in modules
+    assert seconds - baseline < STARTUP_OVERHEAD
+    assert not {
+        name
+        for name in modules
+        if name.split(".")[0] in ("open3d", "numpy") or name.startswith("plugins.")
+    }
@@ -0,0 +1,60 @@
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import open3d as o3d  # type: ignore
+import pytest
+from managers import FileManager, LasPoints
+from mvp import Model, Step
+from plugins.move import move
+from plugins.rotate import rotate
+
+
+STEPS = [
+    Step("rotate", {"mode": "Degree", "x": 30.0, "y": 0.0, "z": 90.0}),
+    Step("move", {"x": 1.0, "y": -2.0, "z": 3.0}),
+]
+
+
+# checking that chunked execution produces the same cloud as the in-memory one
+def test_stream_matches_in_memory(
+    make_cloud: Callable[..., Any], tmp_path: Path
+) -> None:
+    cloud = make_cloud(2500, colors=True)
+
+    source = str(tmp_path / "source.ply")
+    destination = str(tmp_path / "out" / "result.ply")
+    o3d.io.write_point_cloud(source, cloud)
+
+    Model().stream_tasks(source, destination, STEPS, chunk_size=1000)
+
+    expected = move(rotate(cloud, "Degree", 30.0, 0.0, 90.0), 1.0, -2.0, 3.0)
+    result = o3d.io.read_point_cloud(destination)
+
+    assert len(result.points) == 2500
+    assert np.allclose(np.asarray(result.points), np.asarray(expected.points))
+    assert np.allclose(
+        np.asarray(result.colors), np.asarray(expected.colors), atol=0.01
+    )
+
+
+# checking that the destination format picks the writer, and unsupported formats are rejected before processing
+def test_stream_writes_las(make_cloud: Callable[..., Any], tmp_path: Path) -> None:
+    cloud = make_cloud(2500, 0, 100, colors=True).translate((512_000.0, 0.0, 0.0))
+    source = str(tmp_path / "source.ply")
+    destination = str(tmp_path / "result.las")
+    o3d.io.write_point_cloud(source, cloud)
+
+    Model().stream_tasks(source, destination, STEPS[1:], chunk_size=1000)
+
+    records: LasPoints = FileManager().read(destination, "las_memmap")
+    expected = np.asarray(cloud.points) + [1.0, -2.0, 3.0]
+
+    assert len(records) == 2500
+    assert np.abs(records.coordinates() - expected).max() <= 0.0005 + 1e-9
+    assert np.allclose(records.bounds()[0], expected.min(axis=0), atol=1e-3)
+
+    with pytest.raises(ValueError):
+        Model().stream_tasks(source, str(tmp_path / "result.xyz"), STEPS, 1000)
+
+    assert not (tmp_path / "result.xyz").exists()
@@ -0,0 +1,176 @@
+import struct
+import subprocess
+import sys
+import zlib
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+import pytest
+from managers import FileManager, TiffImage
+from plugins.mount import mount
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def make_tiff(
+    path: Path,
+    image: NDArray[Any],
+    tile: Optional[Tuple[int, int]] = None,
+    rows_per_strip: int = 3,
+    deflate: bool = False,
+    order: str = "<",
+) -> None:
+    # writes a minimal GeoTIFF: world (x, y) = (10 + column * 0.5, 20 - row * 0.5).
+    height, width, samples = image.shape
+    image = image.astype(np.dtype(order + image.dtype.str[1:]))
+
+    if tile is None:
+        chunks = [
+            image[row : row + rows_per_strip]
+            for row in range(0, height, rows_per_strip)
+        ]
+    else:
+        padded = np.zeros(
+            (-(-height // tile[0]) * tile[0], -(-width // tile[1]) * tile[1], samples),
+            image.dtype,
+        )
+        padded[:height, :width] = image
+        chunks = [
+            padded[row : row + tile[0], column : column + tile[1]]
+            for row in range(0, padded.shape[0], tile[0])
+            for column in range(0, padded.shape[1], tile[1])
+        ]
+
+    if deflate:
+        encoded = [
+            np.concatenate((chunk[:, :1], np.diff(chunk, axis=1)), axis=1).astype(
+                image.dtype
+            )
+            for chunk in chunks
+        ]
+        blobs = [zlib.compress(chunk.tobytes()) for chunk in encoded]
+    else:
+        blobs = [chunk.tobytes() for chunk in chunks]
+
+    offsets = list(np.cumsum([8] + [len(blob) for blob in blobs])[:-1])
+    bits = image.dtype.itemsize * 8
+    tags: List[Tuple[int, int, List[Any]]] = [
+        (256, 4, [width]),
+        (257, 4, [height]),
+        (258, 3, [bits] * samples),
+        (259, 3, [8 if deflate else 1]),
+        (277, 3, [samples]),
+        (317, 3, [2 if deflate else 1]),
+        (33550, 12, [0.5, 0.5, 0.0]),
+        (33922, 12, [0.0, 0.0, 0.0, 10.0, 20.0, 0.0]),
+    ]
+
+    if tile is None:
+        tags += [
+            (273, 4, offsets),
+            (278, 4, [rows_per_strip]),
+            (279, 4, [len(blob) for blob in blobs]),
+        ]
+    else:
+        tags += [
+            (322, 4, [tile[1]]),
+            (323, 4, [tile[0]]),
+            (324, 4, offsets),
+            (325, 4, [len(blob) for blob in blobs]),
+        ]
+
+    formats = {3: "H", 4: "I", 12: "d"}
+    data = b"".join(blobs)
+    extra = b""
+    ifd_offset = 8 + len(data)
+    extra_offset = ifd_offset + 2 + 12 * len(tags) + 4
+    entries = b""
+
+    for tag, field, values in sorted(tags):
+        packed = struct.pack(f"{order}{len(values)}{formats[field]}", *values)
+
+        if len(packed) <= 4:
+            value = packed.ljust(4, b"\0")
+        else:
+            value = struct.pack(order + "I", extra_offset + len(extra))
+            extra += packed
+
+        entries += struct.pack(f"{order}HHI", tag, field, len(values)) + value
+
+    header = (b"II" if order == "<" else b"MM") + struct.pack(
+        order + "HI", 42, ifd_offset
+    )
+    ifd = struct.pack(order + "H", len(tags)) + entries + struct.pack(order + "I", 0)
+    path.write_bytes(header + data + ifd + extra)
+
+
+IMAGE = np.random.default_rng(0).integers(0, 65535, (11, 13, 3)).astype(np.uint16)
+
+
+# checking that windows of stripped/tiled, raw/deflated images match the source raster
+@pytest.mark.parametrize(
+    "tile, deflate, order",
+    [(None, False, "<"), (None, True, ">"), ((4, 8), False, ">"), ((4, 8), True, "<")],
+)
+def test_tiff_window(
+    tmp_path: Path, tile: Optional[Tuple[int, int]], deflate: bool, order: str
+) -> None:
+    path = tmp_path / "image.tiff"
+    make_tiff(path, IMAGE, tile=tile, deflate=deflate, order=order)
+    image = FileManager().read(str(path))
+
+    assert isinstance(image, TiffImage)
+    assert np.array_equal(image.window(0, 0, 13, 11), IMAGE)
+    assert np.array_equal(image.window(3, 2, 10, 9), IMAGE[2:9, 3:10])
+    assert np.array_equal(image.window(-5, 7, 50, 8), IMAGE[7:8])
+
+
+# checking that mount colours the points by bilinear interpolation at their georeferenced position
+def test_mount_colours(make_cloud: Callable[..., Any], tmp_path: Path) -> None:
+    rows, columns = np.mgrid[0:11, 0:13]
+    image = np.stack((columns * 20, rows * 20, np.full_like(rows, 255)), axis=-1)
+    path = tmp_path / "image.tif"
+    make_tiff(path, image.astype(np.uint8), tile=(16, 16), deflate=True)
+
+    cloud = make_cloud([[11.0, 18.0, 0.0], [12.3, 17.1, 5.0], [100.0, 100.0, 0.0]])
+
+    result = np.asarray(mount(cloud, str(path)).colors)
+
+    # pixel centres are at halves: (x, y) = (11, 18) is column 2, row 4, i.e. between the pixels 1.5 and 2.5.
+    assert np.allclose(result[0], [1.5 * 20 / 255, 3.5 * 20 / 255, 1.0])
+    assert np.allclose(
+        result[1], [(2.3 / 0.5 - 0.5) * 20 / 255, (2.9 / 0.5 - 0.5) * 20 / 255, 1.0]
+    )
+    assert np.allclose(result[2], 0.0)
+
+
+# checking that the template written by setup for mount runs as it is once its values are filled in
+def test_mount_setup_execute(make_cloud: Callable[..., Any], tmp_path: Path) -> None:
+    rows, columns = np.mgrid[0:11, 0:13]
+    image = np.stack((columns * 20, rows * 20, np.full_like(rows, 255)), axis=-1)
+    make_tiff(tmp_path / "image.tif", image.astype(np.uint8))
+    FileManager().write(str(tmp_path / "cloud.ply"), make_cloud([[11.0, 18.0, 0.0]]))
+
+    def run(command: str) -> None:
+        subprocess.run(
+            [sys.executable, str(ROOT), *command.split()], cwd=tmp_path, check=True
+        )
+
+    run("setup --path config.yml mount")
+
+    files = FileManager()
+    config = files.read(str(tmp_path / "config.yml"))
+    number = config["operations"][-1]
+    assert config[number] == {"type": "mount", "picture_path": ""}
+
+    config.update({"src": "cloud.ply", "dest": "result.ply"})
+    config[number]["picture_path"] = "image.tif"
+    files.write(str(tmp_path / "config.yml"), config)
+
+    run("execute config.yml")
+
+    colors = np.asarray(files.read(str(tmp_path / "result.ply")).colors)
+    assert np.allclose(colors[0], [1.5 * 20 / 255, 3.5 * 20 / 255, 1.0], atol=0.01)
@@ -0,0 +1,65 @@
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import open3d as o3d  # type: ignore
+import pytest
+from managers import CompactCloud
+from mvp import Model, Step
+from plugins.voxel import voxel
+
+
+# checking that every voxel is reduced to the centroid (or the first) of its points
+@pytest.mark.parametrize("mode", ["centroid", "first"])
+def test_voxel_reduces_voxels(make_cloud: Callable[..., Any], mode: str) -> None:
+    cloud = make_cloud(5000, normals=True, colors=True)
+    points = np.asarray(cloud.points)
+    result = voxel(cloud, 4.0, mode)
+
+    cells = np.floor(points / 4.0)
+    voxels, first, inverse = np.unique(
+        cells, axis=0, return_index=True, return_inverse=True
+    )
+    inverse = inverse.ravel()
+    expected = (
+        np.stack(
+            [points[inverse == index].mean(axis=0) for index in range(len(voxels))]
+        )
+        if mode == "centroid"
+        else points[first]
+    )
+
+    assert len(result.points) == len(voxels)
+    assert np.allclose(
+        np.sort(np.asarray(result.points), axis=0), np.sort(expected, axis=0)
+    )
+    assert np.allclose(np.linalg.norm(np.asarray(result.normals), axis=1), 1.0)
+
+    compact = voxel(CompactCloud.from_point_cloud(cloud), 4.0, mode)
+    assert isinstance(compact, CompactCloud) and len(compact) == len(voxels)
+
+
+# checking that streaming merges the voxels split between chunks into the same result
+@pytest.mark.parametrize("mode", ["centroid", "first"])
+def test_voxel_stream(
+    make_cloud: Callable[..., Any], tmp_path: Path, mode: str
+) -> None:
+    cloud = make_cloud(5000, normals=True, colors=True)
+    source = str(tmp_path / "source.ply")
+    destination = str(tmp_path / "result.ply")
+    o3d.io.write_point_cloud(source, cloud)
+
+    steps = [
+        Step("move", {"x": 1.0, "y": 0.0, "z": 0.0}),
+        Step("voxel", {"size": 2.0, "mode": mode}),
+    ]
+    Model().stream_tasks(source, destination, steps, chunk_size=700)
+
+    expected = voxel(cloud.translate((1.0, 0.0, 0.0)), 2.0, mode)
+    result = o3d.io.read_point_cloud(destination)
+
+    assert len(result.points) == len(expected.points) < 5000
+    assert np.allclose(np.asarray(result.points), np.asarray(expected.points))
+    assert np.allclose(
+        np.asarray(result.colors), np.asarray(expected.colors), atol=0.01
+    )